@@ -2,32 +2,83 @@
 
 # https://adventofcode.com/2021/day/1
 
+import os
+import sys
+from operator import gt
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.loader import Input
+
 def part1(depths):
     # Given a file, parse into a list of lines of depths
     # Count depths (after the 0th) higher than the one immediately before
     print("Part 1 result:")
-    print(num_increases(depths))
+    (increases,) = count_increases(depth_chunks(depths), (1,))
+    print(increases)
+    return increases
 
-def part2(depths):
-    window_sums = [sum(w) for w in sliding_window(depths, 3)]
+def part2(depths, size=3):
+    # Same again, for the sums of each `size` depths in a row
     print("Part 2 result:")
-    print(num_increases(window_sums))
+    (increases,) = count_increases(depth_chunks(depths), (size,))
+    print(increases)
+    return increases
+
+def count_increases(chunks, sizes=(1,)):
+    # How many times the sum of `size` depths in a row goes up, for each size, in one pass over chunks of depths.
+    # Each window's sum is the last one's plus the depth coming in, minus the one dropping out, so it goes up exactly
+    # when the new depth is bigger than the one `size` back. So all we need to carry over from one chunk to the next
+    # is its last max(sizes) depths, however big the windows or the input.
+    # (This used to zip `size` copies of the whole list together and sum every window.)
+    longest = max(sizes)
+    counts = [0] * len(sizes)
+    tail = []
+    for chunk in chunks:
+        depths = tail + chunk
+        for (k, size) in enumerate(sizes):
+            # Compare each new depth with the one `size` before it
+            start = max(size, len(tail))
+            counts[k] += sum(map(gt, depths[start:], depths[start - size:len(depths) - size]))
+        tail = depths[-longest:]
+    return counts
+
+def depth_chunks(data, chunk_size=1 << 20):
+    # Lists of depths, about a megabyte of the input at a time, from the (mapped) input or a binary stream like stdin
+    if isinstance(data, Input):
+        for chunk in data.chunks(chunk_size):
+            yield list(map(int, bytes(chunk).split()))
+        return
+    # Carry any part of a line at the end of a block over to the next one
+    rest = b""
+    while block := data.read(chunk_size):
+        block = rest + block
+        cut = block.rfind(b"\n") + 1
+        (block, rest) = (block[:cut], block[cut:])
+        yield list(map(int, block.split()))
+    yield list(map(int, rest.split()))
+
+# The depth logs can be far bigger than memory, so parse() doesn't read them at all.
+# Each part streams the depths out of the mapped file itself, in one pass.
+PARSE_MAPPED = True
 
-def num_increases(depths):
-    return sum(1 for (a, b) in zip(depths, depths[1:]) if b > a)
+def parse(data):
+    return (data,)
 
-def sliding_window(data, size=2):
-    iterables = [data[i:] for i in range(size)]
-    return zip(*iterables)
 
 # Command-line execution:
 if __name__ == "__main__":
-    import sys
     # Run like:
     # python d1.py input.txt
+    # python d1.py - 10 < huge.txt     (stdin, one pass, with a window of 10 for part 2)
     filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
-    depths = [int(d) for d in data.split()]
-    part2(depths)
\ No newline at end of file
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    if filename == "-":
+        # stdin can only be read once, so do both parts in the same pass
+        (increases, window_increases) = count_increases(depth_chunks(sys.stdin.buffer), (1, size))
+        print(f"Part 1 result:\n{increases}\n--------\nPart 2 result:\n{window_increases}")
+    else:
+        with Input.open(filename) as data:
+            (depths,) = parse(data)
+            part1(depths)
+            print("--------")
+            part2(depths, size)
@@ -2,54 +2,101 @@
 
 # https://adventofcode.com/2021/day/2
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from itertools import accumulate, repeat
+from operator import mul
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.loader import Input
+
+"""
+Both parts come out of the same summary of the commands: (pos, depth, aim), where depth is part 2's depth.
+Part 1's depth is just downs minus ups, which is part 2's aim.
+
+Summaries of two runs of commands combine in order: positions and aims add up, and every forward in the second
+run also goes down by the aim from the first run (second's depth + first's aim * second's forward distance).
+So a huge log can be split into pieces, each summarised on its own (in parallel), and the summaries combined
+at the end.
+"""
+
+# How far each n of a command goes forward, and changes the aim by. Unknown commands are skipped (they're 0 for both),
+# with a warning (once per chunk they turn up in).
+FORWARD = {b"forward": 1}
+AIM = {b"down": 1, b"up": -1}
+
 def part1(commands):
-    pos, depth = 0, 0
-    for (c, n) in commands:
-        match c:
-            case "forward":
-                pos += n
-            case "down":
-                depth += n
-            case "up":
-                depth -= n
-            case _:
-                print(f"Skipping unknown command: {(c, n)}")
+    (pos, _, aim) = summarise_input(commands)
     print("Part 1 result:")
-    print(pos * depth)
+    print(pos * aim)
+    return pos * aim
 
 def part2(commands):
-    pos, depth, aim = 0, 0, 0
-    for (c, n) in commands:
-        match c:
-            case "forward":
-                pos += n
-                depth += aim * n
-            case "down":
-                aim += n
-            case "up":
-                aim -= n
-            case _:
-                print(f"Skipping unknown command: {(c, n)}")
+    (pos, depth, _) = summarise_input(commands)
     print("Part 2 result:")
     print(pos * depth)
+    return pos * depth
+
+def summarise(chunk):
+    # (pos, depth, aim) after the commands in a chunk of the input (bytes), starting from (0, 0, 0).
+    # No Python loop per command: each step is over the whole chunk at once.
+    words = chunk.split()
+    (commands, ns) = (words[0::2], list(map(int, words[1::2])))
+    # Checking the chunk's set of commands is much cheaper than a check per command
+    for c in set(commands) - FORWARD.keys() - AIM.keys():
+        print(f"Skipping unknown command: {c.decode('utf-8', 'replace')!r} ({commands.count(c)} times)")
+    forwards = list(map(mul, map(FORWARD.get, commands, repeat(0)), ns))
+    # The aim after each command. Forwards don't change it, so that's the aim each forward goes down by.
+    aims = list(accumulate(map(mul, map(AIM.get, commands, repeat(0)), ns)))
+    return (sum(forwards), sum(map(mul, aims, forwards)), aims[-1] if aims else 0)
+
+def combine(first, second):
+    # The summary of first's commands followed by second's
+    (pos1, depth1, aim1) = first
+    (pos2, depth2, aim2) = second
+    return (pos1 + pos2, depth1 + depth2 + aim1 * pos2, aim1 + aim2)
+
+def summarise_input(data):
+    # One process, a chunk at a time
+    return reduce(combine, (summarise(bytes(chunk)) for chunk in data.chunks()), (0, 0, 0))
+
+def summarise_range(path, start, end):
+    # Runs in a worker process: map the file and summarise its bytes start:end
+    with Input.open(path) as data, data.piece(start, end) as piece:
+        return summarise_input(piece)
+
+def summarise_file(path, jobs=None):
+    # Split the file into a few pieces per process, summarise them in parallel, and combine the summaries in order
+    jobs = jobs or os.cpu_count()
+    with Input.open(path) as data:
+        ranges = data.ranges(jobs * 4)
+    if jobs == 1 or len(ranges) == 1:
+        return reduce(combine, (summarise_range(path, start, end) for (start, end) in ranges), (0, 0, 0))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        summaries = pool.map(summarise_range, [path] * len(ranges), *zip(*ranges))
+        return reduce(combine, summaries, (0, 0, 0))
+
+# The command logs can be far bigger than memory, so they're summarised straight out of the mapped file
+PARSE_MAPPED = True
 
-def parse_commands(lines):
-    commands = []
-    for l in lines:
-        # Don't get caught by the trailing newline
-        if l:
-            (c, n) = l.split(" ")
-            n = int(n)
-            commands.append((c, n))
-    return commands
+def parse(data):
+    return (data,)
 
 
 # Command-line execution:
 if __name__ == "__main__":
-    import sys
+    # Run like:
+    # python d2.py input.txt
+    # python d2.py huge.txt 8     (split over 8 processes)
     filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
-    commands = parse_commands(data.split("\n"))
-    part2(commands)
\ No newline at end of file
+    if len(sys.argv) > 2:
+        (pos, depth, aim) = summarise_file(filename, int(sys.argv[2]))
+        print(f"Part 1 result:\n{pos * aim}\n--------\nPart 2 result:\n{pos * depth}")
+    else:
+        with Input.open(filename) as data:
+            (commands,) = parse(data)
+            part1(commands)
+            print("--------")
+            part2(commands)
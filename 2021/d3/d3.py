@@ -2,9 +2,22 @@
 
 # https://adventofcode.com/2021/day/3
 
+from bisect import bisect_left
 from collections import Counter
 
 def part1(lines):
+    try:
+        (gamma, epsilon) = gamma_epsilon_array(lines)
+    except ImportError:
+        (gamma, epsilon) = gamma_epsilon(lines)
+
+    print("Part 1 result:")
+    print(f"gamma: {gamma}")
+    print(f"epsilon: {epsilon}")
+    print(f"Power consumption: {gamma * epsilon}")
+    return gamma * epsilon
+
+def gamma_epsilon(lines):
     groups = zip(*lines)
     gamma, epsilon = [], []
     for place in groups:
@@ -18,19 +31,39 @@ def part1(lines):
         epsilon.append(e)
     gamma = int("".join(gamma), 2)
     epsilon = int("".join(epsilon), 2)
+    return (gamma, epsilon)
 
-    print("Part 1 result:")
-    print(f"gamma: {gamma}")
-    print(f"epsilon: {epsilon}")
-    print(f"Power consumption: {gamma * epsilon}")
+def gamma_epsilon_array(lines):
+    # Same as gamma_epsilon, but counting the 1s in every column at once with numpy instead of a Counter per column.
+    # The bits are joined into one string of 0s and 1s before int(), so the report can be any number of bits wide.
+    import numpy as np
+    report = report_array(lines)
+    n = len(report)
+    ones = np.count_nonzero(report == ord("1"), axis=0)
+    # Ties go to whichever bit came first in the column (like Counter.most_common() does),
+    # and a column with only one bit in it has that bit as both the most and least common.
+    first = report[0] == ord("1")
+    most = np.where(2 * ones == n, first, 2 * ones > n)
+    least = np.where((ones == 0) | (ones == n), most, ~most)
+    gamma = int(np.where(most, b"1", b"0").tobytes(), 2)
+    epsilon = int(np.where(least, b"1", b"0").tobytes(), 2)
+    return (gamma, epsilon)
+
+def report_array(lines):
+    # The report as a 2-D array of characters (as uint8s), one row per line
+    import numpy as np
+    width = len(lines[0])
+    return np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8).reshape(len(lines), width)
 
 def part2(lines):
-    oxy = int(find_rating(lines, True), 2)
-    co2 = int(find_rating(lines, False), 2)
+    report = SortedReport(lines)
+    oxy = int(report.rating(True), 2)
+    co2 = int(report.rating(False), 2)
     print("Part 2 result:")
     print(f"Oxygen generator rating: {oxy}")
     print(f"CO2 scrubber rating: {co2}")
     print(f"Life support rating: {oxy * co2}")
+    return oxy * co2
     
 
 def most_and_least_common_e(es):
@@ -39,23 +72,42 @@ def most_and_least_common_e(es):
     counts = c.most_common() # note: returns tied elements in insertion-order (tie-breaker not done here!)
     return (counts[0], counts[-1])
 
-def find_rating(lines, oxy_mode=True):
-    # Find the oxygen generator rating or co2 scrubber rating from the given lines
-    bits = len(lines[0])
-    possibles = lines
-    tiebreaker = "1" if oxy_mode else "0"
-    for i in range(bits):
-        if len(possibles) <= 1:
-            break
-        ith_bits = (p[i] for p in possibles)
-        ((most, n1), (least, n2)) = most_and_least_common_e(ith_bits)
-        # Tie-breaker!
-        if n1 == n2 and tiebreaker in (most, least):
-            (most, least) = (tiebreaker, tiebreaker)
-        
-        bit_criteria = most if oxy_mode else least
-        possibles = [p for p in possibles if p[i] == bit_criteria]
-    return possibles[0]
+class SortedReport:
+    # The report sorted, which makes it a binary trie in disguise: the lines starting with any prefix are all next
+    # to each other, and within them the ones with a 0 next come before the ones with a 1. So a node is just a range
+    # of lines (its count is the range's length), and one bisect on the next bit splits it into its two children.
+    # Sorting is the only build step, and each rating is then one walk down the trie, instead of filtering the list
+    # and counting with a fresh Counter at every bit (which is what this used to do).
+    # Ask for as many ratings as you like from the same report.
+    def __init__(self, lines):
+        self.lines = sorted(lines)
+        self.width = len(self.lines[0])
+
+    def split(self, lo, hi, i):
+        # Where the lines in [lo, hi) (which all share their first i bits) go from a 0 to a 1 at bit i
+        return bisect_left(self.lines, "1", lo, hi, key=lambda line: line[i])
+
+    def rating(self, oxy_mode=True):
+        # Follow the most common bit (ties to 1) for oxygen, or the least common (ties to 0) for CO2,
+        # until there's only one line left (or only copies of one)
+        (lo, hi) = (0, len(self.lines))
+        for i in range(self.width):
+            if hi - lo <= 1:
+                break
+            mid = self.split(lo, hi, i)
+            (zeros, ones) = (mid - lo, hi - mid)
+            if oxy_mode:
+                take_ones = ones >= zeros
+            else:
+                # If every line left has the same bit here, that's the least common too
+                take_ones = zeros == 0 or 0 < ones < zeros
+            (lo, hi) = (mid, hi) if take_ones else (lo, mid)
+        return self.lines[lo]
+
+def parse(data):
+    # While the input is a list of binary numbers, it's more convenient just treat them as arbitrary strings at first
+    return (data.strip().split("\n"),)
+
 
 # Command-line execution:
 if __name__ == "__main__":
@@ -63,9 +115,7 @@ if __name__ == "__main__":
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
         data = f.read()
-    lines = data.strip().split("\n")
-
-    # While the input is a list of binary numbers, it's more convenient just treat them as arbitrary strings at first
+    
+    (lines,) = parse(data)
     part1(lines)
     part2(lines)
-    
\ No newline at end of file
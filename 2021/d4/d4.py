@@ -4,15 +4,10 @@
 
 def part1(ns, boards):
     # get the score of the board that wins first
-    winning_b = None
-    for n in ns:
-        for b in boards:
-            if b.call(n):
-                # This board just won!
-                winning_b = b
-                score = b.score(n)
-                break
-        if winning_b is not None: break
+    (first, _) = winners(ns, boards)
+    winning_b = first[1] if first and first[0] != NEVER else None
+    if winning_b is not None:
+        score = winning_b.score(ns[first[0]])
     
     print("Part 1 result:")
     if winning_b is not None:
@@ -22,30 +17,21 @@ def part1(ns, boards):
         print(score)
     else:
         print("No boards won?")
+        turns = call_turns(ns)
         for b in boards:
+            # Show every number that was called
+            b.mark(turns, len(ns) - 1)
             print("---- Boards: ----")
             b.pprint_checked()
+    return score if winning_b is not None else None
 
 def part2(ns, boards):
     # get the score of the board that wins last
-    remaining_bs = boards
-    final_b = None
-    for n in ns:
-        # print(f"Calling {n}")
-        for b in remaining_bs:
-            next_bs = remaining_bs[:]
-            if b.call(n):
-                # This board just won!
-                if len(next_bs) <= 1:
-                    # print(f"Final n: {n}")
-                    final_b = b
-                    score = b.score(n)
-                    break
-                else:
-                    next_bs.remove(b)
-            remaining_bs = next_bs # Hack so we're not iterating over and removing from remaining_bs at the same time 
-        if final_b:
-            break
+    (_, last) = winners(ns, boards)
+    # If any board never wins, there's no last one
+    final_b = last[1] if last and last[0] != NEVER else None
+    if final_b:
+        score = final_b.score(ns[last[0]])
     
     print("Part 2 result:")
     if final_b:
@@ -55,41 +41,72 @@ def part2(ns, boards):
         print(score)
     else:
         print("Maybe a tie?")
+        turns = call_turns(ns)
         for b in boards:
+            b.mark(turns, len(ns) - 1)
             print("---- Boards: ----")
             b.pprint_checked()
+    return score if final_b else None
+
+# The turn a board that never wins "wins" on
+NEVER = float("inf")
+
+def call_turns(ns):
+    # {number: the turn it's called on}. A number that's called twice counts from the first time.
+    turns = {}
+    for (turn, n) in enumerate(ns):
+        turns.setdefault(n, turn)
+    return turns
+
+def winners(ns, boards):
+    # ((turn, board) for the board that wins first, (turn, board) for the one that wins last), with the boards
+    # marked as they were when they won. Ties go to the first board for the first winner and the last board
+    # for the last winner.
+    # Rather than calling each number on every board (and copying the list of boards left every time one won),
+    # each board works out the turn it'll win on from the call turns, so it's one pass over every cell.
+    turns = call_turns(ns)
+    (first, last) = (None, None)
+    for b in boards:
+        turn = b.win_turn(turns)
+        if first is None or turn < first[0]:
+            first = (turn, b)
+        if last is None or turn >= last[0]:
+            last = (turn, b)
+    for found in (first, last):
+        # (A board that never wins would get every number checked off, called or not)
+        if found is not None and found[0] != NEVER:
+            found[1].mark(turns, found[0])
+    return (first, last)
     
 class Board:
     """A 5x5 bingo board"""
     def __init__(self, grid):
-        # Each cell stores the number and whether it's been checked
-        self.ns = set(e for line in grid for e in line)
-        self.grid = [[(n, False) for n in line] for line in grid]
+        # The numbers, and the set of them that have been checked.
+        # (Cells used to be (number, checked) pairs, but with 10^5 boards that's millions of tuples for nothing:
+        # only the boards that win ever get checked off.)
+        self.grid = grid
+        self.checked = set()
     
     @staticmethod
     def parse_board(lines):
         # Given some lines of whitespace-separated sudoku numbers, make a 5x5 board
         return Board(Helpers.line2grid(lines.strip().split()))
     
-    def call(self, e):
-        # A number was called, is it in our grid?
-        # If it was, check whether we just won!
-        if e in self.ns:
-            l = len(self.grid)
-            for i in range(l):
-                for j in range(l):
-                    (n, c) = self.grid[i][j]
-                    if e == n:
-                        self.grid[i][j] = (n, True)
-                        if self.check_win(self.grid[i]) or self.check_win(self.col(j)):
-                            return True
-        return False
+    def win_turn(self, turns):
+        # The turn this board wins on, given the turn each number's called on: a row or column is done on the turn
+        # its last number's called, and the board wins when its first line is done
+        called = [[turns.get(n, NEVER) for n in line] for line in self.grid]
+        return min(min(map(max, called)), min(map(max, zip(*called))))
+
+    def mark(self, turns, turn):
+        # Check off every number called up to and including the given turn
+        self.checked = {n for line in self.grid for n in line if turns.get(n, NEVER) <= turn}
 
     def check_any_win(self):
         return any(self.check_win(line) for line in self.grid) or any(self.check_win(line) for line in self.cols())
 
     def check_win(self, line):
-        return all(c for (n, c) in line)
+        return all(n in self.checked for n in line)
 
     def cols(self):
         return (self.col(i) for i in range(len(self.grid)))
@@ -99,15 +116,15 @@ class Board:
     
     def score(self, winning_n):
         # Score = (sum of unmarked numbers) * (the number that was just called when the board won)
-        return sum(int(n) for line in self.grid for (n, c) in line if not c) * int(winning_n)
+        return sum(int(n) for line in self.grid for n in line if n not in self.checked) * int(winning_n)
 
     def pprint(self):
         for line in self.grid:
-            print(" ".join(n for (n, c) in line))
+            print(" ".join(line))
 
     def pprint_checked(self):
         for line in self.grid:
-            print(" ".join(f"{n}{'!' if c else ''}" for (n, c) in line))
+            print(" ".join(f"{n}{'!' if n in self.checked else ''}" for n in line))
 
 class Helpers:
     """Helper functions taken wholesale from a sudoku-solver doodle"""
@@ -124,19 +141,26 @@ class Helpers:
         return (grid[row][col] for row in range(len(grid)))
 
 
+def parse(data):
+    (calls, rest) = data.strip().split("\n", 1)
+    ns = calls.split(",")
+    # Every board is 25 numbers in a row, so split them all at once rather than board by board
+    cells = rest.split()
+    boards = [Board(Helpers.line2grid(cells[i:i+25])) for i in range(0, len(cells), 25)]
+    return (ns, boards)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
         data = f.read()
-    lines = data.strip().split("\n")
-    ns = lines[0].split(",")
+    
+    (ns, boards) = parse(data)
     # print("---- Numbers: ----")
     # print(ns)
     # print("---- Boards: ----")
-    boards = [Board.parse_board(" ".join(lines[i:i+6])) for i in range(1, len(lines), 6)]
-    
     """for b in boards:
         b.pprint_checked()
         print("--------")
@@ -145,4 +169,3 @@ if __name__ == "__main__":
     part1(ns, boards)
     print("--------")
     part2(ns, boards)
-    
\ No newline at end of file
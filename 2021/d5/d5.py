@@ -9,12 +9,14 @@ def part1(vents):
     overlaps = count_vent_overlaps(vents, False)
     print("Part 1 result:")
     print(f"Number of vent overlaps: {overlaps}")
+    return overlaps
     
     
 def part2(vents):
     overlaps = count_vent_overlaps(vents, True)
     print("Part 2 result:")
     print(f"Number of vent overlaps: {overlaps}")
+    return overlaps
 
 def count_vent_overlaps(vents, count_diags=False):
     # This really isn't clean or clear, but it works enough for this puzzle.
@@ -59,6 +61,11 @@ def parse_vents(lines):
             out.append(m.groups())
     return out
 
+def parse(data):
+    lines = data.strip().split("\n")
+    return (parse_vents(lines),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -66,10 +73,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    vents = parse_vents(lines)
+    (vents,) = parse(data)
 
     part1(vents)
     print("--------")
     part2(vents)
-    
\ No newline at end of file
@@ -2,10 +2,18 @@
 
 # https://adventofcode.com/2022/day/1
 
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.loader import Input
+
 def part1(elves):
     print("Part 1 result:")
     print("The elf carrying the most calories is carrying:")
-    print(max(sum(pack) for pack in elves))
+    most = max(sum(pack) for pack in elves)
+    print(most)
+    return most
     
     
 def part2(elves):
@@ -13,17 +21,22 @@ def part2(elves):
     print("Part 2 result:")
     print(f"Top three: {totals[:3]}")
     print(f"Total cals by top 3: {sum(totals[:3])}")
+    return sum(totals[:3])
+
+# Read straight from the mapped file, a pack (block of lines) at a time, so we never hold a copy of the input
+PARSE_MAPPED = True
+
+def parse(data):
+    elves = [[int(n) for n in pack] for pack in data.blocks()]
+    return (elves,)
+
 
 # Command-line execution:
 if __name__ == "__main__":
-    import sys
     filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
-    elves = [[int(n) for n in pack.split()] for pack in data.strip().split("\n\n")]
+    with Input.open(filename) as data:
+        (elves,) = parse(data)
 
     part1(elves)
     print("--------")
     part2(elves)
-    
\ No newline at end of file
@@ -31,16 +31,20 @@ def part1(instructions):
         i += 1
     print("Part 1 result:")
     print(f"Signal strength sum: {signal_strength}")
+    return signal_strength
     
 def part2(instructions, crt_width=40, crt_height=6):
     x = 1
     pending_op = None
     ops = iter(instructions)
+    screen = []
 
     for h in range(crt_height):
         for w in range(crt_width):
             # Draw a pixel during each cycle
-            print("#" if (x - 1 <= w) and (w <= x + 1) else ".", end="")
+            pixel = "#" if (x - 1 <= w) and (w <= x + 1) else "."
+            print(pixel, end="")
+            screen.append(pixel)
 
             # The instruction finishes execution after the cycle
             if pending_op is not None:
@@ -56,8 +60,14 @@ def part2(instructions, crt_width=40, crt_height=6):
                     n = int(n)
                     pending_op = ("addx", n)
         print("") # Next line of the picture!
+        screen.append("\n")
 
     print("Part 2 result: ^")
+    return "".join(screen)
+
+
+def parse(data):
+    return (data.strip().split("\n"),)
 
 
 # Command-line execution:
@@ -67,9 +77,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    instructions = data.strip().split("\n")
-    
+    (instructions,) = parse(data)
+
     part1(instructions)
     print("--------")
     part2(instructions)
-    
\ No newline at end of file
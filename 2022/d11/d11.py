@@ -18,6 +18,7 @@ def part1(monkeys):
     inspections = sorted((m.n_inspected for m in monkeys), reverse=True)
     monkey_business = inspections[0] * inspections[1]
     print(f"Monkey business after 20 rounds: {monkey_business}")
+    return monkey_business
     
 def part2(monkeys, rounds=10000):
     tests = [m.test_value for m in monkeys]
@@ -42,6 +43,7 @@ def part2(monkeys, rounds=10000):
     print(inspections)
     monkey_business = inspections[0] * inspections[1]
     print(f"Monkey business after {rounds} rounds: {monkey_business}")
+    return monkey_business
 
 
 def pprint_monkeys(monkeys):
@@ -98,6 +100,11 @@ def parse_monkey(data):
     return Monkey(items, monkey_op, test_val, target_true, target_false)
 
 
+def parse(data):
+    monkey_data = data.strip().split("\n\n")
+    return ([parse_monkey(m) for m in monkey_data],)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -105,14 +112,10 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    monkey_data = data.strip().split("\n\n")
-    # This isn't great, but eh.
-    def monkeys(m_data):
-        return [parse_monkey(m) for m in m_data]
-    
     # Note: Once again, my original answer ended up mutating the list in part 1 before passing it to part 2.
     # Please stop doing that.
-    part1(monkeys(monkey_data))
+    (monkeys,) = parse(data)
+    part1(monkeys)
     print("--------")
-    part2(monkeys(monkey_data), 10000)
-    
\ No newline at end of file
+    (monkeys,) = parse(data)
+    part2(monkeys, 10000)
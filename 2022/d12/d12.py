@@ -5,7 +5,12 @@
 # And this implementation of A* should probably be replaced with BFS for less overhead.
 
 import string
-from queue import PriorityQueue
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid
+from aoc.search import ShortestPath
 
 def part1(heightmap):
     map_h = len(heightmap)
@@ -33,8 +38,8 @@ def part1(heightmap):
     print("Part 1 result:")
     #print("Final path:")
     #print(attempt)
-    print(f"Looked at {len(finder.distance_to)} nodes")
     print(f"Number of steps: {len(attempt) - 1}") # Starting at (0, 0) doesn't count as a step
+    return len(attempt) - 1
 
     
 def part2(heightmap):
@@ -58,133 +63,67 @@ def part2(heightmap):
     print("Part 2 result:")
     #print("Final path:")
     #print(attempt)
-    print(f"Looked at {len(finder.distance_to)} nodes")
     print(f"Number of steps: {len(attempt) - 1}") # Starting at (0, 0) doesn't count as a step
+    return len(attempt) - 1
     
     
-def in_bounds(x, lower, higher):
-    return lower <= x < higher
-
 def manhattan_distance(a, b):
     return max(abs(a1 - b1) for (a1, b1) in zip(a, b))
 
 class A_Star:
+    # Positions are flat indices into the heightmap (y * width + x),
+    # and the searching itself is done by the shared heapq engine (aoc.search)
     def __init__(self, heightmap, letter_heights, start):
-        self.heightmap = heightmap
-        self.map_h = len(heightmap)
-        self.map_w = len(heightmap[0])
-        self.letter_heights = letter_heights
-        self.start = start
+        self.grid = Grid.parse(heightmap)
+        self.heights = [letter_heights[c] for c in self.grid.cells.decode()]
+        self.start = self.grid.index(*start)
         self.distance_to = dict() # The minimum distances from start
-        self.seen_from = dict() # Which node did we come from to get here?
-        self.priorities = PriorityQueue()
+        self.finder = None
     
-    def neighbours(self, node):
-        offsets = [(-1, 0), (0, 1), (1, 0), (0, -1)] # NESW
-        (x, y) = node
-        for (off_x, off_y) in offsets:
-            (x1, y1) = (x + off_x, y + off_y)
-            if in_bounds(x1, 0, self.map_w) and in_bounds(y1, 0, self.map_h):
-                yield (x1, y1)
+    def search(self, neighbours, estimate, goal):
+        self.finder = ShortestPath(neighbours, estimate, paths=True)
+        self.distance_to = self.finder.dist
+        found = self.finder.run([self.start], goal)
+        if found is None:
+            print("A* couldn't find a path. Visited nodes and distances:")
+            for (node, d) in self.distance_to.items():
+                print(f"{self.grid.xy(node)}: {d}")
+            return []
+        return [self.grid.xy(node) for node in self.finder.path(found)]
     
     def find(self, end):
-        if end in self.distance_to:
-            # If we've already seen the end, return the path to it
-            return self.path_from_start(end)
-        
-        self.priorities.put((0, self.start, None)) # Init priority queue
-        end_x, end_y = end
-        end_height = self.letter_heights[self.heightmap[end_y][end_x]]
+        end = self.grid.index(*end)
+        heights = self.heights
+        end_height = heights[end]
+        end_xy = self.grid.xy(end)
 
-        while not self.priorities.empty():
-            (_, current, prev) = self.priorities.get()
+        def neighbours(current):
+            # Reachable (height diff) neighbours
+            elevation = heights[current]
+            return [(1, n) for n in self.grid.neighbours(current) if elevation + 1 >= heights[n]]
 
-            if current in self.distance_to and current != end:
-                # We've already seen this node
-                continue
-            # When we visit a node for the first time, its prev node is the one we popped from the queue.
-            # Its dist is that of the previous node + 1
-            self.seen_from[current] = prev
-            current_dist = self.distance_to.get(prev, 0) + 1
-            self.distance_to[current] = current_dist
-            
-            if current == end:
-                # Found the end!
-                return self.path_from_start(end)
-            (x, y) = current
-            elevation = self.letter_heights[self.heightmap[y][x]]
-            
-            # Add reachable (height diff) neighbours to the priority queue    
-            for n in self.neighbours(current):
-                if n in self.distance_to:
-                    # Already seen this node
-                    continue
-                nx, ny = n
-                neighbour_height = self.letter_heights[self.heightmap[ny][nx]]
-                if elevation + 1 >= neighbour_height:
-                    # Estimate its distance to the end
-                    height_diff = end_height - neighbour_height
-                    dist_left = max(manhattan_distance(n, end), height_diff)
+        def estimate(node):
+            # Estimate its distance to the end
+            height_diff = end_height - heights[node]
+            return max(manhattan_distance(self.grid.xy(node), end_xy), height_diff)
 
-                    # Add to queue in the form (priority, node, node_from)
-                    self.priorities.put((current_dist + 1 + dist_left, n, current))
-
-        print("A* couldn't find a path. Visited nodes and distances:")
-        for (node, d) in self.distance_to.items():
-            print(f"{node}: {d}")
-        return []
+        return self.search(neighbours, estimate, lambda node: node == end)
 
     # TODO: find an admissible heuristic. Closest a from current?
     def find_elevation(self, end_height=1):
-        print(f"Searching from {self.start} for the closest node of height {end_height}")
-        self.priorities.put((0, self.start, None)) # Init priority queue
-
-        while not self.priorities.empty():
-            (_, current, prev) = self.priorities.get()
+        print(f"Searching from {self.grid.xy(self.start)} for the closest node of height {end_height}")
+        heights = self.heights
 
-            if current in self.distance_to:
-                # We've already seen this node
-                continue
-            # When we visit a node for the first time, its prev node is the one we popped from the queue.
-            # Its dist is that of the previous node + 1
-            self.seen_from[current] = prev
-            current_dist = self.distance_to.get(prev, 0) + 1
-            self.distance_to[current] = current_dist
-            
-            (x, y) = current
-            elevation = self.letter_heights[self.heightmap[y][x]]
-            if elevation == end_height:
-                # Found the closest a node!
-                return self.path_from_start(current)
-            
-            # Add reachable (height diff) neighbours to the priority queue    
-            for n in self.neighbours(current):
-                if n in self.distance_to:
-                    # Already seen this node
-                    continue
-                nx, ny = n
-                neighbour_height = self.letter_heights[self.heightmap[ny][nx]]
-                # Could we have reached the current node from this neighbour?
-                if neighbour_height + 1 >= elevation:
-                    # Estimate its distance to the end
-                    height_diff = neighbour_height - end_height
-                    dist_left = height_diff #max(manhattan_distance(n, end), height_diff)
+        def neighbours(current):
+            # Could we have reached the current node from this neighbour?
+            elevation = heights[current]
+            return [(1, n) for n in self.grid.neighbours(current) if heights[n] + 1 >= elevation]
 
-                    # Add to queue in the form (priority, node, node_from)
-                    self.priorities.put((current_dist + 1 + dist_left, n, current))
+        def estimate(node):
+            height_diff = heights[node] - end_height
+            return height_diff
 
-        print("A* couldn't find a path. Visited nodes and distances:")
-        for (node, d) in self.distance_to.items():
-            print(f"{node}: {d}")
-        
-        return []
-
-    def path_from_start(self, node):
-        prev = self.seen_from[node]
-        if prev is None:
-            return [node]
-        else:
-            return self.path_from_start(prev) + [node]
+        return self.search(neighbours, estimate, lambda node: heights[node] == end_height)
 
 # (This DFS not used:)
 # Depth-limited search (DFS with a depth-limit)
@@ -284,6 +223,10 @@ def explain_why_dfs_on_1b_is_terrible():
     print(f"^ Number of digits in base 10: {math.floor(math.log10(4 ** 456)) + 1}")
     
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -291,7 +234,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    heightmap = data.strip().split("\n")
+    (heightmap,) = parse(data)
 
     part1(heightmap)
     print("--------")
@@ -299,4 +242,3 @@ if __name__ == "__main__":
 
     #explain_why_dfs_on_1b_is_terrible()
     #part1b(heightmap)
-    
\ No newline at end of file
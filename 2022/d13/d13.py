@@ -17,6 +17,7 @@ def part1(packets):
             score += i + 1
     print("Part 1 result:")
     print(f"Sum of indices of pairs in the right order: {score}")
+    return score
 
 def part2(packet_pairs):
     # We need all packets back in the same list, plus two divider packets
@@ -30,6 +31,7 @@ def part2(packet_pairs):
     print("Part 2 result:")
     print(f"Positions: {divider_positions}")
     print(f"Decoder key: {divider_positions[0] * divider_positions[1]}")
+    return divider_positions[0] * divider_positions[1]
     
 def compare_packets_original(left, right):
     # Note: "right order" and "wrong order" should both short-circuit the result!
@@ -105,6 +107,11 @@ def parse_packet(data):
     return (json.loads(p1), json.loads(p2))
 
 
+def parse(data):
+    packet_data = data.strip().split("\n\n")
+    return ([parse_packet(d) for d in packet_data],)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -112,10 +119,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    packet_data = data.strip().split("\n\n")
-    packets = [parse_packet(d) for d in packet_data]
+    (packets,) = parse(data)
 
     part1(packets)
     print("--------")
     part2(packets)
-    
\ No newline at end of file
@@ -14,6 +14,7 @@ def part1(walls, *, pretty_print=False):
         pprint_map(sand_map)
     print("Part 1 result:")
     print(f"Units of sand that come to rest before falling into the abyss: {settled_grains}")
+    return settled_grains
     
 def part2(walls, *, pretty_print=False):
     (sand_map, settled_grains) = sand(walls, floor=True)
@@ -21,6 +22,7 @@ def part2(walls, *, pretty_print=False):
         pprint_map(sand_map)
     print("Part 2 result:")
     print(f"Units of sand that come to rest before the origin is blocked: {settled_grains}")
+    return settled_grains
 
 def sand(walls, floor=False, wall_char=WALL_CHAR, sand_char=SAND_CHAR):
     sand_origin = (500, 0)
@@ -77,13 +79,7 @@ def pprint_map(points, void_char=VOID_CHAR):
             print(points.get((x, y), void_char), end="")
         print()
 
-# Command-line execution:
-if __name__ == "__main__":
-    import sys
-    filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
+def parse(data):
     inp_lines = data.strip().split("\n")
 
     """
@@ -116,9 +112,18 @@ if __name__ == "__main__":
         x_lo, x_hi = min(x1, x2), max(x1, x2)
         y_lo, y_hi = min(y1, y2), max(y1, y2)
         walls.update((x, y) for x in range(x_lo, x_hi + 1) for y in range(y_lo, y_hi + 1))
+    return (walls,)
+
+
+# Command-line execution:
+if __name__ == "__main__":
+    import sys
+    filename = sys.argv[1]
+    with open(filename, encoding="utf-8") as f:
+        data = f.read()
     
+    (walls,) = parse(data)
 
     part1(walls, pretty_print=True)
     print("--------")
     part2(walls, pretty_print=False)
-    
\ No newline at end of file
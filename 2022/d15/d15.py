@@ -2,7 +2,13 @@
 
 # https://adventofcode.com/2022/day/15
 
+import os
 import re
+import sys
+from functools import partial
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.intervals import IntervalSet
 
 def part1(sensors, line_y=10):
     # Circle-line intersection, except the circles are diamonds bc Manhattan distance instead of Euclidean
@@ -20,41 +26,22 @@ def part1(sensors, line_y=10):
             segments.append(intersects)
 
     # Now we have a bunch of line segments of blocked points. Find the total non-overlapping length.
-    # Sort by x values, sweep left-to-right. Whenever we see a new point, the space from the previous point is blocked iff the "active lines" set is empty
-    # (If one line segment starts where another ends, that point should be included.)
-    # (Include both start and end points. Does that already cover ^? Yes.)
-    blocked = 0
+    # (This used to be a hand-rolled left-to-right sweep. The IntervalSet sorts and merges the segments the same way,
+    #  and since ranges are inclusive, segments that only share an endpoint still count that point once.)
     if not segments:
         print(f"No circles intersect with y={line_y}")
         return
-    segments.sort()
-    blocked_start, blocked_end = None, None
-    for i in range(len(segments)):
-        (start_x, end_x) = segments[i]
-        # Only store current blocking line's min start and max end x! If the stored x < the new start x, then flush and add to blocked length.
-        if blocked_end is None:
-            (blocked_start, blocked_end) = start_x, end_x
-            continue
-        if blocked_end < start_x:
-            # The last segment and this one don't intersect. Flush~
-            blocked += (blocked_end + 1) - blocked_start # end +1 to include both ends
-            blocked_start, blocked_end = start_x, end_x
-        else:
-            # The last segment intersects with this one
-            blocked_end = max(blocked_end, end_x)
-
-    # Flush the last line
-    if blocked_end is not None:
-        blocked += (blocked_end + 1) - blocked_start # end +1 to include both ends
-    
-    # If any beacons lie directly on the line, subtract 1 from our total for each.
-    # (set, as the same beacon can be the closest to more than one sensor.)
+    blocked = IntervalSet(segments)
+
+    # Beacons lying directly on the line can't be "not a beacon", so take them out.
+    # (The same beacon can be the closest to more than one sensor, which the set takes care of.)
     known_beacons = set((bx, by) for (_, _, bx, by) in sensors)
-    #print(f"Number of beacons on the line: {sum(1 for (_, by) in known_beacons if by == line_y)}")
-    blocked -= sum(1 for (_, by) in known_beacons if by == line_y)
+    blocked -= IntervalSet((bx, bx) for (bx, by) in known_beacons if by == line_y)
+    blocked = blocked.total()
 
     print("Part 1 result:")
     print(f"Positions in row {line_y:,} that can't contain a beacon: {blocked:,}")
+    return blocked
 
 def part2(sensors, bound_lo=0, bound_hi=4_000_000):
     for line_y in range(bound_lo, bound_hi):
@@ -70,24 +57,14 @@ def part2(sensors, bound_lo=0, bound_hi=4_000_000):
         if not segments:
             #print(f"No circles intersect with y={line_y}")
             continue
-        segments = [(max(bound_lo, x1), min(bound_hi, x2)) for (x1, x2) in segments if x1 >= bound_lo or x2 <= bound_hi]
-        segments.sort()
-        blocked_start, blocked_end = None, None
-        for i in range(len(segments)):
-            (start_x, end_x) = segments[i]
-            # Only store current blocking line's min start and max end x! If the stored x < the new start x, then flush and add to blocked length.
-            if blocked_end is None:
-                (blocked_start, blocked_end) = start_x, end_x
-                continue
-            if blocked_end < start_x:
-                # The last segment and this one don't intersect. Our answer! (unless we're unlucky and it's on an edge)
-                print(f"Non-intersecting on line {line_y}! Prev: {(blocked_start, blocked_end)}. New: {(start_x, end_x)}")
-                print(f"Part 2 distress beacon position: {(start_x - 1, line_y)}")
-                print(f"Tuning frequency: {(start_x - 1) * 4_000_000 + line_y:,}")
-                return
-            else:
-                # The last segment intersects with this one
-                blocked_end = max(blocked_end, end_x)
+        # Anything in bounds that no sensor covers is our answer! (Including right at an edge, which the old sweep missed.)
+        gaps = IntervalSet(segments).gaps(bound_lo, bound_hi)
+        if gaps:
+            x = gaps.min()
+            print(f"Uncovered on line {line_y}! Gaps: {list(gaps)}")
+            print(f"Part 2 distress beacon position: {(x, line_y)}")
+            print(f"Tuning frequency: {x * 4_000_000 + line_y:,}")
+            return x * 4_000_000 + line_y
     
 def manhattan_distance(p1, p2):
     return sum(abs(x1 - x2) for (x1, x2) in zip(p1, p2))
@@ -127,6 +104,16 @@ def _inspect(sensors, interesting_y=3442119):
         if by == interesting_y:
             print((bx, by))
 
+def parse(data):
+    return (find_sensors(data),)
+
+# The runner calls each part with only the parsed args, so pin the real input's values here
+PARTS = {
+    1: partial(part1, line_y=2_000_000),
+    2: partial(part2, bound_lo=0, bound_hi=4_000_000),
+}
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -134,9 +121,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    sensors = find_sensors(data)
+    (sensors,) = parse(data)
 
     part1(sensors, 2000000)
     print("--------")
     part2(sensors, 0, 4_000_000)
-    
\ No newline at end of file
@@ -7,14 +7,18 @@
 import re
 from collections import defaultdict
 import itertools
-from functools import cache
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument, memo
+from aoc.progress import tqdm
 
 def part1(closed_valves, start="AA", minutes=30):
     result = max_flow(closed_valves, start, minutes)
-    print(max_flow.cache_info())
     print("Part 1 result:")
     print(f"The most pressure we can release is: {result}")
+    return result
 
 def part2(closed_valves, start="AA", minutes=26):
     result = 0
@@ -22,9 +26,10 @@ def part2(closed_valves, start="AA", minutes=26):
         r1 = max_flow(frozenset(v1), start, minutes)
         r2 = max_flow(frozenset(v2), start, minutes)
         result = max(result, r1 + r2)
-    print(max_flow.cache_info())
+        instrument.count("splits")
     print("Part 2 result:")
     print(f"The most pressure we can release with an elephant is: {result}")
+    return result
 
 # Attempt 1: Brute-force every possible split of closed valves between you and the elephant.
 # Attempt 3: Brute-force again, but this time cache the results of max_flow
@@ -38,7 +43,10 @@ def all_splits(xs):
             ys = set(ys)
             yield (xs.difference(ys), ys)
 
-@cache
+# No limit: part 2 reuses nearly every entry (the splits share their subsets), so evicting only costs time.
+# On a 58-valve test input, maxsize=2 ** 21 took peak memory from 3.9GB to 2.2GB but part 2 from 127s to 200s.
+# Either way the entries only last for one input (see aoc.memo.scope).
+@memo.cache
 def max_flow(closed_valves, current, minutes):
     if minutes <= 0:
         return 0
@@ -72,19 +80,15 @@ def find_valves(lines):
     return valves
 
 
-# Command-line execution:
-if __name__ == "__main__":
-    import sys
-    filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
+# parse sets the valves and distances globals, so it always has to run
+PARSE_CACHEABLE = False
+
+def parse(data):
     lines = data.strip().split("\n")
     global valves # I don't like this being global, but eh.
     valves = find_valves(lines)
-    start = "AA"
     closed_valves = frozenset((valve, flow) for (valve, (flow, _)) in valves.items() if flow > 0) # Only the ones that have a non-zero flow
-    
+
     # Floyd-Warshall to find the shortest distance between all our valves
     global distances
     distances = defaultdict(lambda: 100_000)
@@ -96,10 +100,20 @@ if __name__ == "__main__":
     for (k, i, j) in itertools.product(valves, valves, valves):
         # Note: k ranges slowest, so all the pairs have a chance to go first
         distances[(i, j)] = min(distances[(i, j)], distances[(i, k)] + distances[(k, j)])
+    return (closed_valves,)
+
+
+# Command-line execution:
+if __name__ == "__main__":
+    import sys
+    filename = sys.argv[1]
+    with open(filename, encoding="utf-8") as f:
+        data = f.read()
+    
+    (closed_valves,) = parse(data)
 
     print("Parsing done...")
     print("---- Part 1 ----")
     part1(closed_valves)
     print("---- Part 2 ----")
     part2(closed_valves)
-    
\ No newline at end of file
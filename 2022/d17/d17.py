@@ -2,15 +2,21 @@
 
 # https://adventofcode.com/2022/day/17
 
-import itertools
-from tqdm import tqdm
+from pathlib import Path
+import os
+import sys
 
-# Currently very messy, but it works. The falling rocks cycle-detection can be cleaned up a lot.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import cycles, instrument
+from aoc.progress import tqdm
+
+# Currently very messy, but it works.
 
 def part1(jets, rocks, rounds=2022):
     current_highest = falling_rocks(jets, rocks, rounds)
     print("Part 1 result:")
     print(f"After {rounds} rounds, the tower is {current_highest} units tall")
+    return current_highest
     
 def part2(jets, rocks):
     elephant_rounds = 1_000_000_000_000 # One trillion? Really?
@@ -21,30 +27,49 @@ def part2(jets, rocks):
     current_highest = falling_rocks(jets, rocks, rounds)
     print("Part 2 result:")
     print(f"After {rounds} rounds, the tower is {current_highest} units tall")
+    return current_highest
 
 def falling_rocks(jets, rocks, rounds, check_cycles=True):
+    tower = Tower(jets, rocks)
+    if not check_cycles:
+        for _ in tqdm(range(rounds)):
+            tower.drop()
+        instrument.count("rocks dropped", rounds)
+        return tower.height
+    # The tower's height goes up by the same amount every time the rocks, jets and top of the tower come round again.
+    # (This used to key on (rock, jet, x of the settled rock), which isn't really a cycle: it only worked by luck
+    #  if we waited for a whole number of cycles to be left. The top of the tower is what tells us it's a real one.)
+    return cycles.extrapolate(tower, Tower.drop, rounds, Tower.fingerprint, lambda t: t.height)
+
+class Tower:
+    # The chamber and where we're up to in the rocks and jets, one rock at a time
     # TODO: Learn about numpy array slicing, and sparse Bool arrays?
-    chamber = set()
-    current_highest = 0
-    # The bottom-left corner of the chamber is (0, 0). 7 units wide, so bottom-right is (0, 6)
-    # Blocks start falling with their bottom-left aligned to (2, 3 + highest)
-    # Cycle of enumerated jets and rocks? Then if the two match up again at the same x-position, it might be a cycle?
-    # But if a block falls below the start-height of the cycle, is it safe?
-    jet_cycle = itertools.cycle(enumerate(jets))
-    rock_cycle = itertools.cycle(enumerate(rocks))
-    rock_info = dict()
-
-    for round in tqdm(range(1, rounds + 1)):
-        r_i, r = next(rock_cycle)
+    # How far down from the top the fingerprint looks. Rocks rarely fall further than this past the top.
+    FINGERPRINT_DEPTH = 32
+
+    def __init__(self, jets, rocks):
+        self.jets = jets
+        self.rocks = rocks
+        # The bottom-left corner of the chamber is (0, 0). 7 units wide, so bottom-right is (0, 6)
+        # Blocks start falling with their bottom-left aligned to (2, 3 + highest)
+        self.chamber = set()
+        self.height = 0
+        self.rounds = 0
+        # Which rock and jet come next
+        self.rock_i = 0
+        self.jet_i = 0
+
+    def drop(self):
+        r = self.rocks[self.rock_i]
+        self.rock_i = (self.rock_i + 1) % len(self.rocks)
         r_h, r_w = r.height, r.width
+        chamber = self.chamber
+        pos = (2, self.height + 3)
 
-        falling = True
-        fall_origin = (2, current_highest + 3) # Merge this and the next line~
-        pos = fall_origin
-
-        while falling:
+        while True:
             # Try to push the rock in the direction of jet
-            j_i, jet = next(jet_cycle)
+            jet = self.jets[self.jet_i]
+            self.jet_i = (self.jet_i + 1) % len(self.jets)
             jet_offset = 1 if jet == ">" else -1
             pushed_pos = (pos[0] + jet_offset, pos[1])
             # Check for wall collision
@@ -61,73 +86,34 @@ def falling_rocks(jets, rocks, rounds, check_cycles=True):
             fall_pos = (pos[0], pos[1] - 1)
             if fall_pos[1] < 0:
                 # Hit the floor
-                falling = False
                 break
             blocked_chamber_cells = [(x, y) for x in range(fall_pos[0], fall_pos[0] + r_w)
                                             for y in range(fall_pos[1], fall_pos[1] + r_h)
                                             if (x, y) in chamber]
             rock_cells = list(r.occupied_cells(fall_pos))
             if collides(blocked_chamber_cells, rock_cells):
-                falling = False
                 break
             pos = fall_pos
         
         # Come to rest
         chamber.update(r.occupied_cells(pos))
-        current_highest = max(current_highest, pos[1] + r.height)
-
-        # Check for a cycle based on where this rock settled
-        # r_i: rock type
-        # j_i: which jet instruction
-        # (x, -y- this should be the current highest) of settle-pos
-        # ^ (we need to check whether the y-coord of where this settled is the current highest.
-        #     If it isn't, we can just wait until the part of the cycle where it does)
-        # round: which round we found it
-        if check_cycles:
-            if current_highest == pos[1] + r.height:
-                possible_prev = rock_info.get((r_i, j_i, pos[0]), None)
-                if possible_prev is not None:
-                    #print("----")
-                    # Probably a cycle!
-                    (prev_y, prev_round) = possible_prev
-                    #print(f"Found cycle from {prev_round} to {round}")
-                    
-                    round_diff = round - prev_round
-                    height_diff = current_highest - prev_y # Why -was- there an off-1 error here? using pos[1] for the y of the _origin_ and not the current highest.
-                    cycles = (rounds - round) // round_diff
-
-                    if rounds - (round + cycles * round_diff) != 0:
-                        #print("But let's be careful, this might not be a cycle. wait until it's a whole number...")
-                        #print("----")
-                        # Store info to look for a cycle next time 
-                        rock_info[r_i, j_i, pos[0]] = (current_highest, round)
-                        continue
-
-                    current_highest += cycles * height_diff
-                    remaining_rounds = rounds - (round + cycles * round_diff)
-                    h_diff_remaining = [y for (y, round) in rock_info.values() if round == prev_round + remaining_rounds][0] - prev_y # haha this is so terrible
-                    
-                    # It's not a real cycle >.<
-                    # If we only jump when there's a whole number of cycles remaining, then it might work?
-                    # (Yeah, by luck. It gives it time to settle into a cycle.)
-                    # (Better would be to remember fingerprint of top-view of blocks, or the prev ~20-50 height deltas)
-                    """
-                    print("----")
-                    _show_chamber(chamber, 1747, 1770)
-                    print("----")
-                    _show_chamber(chamber, 7, 30)
-                    """    
-                    return current_highest + h_diff_remaining
-
-            # Store info to look for a cycle next time 
-            rock_info[r_i, j_i, pos[0]] = (current_highest, round)
+        self.height = max(self.height, pos[1] + r.height)
+        self.rounds += 1
 
         # Forget collision info of cells < 5k below current
-        if round % 20000 == 0:
-            chamber = {(x, y) for (x, y) in chamber if current_highest - y < 5000}
-
-        #print("----")
-    return current_highest
+        if self.rounds % 20000 == 0:
+            self.chamber = {(x, y) for (x, y) in chamber if self.height - y < 5000}
+        return self
+
+    def fingerprint(self):
+        # Which rock and jet are next, and the shape of the top of the tower (each row as 7 bits, in one int)
+        top = 0
+        for y in range(self.height - 1, self.height - 1 - self.FINGERPRINT_DEPTH, -1):
+            top <<= 7
+            for x in range(7):
+                if (x, y) in self.chamber:
+                    top |= 1 << x
+        return (self.rock_i, self.jet_i, top)
 
 def collides(grid1, grid2):
     # Given two grids of the same shape,
@@ -166,21 +152,26 @@ def _show_chamber(chamber, lo=None, hi = None):
         print("")
 
 
-# Command-line execution:
-if __name__ == "__main__":
-    import sys
-    filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()    
+def parse(data):
     jets = data.strip()
 
-    # Rock shapes
-    with open("shapes.txt", encoding="utf-8") as f:
+    # Rock shapes (kept next to this file, so it doesn't matter where we're run from)
+    with open(Path(__file__).with_name("shapes.txt"), encoding="utf-8") as f:
         rock_data = f.read()    
     shapes = rock_data.split("\n\n")
     rocks = [Rock(shape) for shape in shapes]
+    return (jets, rocks)
+
+
+# Command-line execution:
+if __name__ == "__main__":
+    import sys
+    filename = sys.argv[1]
+    with open(filename, encoding="utf-8") as f:
+        data = f.read()
     
+    (jets, rocks) = parse(data)
+
     part1(jets, rocks)
     print("--------")
     part2(jets, rocks)
-    
\ No newline at end of file
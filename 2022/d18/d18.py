@@ -31,6 +31,7 @@ def part1(voxels):
 
     print("Part 1 result:")
     print(f"Total surface area: {exposed}")
+    return exposed
 
 def part2(voxels):
     # Yup, need to detect air pockets.
@@ -95,6 +96,7 @@ def part2(voxels):
 
     print("Part 2 result:")
     print(f"Total surface area exposed to outside air: {exposed}")
+    return exposed
 
 
 def exposed_faces(vs):
@@ -138,6 +140,11 @@ def pprint_droplet(droplet):
             print(y)
         print(f"{v_xs[0]} - {v_xs[-1]}")
 
+def parse(data):
+    lines = data.strip().split("\n")
+    return ([parse_voxel(l) for l in lines],)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -145,11 +152,9 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    voxels = [parse_voxel(l) for l in lines]
-    
+    (voxels,) = parse(data)
+
     #pprint_droplet(voxels)
     part1(voxels)
     print("--------")
     part2(voxels)
-    
\ No newline at end of file
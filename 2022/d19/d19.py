@@ -4,9 +4,13 @@
 
 import re
 from collections import Counter
-from functools import cache
 import math
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument, memo
+from aoc.progress import tqdm
 
 # When exploring routes through a blueprint, we can trim any that don't reach material milestones in time.
 # To obtain at least 1 geode we need a geode bot by the end of round 23
@@ -48,6 +52,7 @@ def part1(blueprints):
         total_quality += (r + 1) * gs
     print("Part 1 result:")
     print(f"Total quality levels: {total_quality}")
+    return total_quality
     
 def part2(blueprints):
     # 32 minutes, only first 3 blueprints. Multiply their geode numbers together.
@@ -63,14 +68,17 @@ def part2(blueprints):
     
     print("Part 2 result:")
     print(f"Product of geode values for first 3 blueprints: {result}")
+    return result
 
 def geodes2(blueprint, caps, bots, resources, rounds=24, best_gs=0):
+    instrument.count("geodes2 calls")
     if rounds <= 0:
         return resources["geode"]
     
     # If there's no way we could beat the current best geodes, prune this branch.
     estimate = resources["geode"] + optimistic_resources(bots["geode"], rounds) 
     if estimate <= best_gs:
+        instrument.count("geodes2 pruned")
         return 0
     
     # How many geodes would we get if we just wait from now on?
@@ -214,18 +222,18 @@ def get_milestones(blueprint, geode_round_target):
     print(f"New milestones: {milestones}")
     return milestones
 
-@cache
+@memo.cache(maxsize=1024)
 def milestone_round(n):
     # The first triangle number that's >= n
     for i in range(1, n):
         if summation(i) >= n:
             return i
 
-@cache
+@memo.cache(maxsize=1024)
 def optimistic_resources(bots, rounds):
     return bots * rounds + summation(rounds - 1)
 
-@cache
+@memo.cache(maxsize=1024)
 def summation(n):
     # Sum from 1 to N. Triangular numbers~
     return n * (n + 1) / 2
@@ -245,6 +253,11 @@ def parse_blueprints(lines):
         blueprints.append(blueprint)
     return blueprints
 
+def parse(data):
+    lines = data.strip().split("\n")
+    return (parse_blueprints(lines),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -252,11 +265,9 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    blueprints = parse_blueprints(lines)
+    (blueprints,) = parse(data)
     print("Done parsing!")
 
     part1(blueprints)
     print("--------")
     part2(blueprints)
-    
\ No newline at end of file
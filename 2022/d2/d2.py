@@ -19,6 +19,7 @@ def part1(rounds):
             score += 6
     print("Part 1 result:")
     print(f"Your total score = {score}")
+    return score
     
 def part2(rounds):
     score = 0
@@ -38,8 +39,13 @@ def part2(rounds):
             score += 6
     print("Part 2 result:")
     print(f"Your total score = {score}")
+    return score
     
 
+def parse(data):
+    return ([line.split() for line in data.strip().split("\n")],)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -47,9 +53,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    rounds = [line.split() for line in data.strip().split("\n")]
+    (rounds,) = parse(data)
 
     part1(rounds)
     print("--------")
     part2(rounds)
-    
\ No newline at end of file
@@ -2,7 +2,12 @@
 
 # https://adventofcode.com/2022/day/20
 
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.progress import tqdm
 
 def part1(ns):
     l = len(ns)
@@ -15,6 +20,8 @@ def part1(ns):
             print(f"Looked for original index {i} that's missing from ns")
             print(ns)
             raise Exception
+        # Finding each number is a scan along the list, so this is what makes it quadratic
+        instrument.count("entries scanned", current_pos + 1)
         ns.pop(current_pos)
         ns.insert(wrap_into(current_pos + v, l - 1), (original_pos, v)) # This doesn't start the list in the right place, but it's ok
     #print(f"List after moves: {ns}")
@@ -25,6 +32,7 @@ def part1(ns):
 
     print("Part 1 result:")
     print(f"Sum of 1000th, 2000th and 3000th numbers after 0: {r}")
+    return r
 
 def part2(ns):
     key = 811589153
@@ -40,6 +48,7 @@ def part2(ns):
                 print(f"Looked for original index {i} that's missing from ns")
                 print(ns)
                 raise Exception
+            instrument.count("entries scanned", current_pos + 1)
             ns.pop(current_pos)
             ns.insert(wrap_into(current_pos + v, l - 1), (original_pos, v))
     
@@ -50,6 +59,7 @@ def part2(ns):
 
     print("Part 2 result:")
     print(f"Sum of 1000th, 2000th and 3000th numbers after 0: {r}")
+    return r
 
 """
 def wrap_into(v, hi):
@@ -63,6 +73,11 @@ def wrap_into(v, hi):
 def wrap_into(v, hi):
     return v % hi
 
+def parse(data):
+    ns = [(i, int(n)) for (i, n) in enumerate(data.strip().split())] # Original pos, value
+    return (ns,)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -70,10 +85,9 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    ns = [(i, int(n)) for (i, n) in enumerate(data.strip().split())] # Original pos, value
+    (ns,) = parse(data)
     print(f"Received {len(ns)} ns")
-    
+
     part1(ns[:])
     print("--------")
     part2(ns[:])
-    
\ No newline at end of file
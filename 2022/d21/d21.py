@@ -9,6 +9,7 @@ def part1(monkeys):
     root = monkeys["root"].yell(monkeys)
     print("Part 1 result:")
     print(f"Root yells {root}")
+    return root
 
 def part2(monkeys):
     # The root checks for equality (it needs to pass)
@@ -22,7 +23,9 @@ def part2(monkeys):
     # Solve simultaneous equations
     diff = (root[0] - root[1])
     real, imag = diff.real, diff.imag
-    print(f"You need to shout {int(real / (-imag))}")
+    shout = int(real / (-imag))
+    print(f"You need to shout {shout}")
+    return shout
 
 class Monkey:
     def __init__(self, name, value=None, op=None, wait1=None, wait2=None):
@@ -65,6 +68,10 @@ def parse_monkeys(lines):
     return monkeys
 
 
+def parse(data):
+    return (parse_monkeys(data.strip().split("\n")),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -72,9 +79,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    monkeys = parse_monkeys(data.strip().split("\n"))
-    
+    (monkeys,) = parse(data)
+
     part1(monkeys)
     print("--------")
-    part2(parse_monkeys(data.strip().split("\n"))) # Each monkey remembers what it yelled, so get a fresh copy
-    
\ No newline at end of file
+    part2(*parse(data)) # Each monkey remembers what it yelled, so get a fresh copy
@@ -2,9 +2,14 @@
 
 # https://adventofcode.com/2022/day/22
 
+import os
 import re
+import sys
 from enum import Enum
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid
+
 def part1(tilemap, borders, moves):
     row_borders, col_borders = borders
     pos = (row_borders[0][0], 0) # Note: this might be a wall.
@@ -51,6 +56,7 @@ def part1(tilemap, borders, moves):
     pw = 1000 * (pos[1] + 1) + 4 * (pos[0] + 1) + facing # 1000 * row, 4 * col, facing
     print("Part 1 result:")
     print(f"Final password: {pw}")
+    return pw
     
 
 def part2(tilemap, borders, moves):
@@ -122,6 +128,7 @@ def part2(tilemap, borders, moves):
 
     print("Part 2 result:")
     print(f"Final password: {pw}")
+    return pw
 
 # Wrap a value around between lo and hi (inclusive)
 def wrap(v, lo, hi):
@@ -207,29 +214,19 @@ def parse_map(data):
     # For every (x, y), if it's the first or last . or # in the line, remember it as the edge
     # Also remember the edges of the top and bottom...
     # We can just do this as a post-processing step?
-    lines = data.split("\n")
-    tilemap = dict()
-    
-    for y in range(len(lines)):
-        l = lines[y]
-        for x in range(len(l)):
-            c = l[x]
-            match c:
-                case "#":
-                    tilemap[x, y] = Tile.WALL
-                case ".":
-                    tilemap[x, y] = Tile.OPEN
+    grid = Grid.parse(data, pad=" ") # Pad out the ragged lines with void
+    tilemap = dict.fromkeys(grid.positions("."), Tile.OPEN)
+    tilemap.update(dict.fromkeys(grid.positions("#"), Tile.WALL))
 
     # Post-processing: Get the first and last tiles of every row and column for part1 wrapping.
-    row_borders = dict()
-    col_borders = dict()
-    xs, ys = sorted(x for (x, _) in tilemap.keys()), sorted(y for (_, y) in tilemap.keys())
-    for x in range(xs[0], xs[-1] + 1):
-        col = sorted(y1 for (x1, y1) in tilemap.keys() if x1 == x)
-        col_borders[x] = (col[0], col[-1]) # lo, hi index of that col (inclusive)
-    for y in range(ys[0], ys[-1] + 1):
-        row = sorted(x1 for (x1, y1) in tilemap.keys() if y1 == y)
-        row_borders[y] = (row[0], row[-1]) # lo, hi of that row
+    # argmax finds the first True, so the last one is the first from the other end.
+    # Note this needs numpy (through grid.array()): unlike Grid.positions(), there's no fallback without it.
+    tiles = grid.array() != ord(" ")
+    (height, width) = tiles.shape
+    row_lo, row_hi = tiles.argmax(axis=1), width - 1 - tiles[:, ::-1].argmax(axis=1)
+    col_lo, col_hi = tiles.argmax(axis=0), height - 1 - tiles[::-1, :].argmax(axis=0)
+    row_borders = dict(enumerate(zip(row_lo.tolist(), row_hi.tolist()))) # lo, hi of that row
+    col_borders = dict(enumerate(zip(col_lo.tolist(), col_hi.tolist()))) # lo, hi index of that col (inclusive)
 
     return tilemap, row_borders, col_borders
 
@@ -257,6 +254,14 @@ def _check_cubewraps(x_lo, x_hi, y_lo, y_hi, facing):
                 print(f"{directions[dual]} {(x1, y1)} -> {directions[f2]} {(x2, y2)}")
     print(f"Done checking wraps {(x_lo, x_hi, y_lo, y_hi)} facing {facing}")
 
+def parse(data):
+    map_data, move_data = data.split("\n\n")
+
+    tilemap, *borders = parse_map(map_data)
+    moves = parse_moves(move_data)
+    return (tilemap, borders, moves)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -264,10 +269,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    map_data, move_data = data.split("\n\n")
-
-    tilemap, *borders = parse_map(map_data)
-    moves = parse_moves(move_data)
+    (tilemap, borders, moves) = parse(data)
 
     #print("Check cube-wraps are reversible")
     #_check_cubewraps(100, 150, 49, 50, 1)
@@ -275,4 +277,4 @@ if __name__ == "__main__":
 
     part1(tilemap, borders, moves)
     print("--------")
-    part2(tilemap, borders, moves)    
\ No newline at end of file
+    part2(tilemap, borders, moves)
@@ -2,8 +2,13 @@
 
 # https://adventofcode.com/2022/day/23
 
+import os
+import sys
 from collections import Counter
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid
+
 def part1(elves, rounds=10):
     # Run 10 rounds, check number of blank tiles at the end.
     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)] # NSWE
@@ -55,7 +60,9 @@ def part1(elves, rounds=10):
     #pprint_elves(elves)
 
     print("Part 1 result:")
-    print(f"After {rounds} moves, empty ground tiles: {count_blanks(elves)}")
+    blanks = count_blanks(elves)
+    print(f"After {rounds} moves, empty ground tiles: {blanks}")
+    return blanks
 
 def part2(elves):
     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)] # NSWE
@@ -107,6 +114,7 @@ def part2(elves):
     
     print("Part 2 result:")
     print(f"The first round where no elf moved was round {rounds}")
+    return rounds
 
 def count_blanks(elves):
     xs, ys = sorted(x for (x, _) in elves), sorted(y for (_, y) in elves)
@@ -129,12 +137,11 @@ def pprint_elves(elves, elf_char="#", blank_char="."):
     #print(f"Empty tiles: {blank}")
     
 def parse_elves(lines):
-    elves = set()
-    for y in range(len(lines)):
-        for x in range(len(lines[y])):
-            if lines[y][x] == "#":
-                elves.add((x, y))
-    return elves
+    return set(Grid.parse(lines).positions("#"))
+
+def parse(data):
+    return (parse_elves(data.strip().split("\n")),)
+
 
 # Command-line execution:
 if __name__ == "__main__":
@@ -143,10 +150,9 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    elves = parse_elves(data.strip().split("\n"))
+    (elves,) = parse(data)
     print("---- Done parsing ----")
-    
+
     part1(elves.copy())
     print("--------")
     part2(elves.copy())
-    
\ No newline at end of file
@@ -6,8 +6,13 @@
 # The walls (blizzards) are always in the same place at every time step, so we could cache that.
 # We can store positions as (x, y, t), can visualise as a 3D block~
 
-from queue import PriorityQueue
-from functools import cache
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import memo
+from aoc.grid import Grid
+from aoc.search import ShortestPath
 
 def part1(blizzards, bounds, start, goal):
     # Find the shortest path through the moving blizzards~
@@ -16,8 +21,8 @@ def part1(blizzards, bounds, start, goal):
     print(f"Path: {attempt}")
 
     print("Part 1 result:")
-    print(f"Looked at {len(finder.distance_to)} nodes")
     print(f"Number of steps: {len(attempt) - 1}") # Starting doesn't count as a step
+    return len(attempt) - 1
 
 def part2(blizzards, bounds, start, goal):
     # Part 2: Shortest path from start to goal, then back to start, then to goal again.
@@ -41,6 +46,7 @@ def part2(blizzards, bounds, start, goal):
 
     print("Part 2 result:")
     print(f"Total time taken: {t1 + t2 + t3}")
+    return t1 + t2 + t3
     
 class Blizzard:       
     directions = {
@@ -64,17 +70,28 @@ class Blizzard:
 
 class A_Star:
     # Ripping A* structure from day 12~
+    # States are (x, y, t) packed into one int for the shared heapq engine (aoc.search): t * area + y * width + x
     def __init__(self, blizzards, bounds, start, goal, start_t=0):
         self.blizzards = blizzards
         self.row_bounds = bounds[0]
         self.col_bounds = bounds[1]
         self.start = start
         self.goal = goal
+        # The map is 1 wider than the bounds on each side (walls)
+        self.width = self.row_bounds[1] + 2
+        self.area = self.width * (self.col_bounds[1] + 2)
         self.distance_to = dict() # The minimum distances from start
-        self.seen_from = dict() # Which node did we come from to get here?
-        self.priorities = PriorityQueue()
         self.start_t = start_t # for part 2, when you double-back.~
     
+    def encode(self, node, t):
+        (x, y) = node
+        return t * self.area + y * self.width + x
+
+    def decode(self, state):
+        (t, i) = divmod(state, self.area)
+        (y, x) = divmod(i, self.width)
+        return ((x, y), t)
+
     def all_neighbours(self, node):
         offsets = [(-1, 0), (0, 1), (1, 0), (0, -1), (0, 0)] # NESW + wait
         (x, y) = node
@@ -82,56 +99,34 @@ class A_Star:
             (x1, y1) = (x + off_x, y + off_y)
             yield (x1, y1)
     
+    def neighbours(self, state):
+        # Reachable (not walls at time t) neighbours
+        (current, t) = self.decode(state)
+        # Is it a blizzard-wall or one of the edges (except start and goal)?
+        walls = walls_at_time(self.blizzards, (self.row_bounds, self.col_bounds), t + 1) #blizzard positions at the next t
+        out = []
+        for n in self.all_neighbours(current):
+            nx, ny = n
+            if (n not in walls) and (n in (self.start, self.goal) or 
+                (in_bounds_incl(nx, *self.row_bounds) and in_bounds_incl(ny, *self.col_bounds))):
+                out.append((1, self.encode(n, t + 1)))
+        return out
+
     def find(self):
-        self.priorities.put((0, self.start, self.start_t, None)) # Init priority queue
-
-        while not self.priorities.empty():
-            (_, current, t, prev) = self.priorities.get()
-
-            if (current, t) in self.distance_to and current != self.goal:
-                # We've already seen this node at this time
-                continue
-            # When we visit a node for the first time (at this time), its prev node is the one we popped from the queue.
-            # Its dist is that of the previous node + 1
-            # TODO: Dist == t? Except we can visit the same node at diff t.
-            self.seen_from[(current, t)] = prev
-            current_dist = self.distance_to.get((prev, t - 1), 0) + 1
-            self.distance_to[(current, t)] = current_dist
-            
-            if current == self.goal:
-                # Found the end!
-                print(f"Found end {self.goal} at time {t}")
-                return self.path_from_start(self.goal, t)
-            
-            # Add reachable (not walls at time t) neighbours to the priority queue    
-            for n in self.all_neighbours(current):
-                if (n, t + 1) in self.distance_to:
-                    # Already seen this node at this time
-                    continue
-                nx, ny = n
-                # Is it a blizzard-wall or one of the edges (except start and goal)?
-                walls = walls_at_time(self.blizzards, (self.row_bounds, self.col_bounds), t + 1) #blizzard positions at the next t
-
-                if (n not in walls) and (n in (self.start, self.goal) or 
-                    (in_bounds_incl(nx, *self.row_bounds) and in_bounds_incl(ny, *self.col_bounds))):
-                    # Estimate its distance to the end
-                    dist_left = manhattan_distance(n, self.goal)
-
-                    # Add to queue in the form (priority, node, t, node_from)
-                    self.priorities.put((current_dist + 1 + dist_left, n, t + 1, current))
-
-        print("A* couldn't find a path. Visited nodes and distances:")
-        for (node, d) in self.distance_to.items():
-            print(f"{node}: {d}")
-        return []
-    
-    
-    def path_from_start(self, node, t):
-        prev = self.seen_from[(node, t)]
-        if prev is None:
-            return [node]
-        else:
-            return self.path_from_start(prev, t - 1) + [node]
+        # Estimate the distance to the end from each state
+        finder = ShortestPath(self.neighbours, lambda state: manhattan_distance(self.decode(state)[0], self.goal), paths=True)
+        self.distance_to = finder.dist
+        goal = self.encode(self.goal, 0) % self.area
+        found = finder.run([self.encode(self.start, self.start_t)], lambda state: state % self.area == goal)
+        if found is None:
+            print("A* couldn't find a path. Visited nodes and distances:")
+            for (state, d) in self.distance_to.items():
+                print(f"{self.decode(state)}: {d}")
+            return []
+
+        (_, t) = self.decode(found)
+        print(f"Found end {self.goal} at time {t}")
+        return [self.decode(state)[0] for state in finder.path(found)]
 
 def in_bounds_incl(x, lower, higher):
     return lower <= x <= higher
@@ -147,7 +142,8 @@ def wrap(v, lo, hi):
     return r
 
 # Can be cached as a frozenset, but check how many ts we need
-@cache
+# A* only looks at a few minutes either side of its frontier, and each entry is a map of the whole valley, so keep a few
+@memo.cache(maxsize=128)
 def walls_at_time(blizzards, bounds, t):
     walls = dict()
     for b in blizzards:
@@ -172,21 +168,11 @@ def pprint_walls(walls, x_hi, y_hi):
         print(f" {y}")
 
 def parse_blizzards(lines):
-    blizzards = []
-    for y in range(len(lines)):
-        for x in range(len(lines[y])):
-            c = lines[y][x]
-            if c in Blizzard.directions:
-                blizzards.append(Blizzard(x, y, c))
+    grid = Grid.parse(lines)
+    blizzards = [Blizzard(x, y, c) for c in Blizzard.directions for (x, y) in grid.positions(c)]
     return frozenset(blizzards) # Freeze so we can cache it
 
-# Command-line execution:
-if __name__ == "__main__":
-    import sys
-    filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
+def parse(data):
     lines = data.strip().split("\n")
     blizzards = parse_blizzards(lines)
     # x and y bounds (Inclusive, skipping walls)
@@ -196,9 +182,21 @@ if __name__ == "__main__":
     start = (lines[0].find("."), 0)
     goal = (lines[-1].find("."), len(lines) - 1)
     print(f"col_bounds: {col_bounds}, row_bounds: {row_bounds}, start {start}, goal {goal}")
-    print("---- Done parsing ----")
+    return (blizzards, (row_bounds, col_bounds), start, goal)
+
+
+# Command-line execution:
+if __name__ == "__main__":
+    import sys
+    filename = sys.argv[1]
+    with open(filename, encoding="utf-8") as f:
+        data = f.read()
     
+    (blizzards, bounds, start, goal) = parse(data)
+    print("---- Done parsing ----")
+
     """
+    (row_bounds, col_bounds) = bounds
     for t in range(6):
         print(f"--- Round {t} ---")
         pprint_walls(walls_at_time(blizzards, (row_bounds, col_bounds), t), row_bounds[1], col_bounds[1]) # Row bounds and col bounds don't wrap at the right spots...
@@ -213,7 +211,6 @@ if __name__ == "__main__":
     print(f"Equal? {r0 == r700}")
     """
 
-    part1(blizzards, (row_bounds, col_bounds), start, goal)
+    part1(blizzards, bounds, start, goal)
     print("--------")
-    part2(blizzards, (row_bounds, col_bounds), start, goal)
-    
\ No newline at end of file
+    part2(blizzards, bounds, start, goal)
@@ -8,6 +8,7 @@ def part1(ns):
     print(f"Total in decimal: {total}")
     snafu_total = dec_to_snafu(total)
     print(f"Total in SNAFU: {snafu_total}")
+    return snafu_total
 
 def snafu_to_dec(n):
     total = 0
@@ -44,6 +45,10 @@ def dec_to_base(n, b):
     return "".join(digits[::-1])
 
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -51,8 +56,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    snafu_nums = data.strip().split("\n")
-    
+    (snafu_nums,) = parse(data)
+
     part1(snafu_nums)
     print("--------")
-    
\ No newline at end of file
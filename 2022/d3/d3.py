@@ -14,6 +14,7 @@ def part1(rucksacks):
         total += priorities[overlap]
     print("Part 1 result:")
     print(f"Sum of priorities of items: {total}")
+    return total
     
     
 def part2(rucksacks):
@@ -26,8 +27,13 @@ def part2(rucksacks):
         total += priorities[overlap]
     print("Part 2 result:")
     print(f"Sum of priorities of each group: {total}")
+    return total
     
 
+def parse(data):
+    return (data.strip().split(),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -35,9 +41,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    rucksacks = data.strip().split()
+    (rucksacks,) = parse(data)
 
     part1(rucksacks)
     print("--------")
     part2(rucksacks)
-    
\ No newline at end of file
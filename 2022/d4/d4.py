@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.intervals import IntervalSet
 
 # https://adventofcode.com/2022/day/4
 """
 Note: the section-parsing function can be simplified to just splitting on any of "," and "-" with re.split,
   then taking all 4 values at once.
-Also, building 2 sets the size of each section scales horribly as the section-size grows.
-  A better-scaling solution would just compare the start- and end-points of each section to see if they overlap.
-  (Some examples of this are probably in https://www.reddit.com/r/adventofcode/comments/zc0zta/2022_day_4_solutions/ )
+Also, building 2 sets the size of each section scaled horribly as the section-size grew.
+  The sections are IntervalSets now, which only compare the start- and end-points of each section,
+  so the section sizes don't matter.
 """
 
 def part1(lines):
@@ -19,6 +24,7 @@ def part1(lines):
     
     print("Part 1 result:")
     print(f"Number of pairs where one fully contains the other: {count}")
+    return count
     
 def part2(lines):
     count = 0 # Number of lines where the two ranges overlap.
@@ -29,15 +35,20 @@ def part2(lines):
     
     print("Part 2 result:")
     print(f"Number of pairs that overlap: {count}")
+    return count
     
 def parse_sections(line):
     elf1, elf2 = line.split(",")
     (s1, e1) = map(int, elf1.split("-"))
     (s2, e2) = map(int, elf2.split("-"))
-    section1 = set(range(s1, e1 + 1))
-    section2 = set(range(s2, e2 + 1))
+    section1 = IntervalSet([(s1, e1)])
+    section2 = IntervalSet([(s2, e2)])
     return (section1, section2)
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -45,9 +56,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    
+    (lines,) = parse(data)
+
     part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
@@ -11,7 +11,9 @@ def part1(stacks, moves):
         stacks[crate_to].extend(stacks[crate_from][-n:][::-1]) #[:-n-1:-1])
         stacks[crate_from][-n:] = []
     print("Part 1 result:")
-    print(f"Top crate of each stack: {''.join(stack[-1] for stack in stacks[1:])}")
+    tops = ''.join(stack[-1] for stack in stacks[1:])
+    print(f"Top crate of each stack: {tops}")
+    return tops
     
 def part2(stacks, moves):
     print("Starting stacks:")
@@ -20,7 +22,9 @@ def part2(stacks, moves):
         stacks[crate_to].extend(stacks[crate_from][-n:])
         stacks[crate_from][-n:] = []
     print("Part 2 result:")
-    print(f"Top crate of each stack: {''.join(stack[-1] for stack in stacks[1:])}")
+    tops = ''.join(stack[-1] for stack in stacks[1:])
+    print(f"Top crate of each stack: {tops}")
+    return tops
 
 def parse_stacks(crate_input):
     crate_input = crate_input.split("\n")[::-1]
@@ -57,6 +61,13 @@ def pprint_stacks(stacks):
     for i in range(len(stacks)):
         print(f"{i}: {stacks[i]}")
 
+def parse(data):
+    (crate_input, move_input) = data.split("\n\n")
+    stacks = parse_stacks(crate_input)
+    moves = list(parse_moves(move_input))
+    return (stacks, moves)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -64,13 +75,10 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    (crate_input, move_input) = data.split("\n\n")
-    stacks = parse_stacks(crate_input)
-    moves = list(parse_moves(move_input))
-    
+    (stacks, moves) = parse(data)
+
     #todo: part1 mutates stacks, so deep-copy for part 2!
     # (note: even if you copy stacks with [:], it only copies the pointers to the inner lists)
     part1(_copy_stacks(stacks), moves)
     print("--------")
     part2(_copy_stacks(stacks), moves)
-    
\ No newline at end of file
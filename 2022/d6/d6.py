@@ -2,15 +2,23 @@
 
 # https://adventofcode.com/2022/day/6
 
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.loader import Input
+
 def part1(signal):
     start_pos = detect_start_packet(signal)
     print("Part 1 result:")
     print(f"Start packet marker detected after {start_pos} characters.")
+    return start_pos
 
 def part2(signal):
     start_pos = detect_start_message(signal)
     print("Part 2 result:")
     print(f"Start message marker detected after {start_pos} characters.")
+    return start_pos
     
 
 def detect_start_packet(signal):
@@ -23,21 +31,31 @@ def detect_start_message(signal):
 
 def detect_start_marker(signal, n):
     # Detect a start-marker of n different characters.
-    for i in range(n, len(signal) + 1):
-        cs = set(signal[i-n:i])
-        if len(cs) == n:
-            return i
+    # One pass, remembering where each character was last seen, rather than making a set for every window.
+    # The window starts just after the latest repeat, so it's a marker once it gets to n long.
+    last_seen = {}
+    window_start = 0
+    for (i, c) in enumerate(signal):
+        if last_seen.get(c, -1) >= window_start:
+            window_start = last_seen[c] + 1
+        last_seen[c] = i
+        if i + 1 - window_start == n:
+            return i + 1
+
+# The signal's read straight out of the mapped file and copied once as bytes, without decoding it.
+# (Not kept as a view of the mapping: that's only valid while the file's open, which parse() can't promise.)
+PARSE_MAPPED = True
+
+def parse(data):
+    return (bytes(data.stripped().view),)
+
 
 # Command-line execution:
 if __name__ == "__main__":
-    import sys
     filename = sys.argv[1]
-    with open(filename, encoding="utf-8") as f:
-        data = f.read()
-    
-    signal = data.strip()
-    
-    part1(signal)
-    print("--------")
-    part2(signal)
-    
\ No newline at end of file
+    with Input.open(filename) as data:
+        (signal,) = parse(data)
+
+        part1(signal)
+        print("--------")
+        part2(signal)
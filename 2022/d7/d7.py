@@ -14,6 +14,7 @@ def part1(root):
     total = sum(size for size in sizes.values() if size <= 100000)
     print("Part 1 result:")
     print(f"Sum of dir sizes of max 100000: {total}")
+    return total
     
 def part2(root):
     sizes = dict()
@@ -31,6 +32,7 @@ def part2(root):
     (out_d, out_size) = min(((d, size) for (d, size) in sizes.items() if size >= target_space), key = lambda e: e[1])
     print("Part 2 result:")
     print(f"Deleting the smallest appropriate directory {out_d.full_name()} would save {out_size} space")
+    return out_size
     
 class Directory:
     def __init__(self, name, parent):
@@ -131,6 +133,11 @@ def parse_fs(lines):
 
     return root
 
+def parse(data):
+    lines = data.strip().split("\n")
+    return (parse_fs(lines),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -138,11 +145,9 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    root = parse_fs(lines)
+    (root,) = parse(data)
     print("---- Done parsing ----")
 
     part1(root)
     print("--------")
     part2(root)
-    
\ No newline at end of file
@@ -11,6 +11,7 @@ def part1(trees):
     num_visible = sum(1 for x in range(len(trees)) for y in range(len(trees[x])) if any(g[x][y] for g in grids))
     print("Part 1 result:")
     print(f"Total visible trees: {num_visible}")
+    return num_visible
     
 def part2(trees):
     grids = []
@@ -20,6 +21,7 @@ def part2(trees):
     
     print("Part 2 result:")
     print(f"Highest scenic score: {scenic_score}")
+    return scenic_score
     
 
 def visible_trees(trees, orientation=0):
@@ -71,6 +73,12 @@ def change_orientation(grid, n):
             grid = list(zip(*(grid[::-1])))[::-1]
     return grid
 
+def parse(data):
+    lines = data.strip().split("\n")
+    trees = [[int(n) for n in l] for l in lines]
+    return (trees,)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -78,12 +86,10 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
-    trees = [[int(n) for n in l] for l in lines]
+    (trees,) = parse(data)
     #print(trees)
     print("---- Done parsing ----")
 
     part1(trees)
     print("--------")
     part2(trees)
-    
\ No newline at end of file
@@ -22,6 +22,7 @@ def part1(moves):
 
     print("Part 1 result:")
     print(f"The tail visited {len(t_visited)} unique positions")
+    return len(t_visited)
     
 def part2(moves, n_knots=10):
     # Now with 10 knots!
@@ -43,6 +44,7 @@ def part2(moves, n_knots=10):
 
     print("Part 2 result:")
     print(f"The tail visited {len(tail_visited)} unique positions")
+    return len(tail_visited)
     
 directions = {
     "U": (0, 1), # going up increases our y but not x
@@ -79,6 +81,10 @@ def follow(hx, hy, tx, ty):
             ty -= 1
     return (tx, ty)
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -86,12 +92,11 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    moves = data.strip().split("\n")
-    
+    (moves,) = parse(data)
+
     part1(moves)
     print("--------")
     #print("Sanity checking: part 2 with 2 knots should be the same as part 1.")
     #part2(moves, 2)
     print("--------")
     part2(moves)
-    
\ No newline at end of file
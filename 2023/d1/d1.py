@@ -14,7 +14,9 @@ def part1(lines):
     vs = [value(row) for row in lines]
     print("Part 1:")
     print("The total calibration value is:")
-    print(sum(vs))
+    total = sum(vs)
+    print(total)
+    return total
     
     
 def part2(lines):
@@ -28,7 +30,9 @@ def part2(lines):
     
     print("Part 2:")
     print("The total calibration value is:")
-    print(sum(vs))
+    total = sum(vs)
+    print(total)
+    return total
 
 
 def value(row):
@@ -44,6 +48,10 @@ def replace_patterns(s: str, patterns: dict[str, int]):
     return s
     
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -51,9 +59,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
+    (lines,) = parse(data)
 
     part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
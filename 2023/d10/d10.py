@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid, NORTH, EAST, SOUTH, WEST
 
 # https://adventofcode.com/2023/day/10
 
 
 # Which directions does each tile face?
 tiles = {
-    "|": [-1j, +1j],
-    "-": [-1, +1],
-    "L": [-1j, +1],
-    "J": [-1j, -1],
-    "7": [+1j, -1],
-    "F": [+1j, +1],
+    "|": [NORTH, SOUTH],
+    "-": [WEST, EAST],
+    "L": [NORTH, EAST],
+    "J": [NORTH, WEST],
+    "7": [SOUTH, WEST],
+    "F": [SOUTH, EAST],
     ".": [],
-    "S": [-1j, +1j, -1, +1]
+    "S": [NORTH, SOUTH, WEST, EAST]
 }
 
 
-def part1(pipes, start_pos, path):
+def part1(loop, start_pos, path):
     # Get the closest distance for each cell from the start (by traversing the path forwards and backwards)
     ds_forward = {pos: dist for (dist, pos) in enumerate(path, 1)}
     ds_backward = {pos: dist for (dist, pos) in enumerate(path[::-1], 1)}
@@ -25,10 +30,11 @@ def part1(pipes, start_pos, path):
     # Which tile is furthest away?
     furthest_d = max(min_ds.values())
     print(f"Part 1: The furthest point in the loop is {furthest_d} steps away")
+    return furthest_d
     
-def part2(lines, pipes, start_pos, path):
+def part2(grid, loop, start_pos, path):
     # Given the simplified pipes, let's start by printing out only the loop
-    # print_loop(lines, pipes)
+    # print_loop(grid, loop)
 
     # Hint on one approach from reddit:
     # - Draw a straight line from a point in any direction
@@ -40,11 +46,12 @@ def part2(lines, pipes, start_pos, path):
     # If the point isn't part of the loop, check if it's inside or outside
     # If the point is a vertical piece, then increment the count of times we've crossed the shape-boundary
     points_inside = 0
-    for (y, l) in enumerate(lines):
+    for y in range(grid.height):
         vert_pipes_crossed = 0
-        for (x, c) in enumerate(l):
-            pos = (x + y * 1j)
-            if pos not in pipes:
+        row_start = grid.index(0, y)
+        for (x, c) in enumerate(grid.row(y)):
+            pos = row_start + x
+            if not loop[pos]:
                 # Piece isn't part of pipes, check if inside or outside
                 if vert_pipes_crossed % 2:
                     # Odd number of crossings, we're inside
@@ -57,8 +64,8 @@ def part2(lines, pipes, start_pos, path):
                 # -- There are no intermediate pipes that are holes (all are hyphens), so this is safe
                 # -- If we only count N pieces, then LJ will cancel itself out, F7 won't trigger a flip, and FJ and L7 will both trigger only one flip (equiv to |)
                 if c == "S":
-                    c = infer_start_piece(pipes, pos)
-                    print(f"Inferred start piece {pos} shape is {c}")
+                    c = infer_start_piece(grid, pos)
+                    print(f"Inferred start piece {grid.xy(pos)} shape is {c}")
 
                 # Is it a vertical piece?
                 match c:
@@ -83,71 +90,71 @@ def part2(lines, pipes, start_pos, path):
                         horiz_start_piece = None
     
     print(f"Part 2: {points_inside=}")
+    return points_inside
 
 
-def parse_input(lines: list[str]) -> tuple[dict[complex, list[complex]], complex, list[complex]]:
+def parse_input(grid: Grid) -> tuple[bytearray, int, list[int]]:
     # First, parse the map.
     # Find the start S and pipes connected to it
     #  (our input only has 2 pipes actually connected to it, thankfully)
-    pipes = dict()
-    
-    # Parse map and find the start. 
-    start_pos = None
-    for (y, l) in enumerate(lines):
-        for (x, c) in enumerate(l):
-            pos = x + y * 1j
-            if c == "S": 
-                start_pos = pos
-            # Store the neighbours of each tile rather than the relative offset of neighbours
-            neighbours = [pos + offset for offset in tiles[c]]
-            pipes[pos] = neighbours
-    
-    print(f"Done parsing, {start_pos=}")
-    # Simplify start_pos neighbours so we know what shape it is
-    pipes[start_pos] = [neighbour for neighbour in pipes[start_pos] if facing(pipes, start_pos, neighbour)]
-    print(f"Facing neighbours of start: {pipes[start_pos]}")
+    # Positions are flat grid indices (y * width + x), and we look up each pipe's neighbours
+    # in the grid as we need them, rather than storing them for every tile
+    start_pos = grid.find("S")
+    print(f"Done parsing, start_pos={grid.xy(start_pos)}")
+    print(f"Facing neighbours of start: {[grid.xy(n) for n in start_neighbours(grid, start_pos)]}")
 
-    path = trace_loop(pipes, start_pos)[1:-1]
+    path = trace_loop(grid, start_pos)[1:-1]
     print(f"Loop length (not including S) = {len(path)}")
-    return pipes, start_pos, path
+    # Simplify the pipes to only the loop, as a flag per tile
+    loop = bytearray(len(grid))
+    for pos in path:
+        loop[pos] = 1
+    loop[start_pos] = 1
+    return loop, start_pos, path
 
 
-def facing(pipes, pos1, pos2):
+def pipe_neighbours(grid, pos):
+    # The tiles that the pipe at pos points at (skipping any that point off the edge of the map)
+    return [n for n in (grid.step(pos, d) for d in tiles[grid[pos]]) if n is not None]
+
+def facing(grid, pos1, pos2):
     # Given two tiles, can you get from one to the other?
     # Take the coord diff of A and B. 
     # They're facing if (A-B) is a valid path from A and (B-A) is a valid path from B.
 
     # (or, if we're storing neighbour pos instead of offsets, then facing if
     #  A is a neighbour of B and vice versa)
-    return (pos2 in pipes.get(pos1, [])) and (pos1 in pipes.get(pos2, []))
+    return (pos2 in pipe_neighbours(grid, pos1)) and (pos1 in pipe_neighbours(grid, pos2))
+
+def start_neighbours(grid, start_pos):
+    # S could be any shape, so only keep the neighbours that point back at it
+    return [n for n in pipe_neighbours(grid, start_pos) if facing(grid, start_pos, n)]
 
-def is_vert(pipes, pos):
+def is_vert(grid, pos):
     # Is the starting pipe a vertical pipe?
     # (Since we didn't store the offsets initially)
-    neighbours = pipes[pos]
-    return any((pos - n).imag != 0 for n in neighbours)
+    neighbours = start_neighbours(grid, pos)
+    return any(abs(pos - n) == grid.width for n in neighbours)
 
-def infer_start_piece(pipes, pos):
-    # Based on the (already-inferred) neighbour offsets, what's the start piece's character?
+def infer_start_piece(grid, pos):
+    # Based on the facing neighbours, what's the start piece's character?
     # Get the offsets of S from each facing neighbour
-    offsets = set(n - pos for n in pipes[pos])
-    for (c, offs) in tiles.items():
-        if offsets == set(offs):
+    neighbours = start_neighbours(grid, pos)
+    offsets = set(n - pos for n in neighbours)
+    for (c, dirs) in tiles.items():
+        if offsets == set(grid.offsets[d] for d in dirs):
             return c
-    raise Exception(f"Got the offsets of start wrong, can't infer shape. Start {pos=}, neighbours {pipes[pos]=}, offsets {offsets=}")
+    raise Exception(f"Got the offsets of start wrong, can't infer shape. Start {pos=}, {neighbours=}, offsets {offsets=}")
 
-def trace_loop(pipes, start_pos):
+def trace_loop(grid, start_pos):
     # Find the full path of the loop (in the correct order) that includes the start
     path = [start_pos]
     # Arbitrarily pick a direction from the facing-neighbours of start
-    for n in pipes[start_pos]:
-        if facing(pipes, start_pos, n):
-            path.append(n)
-            break
+    path.append(start_neighbours(grid, start_pos)[0])
     # Keep following the pipe in that direction until we find start_pos again!
     while True:
         pos1 = path[-1]
-        neighbours = [pos2 for pos2 in pipes[pos1] if pos2 != path[-2] and facing(pipes, pos1, pos2)]
+        neighbours = [pos2 for pos2 in pipe_neighbours(grid, pos1) if pos2 != path[-2] and facing(grid, pos1, pos2)]
         # print(f"Going from {pos1=} to {neighbours=}")
         # There should only be 1 valid new neighbour here, since all pipes (except S) only connect to 2 tiles
         if len(neighbours) != 1:
@@ -160,38 +167,38 @@ def trace_loop(pipes, start_pos):
     
     return path
 
-def print_loop(lines, pipes):
-    out = []
-    for (y, l) in enumerate(lines):
-        out_row = []
-        for (x, c) in enumerate(l):
-            pos = (x + y * 1j)
-            if pos not in pipes:
-                c = "."
-            out_row.append(c)
-        out.append("".join(out_row))
+def print_loop(grid, loop):
+    out = grid.copy()
+    for pos in range(len(out)):
+        if not loop[pos]:
+            out[pos] = "."
     
-    out_s = "\n".join(out)
+    out_s = str(out)
     print(out_s)
     # with open("input_simplified.txt", "w") as f:
     #     f.write(out_s)
 
 
+def parse(data):
+    grid = Grid.parse(data)
+    loop, start_pos, path = parse_input(grid)
+    return (grid, loop, start_pos, path)
+
+# part1 doesn't need the grid
+PARTS = {
+    1: lambda grid, *args: part1(*args),
+    2: part2,
+}
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
-    lines = data.split()
-
-    pipes, start_pos, path = parse_input(lines)
-    # Simplify path to only include useful pipes
-    for k in set(pipes).difference(path):
-        if k != start_pos:
-            del pipes[k]
-    # print(f"Simplified pipes: {pipes}")
-    part1(pipes, start_pos, path)
+    
+    (grid, loop, start_pos, path) = parse(data)
+    part1(loop, start_pos, path)
     print("--------")
-    part2(lines, pipes, start_pos, path)
-    
\ No newline at end of file
+    part2(grid, loop, start_pos, path)
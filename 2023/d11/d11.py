@@ -1,6 +1,13 @@
 #!/usr/bin/env python3
+from functools import partial
 from itertools import combinations
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.points import pack, unpack
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/10
 
@@ -17,13 +24,14 @@ def part1(data):
     for (y, row) in enumerate(grid):
         for (x, c) in enumerate(row):
             if c == "#":
-                pos = x + y * 1j
-                galaxies.append(pos)
+                galaxies.append(pack(x, y))
     dists = []
-    for (p1, p2) in tqdm(combinations(galaxies, 2)):
-        d = taxicab_dist(p1, p2)
+    for ((x1, y1), (x2, y2)) in tqdm(combinations(map(unpack, galaxies), 2)):
+        d = abs(x1 - x2) + abs(y1 - y2)
         dists.append(d)
+    instrument.count("pairs", len(dists))
     print(f"Part 1: {sum(dists)=}")
+    return sum(dists)
     
 
 def part2(data, expansion):
@@ -43,34 +51,31 @@ def part2(data, expansion):
     for (y, row) in enumerate(grid):
         for (x, c) in enumerate(row):
             if c == "#":
-                pos = x + y * 1j
-                galaxies.append(pos)
+                galaxies.append(pack(x, y))
         if all(c == "." for c in row):
             empty_rows.append(y)
     print(f"{empty_rows=} {empty_cols=}")
 
     dists = []
-    for (p1, p2) in tqdm(combinations(galaxies, 2)):
-        d = taxicab_dist(p1, p2)
+    for ((x1, y1), (x2, y2)) in tqdm(combinations(map(unpack, galaxies), 2)):
+        d = abs(x1 - x2) + abs(y1 - y2)
         # find overlapping blank cols
-        x1, x2 = sorted(map(int, (p1.real, p2.real)))
+        x1, x2 = sorted((x1, x2))
         cols_covered = range(x1, x2)
         extra_cols = sum(1 for x in empty_cols if x in cols_covered)
         # find overlapping blank rows
-        y1, y2 = sorted(map(int, (p1.imag, p2.imag)))
+        y1, y2 = sorted((y1, y2))
         rows_covered = range(y1, y2)
         extra_rows = sum(1 for y in empty_rows if y in rows_covered)
 
         # We already counted 1 of the expanded rows, so add another n-1
         d += (expansion - 1) * (extra_cols + extra_rows)
         dists.append(d)
+    instrument.count("pairs", len(dists))
     print(f"Part 2: {sum(dists)=}")
+    return sum(dists)
 
 
-def taxicab_dist(p1, p2):
-    d = p1 - p2
-    return abs(d.real) + abs(d.imag)
-
 def expand_blank_rows(grid):
     # Warning: may need to make sure rows are non-mutable (e.g. string) and that we aren't mutating in-place
     out = []
@@ -84,6 +89,15 @@ def transpose(grid):
     return list(zip(*grid))
 
 
+def parse(data):
+    return (data.strip(),)
+
+PARTS = {
+    1: part1,
+    2: partial(part2, expansion=1_000_000),
+}
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -91,7 +105,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
+    (data,) = parse(data)
     part1(data)
     print("--------")
     part2(data, expansion=1_000_000)
-    
\ No newline at end of file
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import re
-from functools import cache
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument, memo
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/12
 
@@ -14,10 +18,12 @@ def part1(lines):
         springs = tuple(map(int, springs.split(",")))
         arrangements = place_springs(record, springs)
         total += arrangements
+        instrument.count("records")
         # print(f"Found {arrangements} arrangements!")
     
     print(f"Part 1 cache stats: {place_springs.cache_info()}")
     print(f"Part 1: {total=}")
+    return total
     
 
 def part2(lines):
@@ -32,12 +38,15 @@ def part2(lines):
         #  and that's followed by a ., a ?, or the end of the string
         arrangements = place_springs(record, springs)
         total += arrangements
+        instrument.count("records")
         # print(f"Found {arrangements} arrangements!")
     
     print(f"Part 2 cache stats (incl p1): {place_springs.cache_info()}")
     print(f"Part 2: {total=}")
+    return total
 
-@cache
+# Entries are hardly ever reused once we've moved on to the next line, so only keep the recent ones
+@memo.cache(maxsize=4096)
 def place_springs(line, springs, depth=0):
     # prefix = "-" * depth
     # print(f"{prefix}Looking in {line=} for {springs=}")
@@ -84,6 +93,10 @@ def place_springs(line, springs, depth=0):
     
     return total
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -91,8 +104,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
-    lines = data.split("\n")
+    (lines,) = parse(data)
     part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
@@ -19,6 +19,7 @@ def part1(grids):
         print(f"Couldn't find a mirror for {grid=}")
         
     print(f"Part 1: {total=}")
+    return total
     
 
 def part2(grids):
@@ -36,6 +37,7 @@ def part2(grids):
             continue
         print(f"Couldn't find a smudged mirror for {grid=}")
     print(f"Part 2: {total=}")
+    return total
 
 def find_mirror(grid):
     n_cols = len(grid)
@@ -69,6 +71,11 @@ def transpose(grid):
     return list(zip(*grid))
 
 
+def parse(data):
+    grids = [line.split("\n") for line in data.strip().split("\n\n")]
+    return (grids,)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -76,8 +83,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
-    grids = [line.split("\n") for line in data.split("\n\n")]
+    (grids,) = parse(data)
     part1(grids)
     print("--------")
     part2(grids)
-    
\ No newline at end of file
@@ -1,41 +1,46 @@
 #!/usr/bin/env python3
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.cycles import advance, digest
+from aoc.grid import Grid
 
 # https://adventofcode.com/2023/day/14
 
 """
 Commit of shame:
 I'm not taking out the rotation functions yet, even though they complicated the process and weren't used in the end.
-Would be nice to clean this up so each roll is faster (when looping through cells to roll a rock, we can keep the most recently seen blocked tile for that row/col?)
+Rolls used to check every rock against a set of obstacles. Now they happen in place on a flat grid, keeping where the next rock would stop for each row/col.
 """
 
-directions = {
-    # dir: (offset, sort key)
-    "N": (-1j, lambda x: x.imag),
-    "W": (-1, lambda x: x.real),
-    "S": (1j, lambda x: -x.imag),  # Could use ascending=False, but eh
-    "E": (1, lambda x: -x.real)
-}
+ROCK = ord("O")
+BLOCK = ord("#")
+EMPTY = ord(".")
+
+def lanes(grid, d):
+    # The lines of cells that rocks roll along in direction d, each starting from the edge they roll towards
+    (w, h) = (grid.width, grid.height)
+    match d:
+        case "N":
+            return [range(x, w * h, w) for x in range(w)]
+        case "W":
+            return [range(y * w, (y + 1) * w) for y in range(h)]
+        case "S":
+            return [range(x + (h - 1) * w, -1, -w) for x in range(w)]
+        case "E":
+            return [range((y + 1) * w - 1, y * w - 1, -1) for y in range(h)]
+
+directions = "NWSE"
 
 def part1(grid):
-    blocks = set()
-    rocks = []
-    # Find all blocks and rocks
-    for (y, row) in enumerate(grid):
-        for (x, c) in enumerate(row):
-            pos = x + y * 1j
-            match c:
-                case "#":
-                    blocks.add(pos)
-                case "O":
-                    rocks.append(pos)
     # Roll
-    height = len(grid)
-    width = len(grid[0])
-    new_rocks = roll(blocks, rocks, width, height, "N")
+    grid = grid.copy()
+    roll(grid, lanes(grid, "N"))
 
-    total = load(height, new_rocks)
+    total = load(grid)
     print(f"Part 1: {total=}")
+    return total
     
 
 def part2(grid, cycles=1_000_000_000):
@@ -43,93 +48,46 @@ def part2(grid, cycles=1_000_000_000):
     # Prob need to cache?
     # If the end of any NWSE cycle looks like any previous cycle, then skip to that point in the result
 
-    # The grid is hashable if we turn it into a tuple
+    # The grid is hashable if we turn it into bytes
     # We could either change which direction we slide, or just rotate 90deg anticlockwise, and do 4x cycles?
-    blocks = set()
-    rocks = []
-    # Find all blocks and rocks
-    for (y, row) in enumerate(grid):
-        for (x, c) in enumerate(row):
-            pos = x + y * 1j
-            match c:
-                case "#":
-                    blocks.add(pos)
-                case "O":
-                    rocks.append(pos)
     # 1 billion spin cycles!
-    height = len(grid)
-    width = len(grid[0])
-    rocks = spin_cycle(blocks, rocks, width, height, cycles)
+    grid = grid.copy()
+    spin_cycle(grid, cycles)
 
-    height = len(grid)
-    total = load(height, rocks)
+    total = load(grid)
     print(f"Part 2: {total=}")
-
-def load(height, rocks):
-    return sum(height - pos.imag for pos in rocks)
-
-def roll(blocks, rocks, x_max, y_max, d):
-    # Roll rocks (NWSE), return new positions of rocks
-    # Sort rocks by asc rolling axis
-    off, key = directions[d]
-    rocks = sorted(rocks, key=key)
-    
-    new_rocks = set()
-    for pos in rocks:
-        # print(f"{pos=}")
-        # x = pos.real
-        # y_settled = pos.imag
-        # for y1 in reversed(range(int(pos.imag))):
-        #     # Roll until stopped by a block or new rock
-        #     #  (old rocks haven't moved yet bc sorted by y)
-        #     pos1 = x + y1 * 1j
-        #     if (pos1 in blocks) or (pos1 in new_rocks):
-        #         break
-        #     y_settled = y1
-        # new_rocks.add(x + y_settled * 1j)
-        settled_pos = pos
-        next_pos = pos + off
-        obstacles = blocks | new_rocks
-        # print(f"{next_pos=}")
-        while (next_pos not in obstacles) and (0 <= next_pos.real < x_max) and (0 <= next_pos.imag < y_max):
-            settled_pos = next_pos
-            next_pos = next_pos + off
-            # print(f"{next_pos=}")
-        new_rocks.add(settled_pos)
-    return new_rocks
-
-def spin_cycle(blocks, rocks, x_max, y_max, cycles):
-    # pprint_grid(blocks, rocks)
-    rocks = tuple(rocks)  # So it's hashable
-    seen_grids = {rocks: 0}
-
-    # block_directions = [set(rot_clockwise(b, d) for b in blocks) for d in range(4)]
-
-    # Keep spinning until we find a loop
-    for i in tqdm(range(1, cycles + 1)):
-        # roll N, then turn clockwise so W is top (for NWSE)
-        # for d in range(4):
-        #     rocks = roll(block_directions[d], rocks)
-        #     rocks = set(map(rot_clockwise, rocks))
-        #     pprint_grid(block_directions[d], rocks)
-        for d in directions:
-            rocks = roll(blocks, rocks, x_max, y_max, d)
-        rocks = tuple(rocks)
-        # Have we seen this grid before?
-        i0 = seen_grids.get(rocks)
-        if i0 is not None:
-            loop_length = i - i0
-            left = (cycles - i) % loop_length
-            if left == 0:
-                print(f"Found loop after cycle {i}: {loop_length=}, cycles {left=}, skipping to end!")
-                # print(rocks)
-                # print(f"{i0=} {i=}")
-                # print(f"{seen_grids=}")
-                break
-        seen_grids[rocks] = i
-    
-    # Finished all the cycles!
-    return rocks
+    return total
+
+def load(grid):
+    return sum(grid.height - y for y in range(grid.height) for c in grid.row(y) if c == "O")
+
+def roll(grid, lanes):
+    # Roll rocks (NWSE) in place, along each lane towards its start
+    cells = grid.cells
+    for lane in lanes:
+        # Where the next rock in this lane would stop
+        settled = 0
+        for (k, pos) in enumerate(lane):
+            c = cells[pos]
+            if c == ROCK:
+                if k != settled:
+                    cells[lane[settled]] = ROCK
+                    cells[pos] = EMPTY
+                settled += 1
+            elif c == BLOCK:
+                settled = k + 1
+
+def spin_cycle(grid, cycles):
+    # Keep spinning until the grid looks like it did after an earlier cycle, then skip whole loops to near the end.
+    # Only a digest of each grid is kept (16 bytes rather than a copy of the grid).
+    cycle_lanes = [lanes(grid, d) for d in directions]
+
+    def spin(grid):
+        for d_lanes in cycle_lanes:
+            roll(grid, d_lanes)
+        return grid
+
+    return advance(grid, spin, cycles, lambda g: digest(g.cells))
 
 
 # Hindsight: don't actually need these
@@ -148,19 +106,14 @@ def rot_clockwise(x, turns=1):
 def rot_counterclockwise(x, turns=1):
     return x * pow(-1j, turns)
 
-def pprint_grid(blocks, rocks, n=10):
+def pprint_grid(grid, n=10):
     print()
     for y in range(n):
-        for x in range(n):
-            pos = x + y * 1j
-            if pos in blocks:
-                c = "#"
-            elif pos in rocks:
-                c = "O"
-            else:
-                c = "."
-            print(c, end="")
-        print()
+        print(grid.row(y)[:n])
+
+
+def parse(data):
+    return (Grid.parse(data),)
 
 
 # Command-line execution:
@@ -170,8 +123,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
-    grid = data.split("\n")
+    (grid,) = parse(data)
     # part1(grid)
     print("--------")
     part2(grid)
-    
\ No newline at end of file
@@ -10,6 +10,7 @@ def part1(ls):
         total += v
 
     print(f"Part 1: {total=}")
+    return total
 
 def part2(ls):
     # We can rely on the fact that python dicts keep original insertion order
@@ -33,6 +34,7 @@ def part2(ls):
         for (lens_n, lens) in enumerate(box, 1):
             total += b_n * lens_n * box[lens]
     print(f"Part 2: {total=}")
+    return total
 
 def get_hash(word):
     v = 0
@@ -42,15 +44,18 @@ def get_hash(word):
     return v
 
 
+def parse(data):
+    return (data.strip().split(","),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
+        data = f.read().strip()
     
-    ls = data.split(",")
+    (ls,) = parse(data)
     part1(ls)
     print("--------")
     part2(ls)
-    
\ No newline at end of file
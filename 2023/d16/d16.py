@@ -1,84 +1,75 @@
 #!/usr/bin/env python3
+import os
+import sys
 
-from collections import deque
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid, NORTH, EAST, SOUTH, WEST
 
 # https://adventofcode.com/2023/day/16
 
-offs = {
-    "N": (0, -1),
-    "E": (1, 0),
-    "S": (0, 1),
-    "W": (-1, 0)
+# Which way(s) does a beam go after hitting each tile, for each direction (NESW) it was going?
+bounces = {
+    ".": [[NORTH], [EAST], [SOUTH], [WEST]],
+    "|": [[NORTH], [NORTH, SOUTH], [SOUTH], [NORTH, SOUTH]],
+    "-": [[EAST, WEST], [EAST], [EAST, WEST], [WEST]],
+    "/": [[EAST], [NORTH], [WEST], [SOUTH]],
+    "\\": [[WEST], [SOUTH], [EAST], [NORTH]],
 }
+bounces = {ord(c): ds for (c, ds) in bounces.items()}
+# The grid gets a border of this, so beams know when they've left
+OUTSIDE = " "
 
 def part1(grid):
-    result = shoot_beam(grid, (0, 0, "E"))
+    result = shoot_beam(grid, (grid.index(1, 1), EAST))
     print(f"Part 1: {result}")
+    return result
 
 
 def part2(grid):
     result = 0
     # Shoot beam along every edge, get the max (brute force!)
-    height = len(grid)
-    width = len(grid[0])
+    # (the grid is 1 bigger on every side, because of the border)
+    height = grid.height - 2
+    width = grid.width - 2
     # W edge going E
-    result = max(result, *[shoot_beam(grid, (0, y, "E")) for y in range(height)])
+    result = max(result, *[shoot_beam(grid, (grid.index(1, y), EAST)) for y in range(1, height + 1)])
     # N edge going S
-    result = max(result, *[shoot_beam(grid, (x, 0, "S")) for x in range(width)])
+    result = max(result, *[shoot_beam(grid, (grid.index(x, 1), SOUTH)) for x in range(1, width + 1)])
     # E edge going W
-    result = max(result, *[shoot_beam(grid, (width - 1, y, "W")) for y in range(height)])
+    result = max(result, *[shoot_beam(grid, (grid.index(width, y), WEST)) for y in range(1, height + 1)])
     # S edge going N
-    result = max(result, *[shoot_beam(grid, (x, height - 1, "N")) for x in range(width)])
+    result = max(result, *[shoot_beam(grid, (grid.index(x, height), NORTH)) for x in range(1, width + 1)])
     
     print(f"Part 2: {result}")
+    return result
 
 def shoot_beam(grid, start_beam):
-    height = len(grid)
-    width = len(grid[0])
-    # Store pos as (x, y) and store NESW direction of beam
-    # Keep a set of next and seen beam positions (incl dir), 
+    # Store beams as (pos, NESW direction)
+    # Keep a bit per direction for each tile we've seen a beam go through,
     #  don't repeat seen (to avoid infinite loops)
-    seen = set()
-    energised = set()  # Could just do a 2nd pass over set
-    beams = deque([start_beam])
+    cells = grid.cells
+    offsets = grid.offsets
+    outside = ord(OUTSIDE)
+    seen = bytearray(len(cells))
+    beams = [start_beam]
     while beams:
-        bx, by, bd = beams.pop()
-        if (bx, by, bd) in seen:
-            continue
+        (pos, d) = beams.pop()
+        c = cells[pos]
         # Make sure we don't go off the grid
-        if not ((0 <= bx < width) and (0 <= by < height)):
+        if c == outside:
+            continue
+        if seen[pos] & (1 << d):
             continue
-        seen.add((bx, by, bd))
-        energised.add((bx, by))
-        c = grid[by][bx]
-        match (c, bd):
-            case (".", _) | ("|", "N") | ("|", "S") | ("-", "E") | ("-", "W"):
-                # Keep going in the same direction
-                beams.append(split_beam(bx, by, bd))
-            case ("|", _):
-                # split NS
-                beams.append(split_beam(bx, by, "N"))
-                beams.append(split_beam(bx, by, "S"))
-            case ("-", _):
-                # split EW
-                beams.append(split_beam(bx, by, "E"))
-                beams.append(split_beam(bx, by, "W"))
-            case ("/", "E") | ("\\", "W"):
-                beams.append(split_beam(bx, by, "N"))
-            case ("/", "W") | ("\\", "E"):
-                beams.append(split_beam(bx, by, "S"))
-            case ("/", "N") | ("\\", "S"):
-                beams.append(split_beam(bx, by, "E"))
-            case ("/", "S") | ("\\", "N"):
-                beams.append(split_beam(bx, by, "W"))
-            case _:
-                raise Exception(f"Missing case for {(c, bd)=} at pos {(bx, by)}")
+        seen[pos] |= 1 << d
+        for d1 in bounces[c][d]:
+            beams.append((pos + offsets[d1], d1))
     
-    return len(energised)
+    # Energised tiles are any that a beam went through
+    return len(seen) - seen.count(0)
+
 
-def split_beam(x0, y0, d):
-    offx, offy = offs[d]
-    return x0 + offx, y0+offy, d
+def parse(data):
+    return (Grid.parse(data, border=OUTSIDE),)
 
 
 # Command-line execution:
@@ -86,10 +77,9 @@ if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
+        data = f.read().strip()
     
-    grid = data.split("\n")
+    (grid,) = parse(data)
     part1(grid)
     print("--------")
     part2(grid)
-    
\ No newline at end of file
@@ -1,87 +1,72 @@
 #!/usr/bin/env python3
+import os
+import sys
 
-from queue import PriorityQueue
-from dataclasses import dataclass, field
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid, EAST, SOUTH
+from aoc.search import ShortestPath
 
 # https://adventofcode.com/2023/day/17
 
 def part1(grid):
     city = City(grid)
-    dest = (city.width - 1) + (city.height - 1) * 1j
+    dest = city.grid.index(city.width - 1, city.height - 1)
     
     # Let's try not storing cells travelled.
     # Reduce valid directions to left and right turns (no straight moves), but we can move 3 tiles in that direction?
     # Start facing right and facing down
-    # Heat loss, pos, dir offset
-    start = [(0, 0j, 1), (0, 0j, 1j)]
+    # States are pos * 4 + direction (NESW)
+    start = [0 * 4 + EAST, 0 * 4 + SOUTH]
     
     finder = A_Star(city)
-    out = finder.find(start, dest)
+    (heat, path) = finder.find(start, dest)
 
-    print(f"Part 1: min heat loss {out.heat=}")
-    print(f"{out.path=}")
+    print(f"Part 1: min heat loss {heat=}")
+    print(f"{path=}")
+    return heat
 
 def part2(grid):
     city = City(grid)
-    dest = (city.width - 1) + (city.height - 1) * 1j
+    dest = city.grid.index(city.width - 1, city.height - 1)
     
-    start = [(0, 0j, 1), (0, 0j, 1j)]
+    start = [0 * 4 + EAST, 0 * 4 + SOUTH]
     
     finder = A_Star(city, 4, 10)
-    out = finder.find(start, dest)
+    (heat, path) = finder.find(start, dest)
 
-    print(f"Part 2: min heat loss {out.heat=}")
-    print(f"{out.path=}")
+    print(f"Part 2: min heat loss {heat=}")
+    print(f"{path=}")
+    return heat
 
 
-@dataclass(order=True)
-class Cell:
-    priority: int
-    heat: int=field(compare=False)
-    pos: complex=field(compare=False)
-    direction: complex=field(compare=False)
-    path: list=field(default_factory=list, compare=False)
- 
 class City:
     def __init__(self, grid) -> None:
-        self.grid = grid
-        self.height = len(grid)
-        self.width = len(grid[0])
+        # Positions are flat indices into the grid
+        self.grid = Grid.parse(grid)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.heat = [c - ord("0") for c in self.grid.cells]
 
-    def neighbours(self, c: Cell, min_tiles: int = 1, max_tiles: int = 3) -> list[tuple[int, complex, complex]]:
+    def neighbours(self, state: int, min_tiles: int = 1, max_tiles: int = 3) -> list[tuple[int, int]]:
         ns = []
         # Using 4HbQ's trick from day16 to get turn offsets    
         # Attempt 2: Instead of tracking number of cells in that direction,
         #  only turn+move 1-3 tiles, don't ever go straight. 
         # Don't remove seen here
-        pos = c.pos
-        d = c.direction
-        heat = c.heat
-        for d1 in (1j * d, -1j * d):
-            h1 = heat
-            # Add heat of all the skipped tiles
-            for t in range(1, min_tiles):
-                pos1 = pos + t * d1
-                if not self.in_city(pos1):            
+        (pos, d) = divmod(state, 4)
+        for d1 in ((d + 1) % 4, (d - 1) % 4):
+            h1 = 0
+            pos1 = pos
+            for t in range(1, max_tiles + 1):
+                pos1 = self.grid.step(pos1, d1)
+                if pos1 is None:
                     break
-                h1 += self.heat_loss(pos1)
-
-            # Add neighbours in bounds
-            for t in range(min_tiles, max_tiles + 1):
-                pos1 = pos + t * d1
-                if not self.in_city(pos1):            
-                    break
-                # Heat of that tile = heat of cell + sum(heat of cells between incl.)
-                h1 += self.heat_loss(pos1)
-                ns.append((h1, pos1, d1))
+                # Heat of that tile = sum(heat of cells between incl.)
+                h1 += self.heat[pos1]
+                # Skip (but add the heat of) the first few tiles
+                if t >= min_tiles:
+                    ns.append((h1, pos1 * 4 + d1))
         return ns
-    
-    def in_city(self, pos):
-        return (0 <= pos.real < self.width) and (0 <= pos.imag < self.height)
-    
-    def heat_loss(self, pos):
-        return int(self.grid[int(pos.imag)][int(pos.real)])
-
 
     
 class A_Star:
@@ -91,34 +76,30 @@ class A_Star:
         self.max_tiles = max_tiles
     
     def find(self, start, goal):
-        print(f"Searching for path from {start[1]} -> {goal}")
-        candidates = PriorityQueue()
-        seen = set()
+        grid = self.city.grid
+        print(f"Searching for path from {grid.xy(start[0] // 4)} -> {grid.xy(goal)}")
         print(f"{start=}")
-        for s in start:
-            candidates.put(Cell(0, *s))
-        while not candidates.empty():
-            cell = candidates.get()
-            if (cell.pos, cell.direction) in seen:
-                continue
-
-            seen.add((cell.pos, cell.direction))
-            if cell.pos == goal:
-                # We reached the goal!
-                print(f"Reached goal!")
-                return cell
-            
-            # Try cells next to this one
-            ns = self.city.neighbours(cell, self.min_tiles, self.max_tiles)
-            for (heat, pos, direction) in ns:
-                # Estimate priority of each and add to queue
-                est_dist = heat + taxicab_dist(pos, goal)
-                candidates.put(Cell(est_dist, heat, pos, direction, cell.path[:] + [cell.pos]))
-        print(f"A* couldn't find a path to {goal}")
+        # Estimate the heat left with the distance to the goal (every tile loses at least 1)
+        goal_xy = grid.xy(goal)
+        finder = ShortestPath(
+            lambda state: self.city.neighbours(state, self.min_tiles, self.max_tiles),
+            lambda state: taxicab_dist(grid.xy(state // 4), goal_xy),
+            paths=True,
+        )
+        found = finder.run(start, lambda state: state // 4 == goal)
+        if found is None:
+            print(f"A* couldn't find a path to {goal}")
+            return (None, [])
+        # We reached the goal!
+        print(f"Reached goal!")
+        return (finder.dist[found], [grid.xy(state // 4) for state in finder.path(found)[:-1]])
 
 def taxicab_dist(p1, p2):
-    d = p1 - p2
-    return abs(d.real) + abs(d.imag)
+    return abs(p1[0] - p2[0]) + abs(p1[1] - p2[1])
+
+
+def parse(data):
+    return (data.strip().split("\n"),)
 
 
 # Command-line execution:
@@ -126,10 +107,9 @@ if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
+        data = f.read().strip()
     
-    grid = data.split("\n")
+    (grid,) = parse(data)
     part1(grid)
     print("--------")
     part2(grid)
-    
\ No newline at end of file
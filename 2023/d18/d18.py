@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 
+import os
 import re
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.points import DIRECTIONS, EAST, NORTH, SOUTH, WEST, pack, unpack
 
 # https://adventofcode.com/2023/day/18
 
 """
 No original approach here, had to check reddit for how to even approach part2's size.
+Positions used to be complex, which made part 2's shoelace go through floats. Now part 1's trench is a set of packed
+ints from aoc.points, and the shoelace parts walk the vertices as plain (x, y) ints.
 """
 
 def part1(lines):
@@ -15,32 +22,32 @@ def part1(lines):
     # Alternatively: Add 1 tile to the edge of the shape, flood-fill outside from a corner, then take the difference as internal
     # (note: if there's a trapped corner bit of the outside, then that won't work.)
     # Rather than counting pipes for every cell, we could just fire beams to look for the first internal cell, then flood-fill internal from there
-    pos = 0j
+    pos = pack(0, 0)
     trench = set()
     trench.add(pos)
+    (up, down) = (DIRECTIONS[NORTH], DIRECTIONS[SOUTH])
     for line in lines:
         # Ignoring colour for part 1
         direction, steps, colour = line.split(" ")
         match direction:
             case "U":
-                off = -1j
+                off = up
             case "D":
-                off = 1j
+                off = down
             case "L":
-                off = -1
+                off = DIRECTIONS[WEST]
             case "R":
-                off = 1
+                off = DIRECTIONS[EAST]
         for _ in range(int(steps)):
             pos += off
             trench.add(pos)
-    print(f"Done digging trench, finished at {pos=}. {len(trench)=}")
+    print(f"Done digging trench, finished at {unpack(pos)}. {len(trench)=}")
     # pprint(trench, 1)
 
     # Fill interior of lagoon (Based off of d10 line-scanning for now)
     lagoon = set()
 
-    xs = [int(p.real) for p in trench]
-    ys = [int(p.imag) for p in trench]
+    (xs, ys) = zip(*map(unpack, trench))
     x_lo, x_hi = min(xs), max(xs)
     y_lo, y_hi = min(ys), max(ys)
     for y in range(y_lo, y_hi + 1):
@@ -49,30 +56,30 @@ def part1(lines):
         # in_wall = False
         wall_start_direction = None
         for x in range(x_lo, x_hi + 1):
-            pos = x + y * 1j
+            pos = pack(x, y)
             if pos in trench:
                 lagoon.add(pos)
                 if wall_start_direction is None:
                     walls_crossed += 1
                     # in_wall = True
-                    if (pos - 1j) in trench:
-                        if (pos + 1j) in trench:
+                    if (pos + up) in trench:
+                        if (pos + down) in trench:
                             # Simple vert piece |, not a long wall
                             # in_wall = False
                             pass
                         else:
                             # L piece, entered from north
-                            wall_start_direction = -1j
+                            wall_start_direction = up
                     else:
                         # F piece, entered from south
-                        wall_start_direction = 1j 
+                        wall_start_direction = down
             else:
                 # Ground tile
                 # If we were in a wall previously, the wall's ended now
                 if wall_start_direction is not None:
                     # in_wall = False
                     # It only counts as a wall crossed if the enter and exit direction don't match
-                    if (pos - 1 + wall_start_direction) in trench:
+                    if (pos + DIRECTIONS[WEST] + wall_start_direction) in trench:
                         # End dir matches start, it cancels out
                         walls_crossed += 1
                     wall_start_direction = None
@@ -81,33 +88,36 @@ def part1(lines):
                     lagoon.add(pos)
     # pprint(lagoon, 2)
     print(f"Part 1: Total volume = {len(lagoon)}")
+    return len(lagoon)
 
 def part1a(lines):
     # Rewrite of part 1 using 
     dir_offsets = {
-        "R": 1,  # R
-        "D": 1j,  # D
-        "L": -1,  # L
-        "U": -1j  # U
+        "R": unpack(DIRECTIONS[EAST]),
+        "D": unpack(DIRECTIONS[SOUTH]),
+        "L": unpack(DIRECTIONS[WEST]),
+        "U": unpack(DIRECTIONS[NORTH]),
     }
-    pos = 0j
-    trench = [pos]
+    (x, y) = (0, 0)
+    trench = [(x, y)]
     perimeter = 0
     # pattern = re.compile(r"#([\dA-Fa-f]{5})([\dA-Fa-f])")
     for line in lines:
         direction, steps, _ = line.split(" ")
-        off = dir_offsets[direction]
-        # print(f"{line=} {steps=} {off=}")
+        (dx, dy) = dir_offsets[direction]
+        # print(f"{line=} {steps=} {dx=} {dy=}")
 
-        pos = pos + off * int(steps)
-        perimeter += int(steps)
-        trench.append(pos)
-    print(f"Done digging trench, finished at {pos=}. {len(trench)=}, {perimeter=}")
+        steps = int(steps)
+        (x, y) = (x + dx * steps, y + dy * steps)
+        perimeter += steps
+        trench.append((x, y))
+    print(f"Done digging trench, finished at {(x, y)}. {len(trench)=}, {perimeter=}")
     # print(f"{trench=}")
     # print(f"{shoelace(trench)=}")
     result = shoelace(trench) + 1 + (perimeter // 2)
 
     print(f"Part 1a: {result=}")
+    return result
 
 def part2(lines):
     # Yeah... with these dimensions we won't be able to bruteforce it
@@ -115,47 +125,48 @@ def part2(lines):
     # Maths explanation of Pick's theorem + shoelace formula taken from reddit (this day has fully evaded me otherwise):
     #  https://www.reddit.com/r/adventofcode/comments/18l0qtr/comment/kdveugr/
     dir_offsets = {
-        "0": 1,  # R
-        "1": 1j,  # D
-        "2": -1,  # L
-        "3": -1j  # U
+        "0": unpack(DIRECTIONS[EAST]),  # R
+        "1": unpack(DIRECTIONS[SOUTH]),  # D
+        "2": unpack(DIRECTIONS[WEST]),  # L
+        "3": unpack(DIRECTIONS[NORTH]),  # U
     }
-    pos = 0j
-    trench = [pos]
+    (x, y) = (0, 0)
+    trench = [(x, y)]
     perimeter = 0
     pattern = re.compile(r"#([\dA-Fa-f]{5})([\dA-Fa-f])")
     for line in lines:
         m = pattern.search(line)
         steps = int(m.group(1), 16)
-        off = dir_offsets[m.group(2)]
+        (dx, dy) = dir_offsets[m.group(2)]
 
         perimeter += steps
-        pos = pos + off * steps
-        trench.append(pos)
-    print(f"Done digging trench, finished at {pos=}. {len(trench)=}, {perimeter=}")
+        (x, y) = (x + dx * steps, y + dy * steps)
+        trench.append((x, y))
+    print(f"Done digging trench, finished at {(x, y)}. {len(trench)=}, {perimeter=}")
     result = shoelace(trench) + 1 + (perimeter // 2)
 
     print(f"Part 2: {result=}")
+    return result
 
 
 def shoelace(vertices):
     # https://en.wikipedia.org/wiki/Shoelace_formula
+    # vertices are (x, y) ints, so it's exact however big the lagoon gets
     area = 0
-    for (p1, p2) in zip(vertices, vertices[1:]):
-        area += (p1.imag + p2.imag) * (p1.real - p2.real)
+    for ((x1, y1), (x2, y2)) in zip(vertices, vertices[1:]):
+        area += (y1 + y2) * (x1 - x2)
 
     return area // 2
 
 def pprint(cells, n = 1):
-    xs = [int(p.real) for p in cells]
-    ys = [int(p.imag) for p in cells]
+    (xs, ys) = zip(*map(unpack, cells))
     x_lo, x_hi = min(xs), max(xs)
     y_lo, y_hi = min(ys), max(ys)
     out_lines = []
     for y in range(y_lo, y_hi + 1):
         out_row = []
         for x in range(x_lo, x_hi + 1):
-            out_row.append("#" if (x + y * 1j) in cells else ".")
+            out_row.append("#" if pack(x, y) in cells else ".")
         out_lines.append("".join(out_row))
     out = "\n".join(out_lines)
     print(out)
@@ -163,16 +174,24 @@ def pprint(cells, n = 1):
     #     f.write(out)
 
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+PARTS = {
+    1: part1a,
+    2: part2,
+}
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
+        data = f.read().strip()
     
-    lines = data.split("\n")
+    (lines,) = parse(data)
     # part1(lines)
     part1a(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
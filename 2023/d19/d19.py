@@ -28,6 +28,7 @@ def part1():
 
     print(f"{len(accepted)=}")
     print(f"Part 1: {sum(sum(p.values()) for p in accepted)=}")
+    return sum(sum(p.values()) for p in accepted)
 
 def part2():
     # Count distinct combinations of ratings that will be accepted
@@ -61,6 +62,7 @@ def part2():
     # print(f"{accepted_ranges=}")
     out = sum(math.prod(hi - lo + 1 for (lo, hi) in p.values()) for p in accepted_ranges)
     print(f"Part 2: {out=}")
+    return out
 
 
 # Could use a dataclass or sth else, but this also lets us sum the ratings of the part
@@ -182,19 +184,27 @@ def parse_parts(ps: str) -> list[dict]:
     return parts
 
 
+# parse sets the workflows and parts globals, so it always has to run
+PARSE_CACHEABLE = False
+
+def parse(data):
+    workflow_data, part_data = data.strip().split("\n\n")
+    # Global workflows and parts (hope the values don't need to be modified)
+    global workflows, parts
+    workflows = parse_workflows(workflow_data)
+    parts = parse_parts(part_data)
+    return ()
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
-    
-    workflow_data, part_data = data.split("\n\n")
-    # Global workflows and parts (hope the values don't need to be modified)
-    workflows = parse_workflows(workflow_data)
-    parts = parse_parts(part_data)
+        data = f.read().strip()
     
+    parse(data)
+
     part1()
     print("--------")
     part2()
-    
\ No newline at end of file
@@ -38,6 +38,7 @@ def part1(lines):
             # Got through all the rounds without going over. This game is possible!
             total += i
     print(f"Part 1: The sum of IDs of possible games is: {total}")
+    return total
     
     
 def part2(lines):
@@ -59,6 +60,11 @@ def part2(lines):
         power = math.prod(min_cubes.get(colour) for colour in ["red", "green", "blue"])
         total += power
     print(f"Part 2: The sum of powers is: {total}")
+    return total
+
+
+def parse(data):
+    return (data.strip().split("\n"),)
 
 
 # Command-line execution:
@@ -68,9 +74,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
+    (lines,) = parse(data)
 
     part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
@@ -3,7 +3,12 @@
 import re
 import math
 from collections import deque
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/20
 
@@ -54,7 +59,10 @@ def part1(lines):
             r = modules[p_to].run(p)
             pulses.extend(r)
     
+    instrument.count("presses", 1000)
+    instrument.count("pulses", lows + highs)
     print(f"Part 1: {lows * highs=}")
+    return lows * highs
     
 def part2(lines):
     # Using https://dreampuf.github.io/GraphvizOnline/ and a manually-edited input file to explore the graph
@@ -107,8 +115,9 @@ def part2(lines):
                     print(f"button press {i} - {p_from} - high pulse")
                     target_presses[p_from] = i
                     if all(n in target_presses for n in target_nodes):
+                        instrument.count("presses", i)
                         print(f"Part 2: estimated button presses from lcm = {math.lcm(*target_presses.values())}")
-                        return
+                        return math.lcm(*target_presses.values())
                 # Attempt 1: If we sent a low value to rx, we're done!
                 if (p_to == "rx") and (not value):
                     raise StopIteration
@@ -119,7 +128,9 @@ def part2(lines):
                 pulses.extend(r)
     except StopIteration:
         pass
+    instrument.count("presses", i)
     print(f"Part 2: button presses = {i}")
+    return i
 
 class Broadcast:
     def __init__(self, name: str, targets: list[str]) -> None:
@@ -171,15 +182,23 @@ class Conjunction:
 
 
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+# part2 only knows the node names from my input
+PARTS = {
+    1: part1,
+}
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
+        data = f.read().strip()
     
-    lines = data.split("\n")
+    (lines,) = parse(data)
     part1(lines)
     print("--------")
     # part2(lines)
-    
\ No newline at end of file
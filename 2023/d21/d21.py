@@ -1,157 +1,121 @@
 #!/usr/bin/env python3
-from tqdm import tqdm
+import os
+import sys
+from functools import partial
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import cycles
+from aoc.grid import Grid
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/21
 
 """
-Would be good to revisit this one, as I don't have a good solution for part 2.
+Part 2 used to stop after 6 samples and say to plug them into wolfram alpha. Now the samples are extended in the
+code (see aoc.cycles.extend), which only relies on them growing like a polynomial, not on the exact schedule.
 """
 
-def part1(grid: list[str], steps: int = 64):
+def part1(grid: Grid, steps: int = 64):
     # If we have an even number of steps left, we waste 2 steps at a time to get back to the same cell
     # Since we can only move in cardinal directions, cells cannot be both odd and even (regardless of path!)
-    walkable = set()
-    for (y, row) in enumerate(grid):
-        for (x, c) in enumerate(row):
-            pos = x + y * 1j
-            match c:
-                case "S":
-                    start = pos
-                    walkable.add(pos)
-                case ".":
-                    walkable.add(pos)
+    start = grid.find("S")
+    rock = ord("#")
     result = set()
-    seen = set()
-    frontier = set([start])
+    seen = bytearray(len(grid))
+    seen[start] = 1
+    frontier = [start]
     for i in tqdm(range(steps + 1)):
         steps_left = steps - i
         # print(f"{i=}, {steps_left=}")
-        next_steps = set()
+        if (steps_left % 2) == 0:
+            result.update(frontier)
+        # New frontier = walkable neighbours we haven't seen yet
+        next_steps = []
         for p in frontier:
-            seen.add(p)
-            if (steps_left % 2) == 0:
-                result.add(p)
-            next_steps.update(n for n in neighbours(p) if n in walkable)
-        # New frontier = neighbours - seen
-        frontier = next_steps.difference(seen)
+            for n in grid.neighbours(p):
+                if not seen[n] and grid.cells[n] != rock:
+                    seen[n] = 1
+                    next_steps.append(n)
+        frontier = next_steps
 
-    pprint(walkable, result)
+    pprint(grid, result)
     
     print(f"Part 1: {len(result)=}")
+    return len(result)
 
-def part2(grid: list[str], steps: int = 64):
+def part2(grid: Grid, steps: int = 64, samples: int = 6):
     # Infinite map and much larger n_steps, brute-force isn't an option
     # Options (prob equivalent): 1. some sort of cycle detection
     # 2. maths?? -> Could mark the min_steps to reach any tile, and note the width/height of grid (if odd, then flip odd/even every copy?)
     # -> map is 131 x 131
     # 
-    
-    orig_height = len(grid)
-
-    walkable = set()
-    for (y, row) in enumerate(grid):
-        for (x, c) in enumerate(row):
-            pos = x + y * 1j
-            match c:
-                case "S":
-                    start = pos
-                    walkable.add(pos)
-                case ".":
-                    walkable.add(pos)
-    echo_offset = start.real
-    
-    # Get bounds of original grid. If pos lies outside the original bounds, can correct the "walkable" check for the corrseponding original tile
-    result = set()
-    seen = set()
-    frontier = set([start])
-    cycle_vs = []
-    for i in range(steps + 1):
+    # It's a bit of both: the row and column through S are clear, so every 131 steps the frontier reaches one more copy
+    # of the map in each direction, and the number of plots grows like a quadratic.
+    # Only steps with the same parity as `steps` count the right plots (the others count the ones we *can't* be on),
+    # so sample every 2 maps' worth of steps, lined up to finish exactly on `steps`, and extend the sequence from there.
+    period = 2 * grid.height
+    first = steps % period
+    (start_x, start_y) = grid.xy(grid.find("S"))
+
+    # Tile enough copies of the map around the original that we can never walk off the edge
+    max_steps = min(steps, first + (samples - 1) * period)
+    copies = max_steps // grid.height + 1
+    big = grid.tiled(2 * copies + 1)
+    start = big.index(start_x + copies * grid.width, start_y + copies * grid.height)
+    cells = big.cells
+    offsets = big.offsets
+    rock = ord("#")
+
+    result = 0
+    seen = bytearray(len(big))
+    seen[start] = 1
+    frontier = [start]
+    counts = []
+    for i in range(max_steps + 1):
         steps_left = steps - i
-        next_steps = set()
+        if (steps_left % 2) == 0:
+            result += len(frontier)
+        next_steps = []
         for p in frontier:
-            seen.add(p)
-            if (steps_left % 2) == 0:
-                result.add(p)
-            next_steps.update(n for n in neighbours(p) if matching_cell(orig_height, n) in walkable)
+            for off in offsets:
+                n = p + off
+                if not seen[n] and cells[n] != rock:
+                    seen[n] = 1
+                    next_steps.append(n)
         # New frontier = neighbours - seen
-        frontier = next_steps.difference(seen)
-        if ((steps_left % 2) == 0) and ((i - echo_offset) % orig_height == 0):
-            # For some reason I can't figure out, on odd-parity steps left (step 196, etc), the result is incorrect
-            # So instead keep only even-parity cycles (0, 2, 4) of 131 steps, and halve the number of cycles (n) in the function
-            print(f"Step {i}: {len(result)=}, {steps_left=}, parity {(steps_left % 2) == 0=}")
-            cycle_vs.append(len(result))
-            if len(cycle_vs) > 5:
-                print(f"Plug sequence {cycle_vs} into wolfram alpha to predict the final term")
-                # 2 (16204 - 43329 n + 28966 n^2), n = 202300 / 2 + 1 => 592723929260582
-                break
-
-    pprint2(walkable, result, orig_height, name="input_pprint.txt")
-    print(f"Part 2: {len(result)=}")
-
-def neighbours(pos):
-    return [pos + off for off in [1, -1, 1j, -1j]]
-
-def make_copies(grid: list[str], n: int):
-    n = n + 1
-    out = [line * n for line in grid] * n
-    # Makes multiple start points, but ok as long as we pprint with the right "reachable"?
-    # print(out)
-    return out
-
-def matching_cell(height: int, pos: complex):
-    # Also works with negative numbers!
-    return complex(pos.real % height, pos.imag % height)
-
-def pprint(walkable: set[complex], reachable: set[complex], *, name: str = None):
-    xs = {int(v.real) for v in walkable}
-    ys = {int(v.imag) for v in walkable}
-    x_lo, x_hi = min(xs), max(xs)
-    y_lo, y_hi = min(ys), max(ys)
-    out_lines = []
-    for y in range(y_lo, y_hi + 1):
-        out_row = []
-        for x in range(x_lo, x_hi + 1):
-            pos = x + y * 1j
-            if pos in reachable:
-                c = "O"
-            elif pos in walkable:
-                c = "."
-            else:
-                c = "#"
-            out_row.append(c)
-        out_lines.append("".join(out_row))
-    out = "\n".join(out_lines)
+        frontier = next_steps
+        if i % period == first:
+            # result is the answer for i steps
+            print(f"Step {i}: {result=}")
+            counts.append(result)
+
+    if max_steps < steps:
+        # The counts' second differences should have settled down by now (the first couple of samples can be off)
+        result = cycles.extend(counts, steps // period, confirm=3)
+
+    print(f"Part 2: {result=}")
+    return result
+
+def pprint(grid: Grid, reachable: set[int], *, name: str = None):
+    out = grid.copy()
+    for pos in reachable:
+        out[pos] = "O"
     # print(out)
+    # Only dump to a file when asked to: the runners call part1 from all over the place, and a stray
+    # input_pprint.txt in the working directory is easy to commit by accident
     if name is None:
-        name = "input_pprint.txt"
+        return
     with open(name, "w") as f:
-        f.write(out)
-
-
-def pprint2(walkable: set[complex], reachable: set[complex], h, *, name: str = None):
-    xs = {int(v.real) for v in walkable | reachable}
-    ys = {int(v.imag) for v in walkable | reachable}
-    x_lo, x_hi = min(xs), max(xs)
-    y_lo, y_hi = min(ys), max(ys)
-    out_lines = []
-    for y in range(y_lo, y_hi + 1):
-        out_row = []
-        for x in range(x_lo, x_hi + 1):
-            pos = x + y * 1j
-            if pos in reachable:
-                c = "O"
-            elif matching_cell(h, pos) in walkable:
-                c = "."
-            else:
-                c = "#"
-            out_row.append(c)
-        out_lines.append("".join(out_row))
-    out = "\n".join(out_lines)
-    # print(out)
-    if name is None:
-        name = "input_pprint.txt"
-    # with open(name, "w") as f:
-    #     f.write(out)
+        f.write(str(out))
+
+
+def parse(data):
+    return (Grid.parse(data),)
+
+PARTS = {
+    1: part1,
+    2: partial(part2, steps=26501365),
+}
 
 
 # Command-line execution:
@@ -159,11 +123,11 @@ if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
-        data = f.read().strip() 
-    grid = data.split("\n")
+        data = f.read().strip()
     
+    (grid,) = parse(data)
+
     part1(grid, 65)
     print("--------")
     # part2(grid, 65 + 131 * 202300)
     part2(grid, 26501365)
-    
\ No newline at end of file
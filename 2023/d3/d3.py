@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 import re
 import math
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc.grid import Grid
 
 
 # https://adventofcode.com/2023/day/3
@@ -9,23 +14,24 @@ Initial attempt+approach (cleaned up so part 1 and part 2 use the same map of pa
 
 """
 
-def main(lines):
+def find_parts(grid):
     # Let's make a grid of Numbers and Symbols.
-    # y-down, x-right, with the first symbol being (0, 0)
-    # We could use imaginary numbers for this, coords = x + yj
+    # Positions are flat indices into the grid (y * width + x), so part_at can be a plain list
     digit_pattern = re.compile(r"\d+")
     symbol_pattern = re.compile(r"[^.\d]")  # Not digit or literal .
-    grid = dict()
+    part_at = [None] * len(grid)
     all_parts = []
     all_symbols = []
     all_gears = []  # For part 2
 
     # Find all the Numbers and Symbols
-    for (y, l) in enumerate(lines):
+    for y in range(grid.height):
+        l = grid.row(y)
+        row_start = grid.index(0, y)
         # Find all the Symbols
         symbols = symbol_pattern.finditer(l)
         for m in symbols:
-            pos = m.start() + y * 1j
+            pos = row_start + m.start()
             all_symbols.append(pos)
             if m.group(0) == "*":
                 all_gears.append(pos)
@@ -36,26 +42,30 @@ def main(lines):
             num = Number(int(m.group(0)))
             all_parts.append(num)
             for x in range(*m.span()):
-                grid[x + y * 1j] = num
+                part_at[row_start + x] = num
     
     # Mark any number adjacent to a symbol as valid
-    valid_cells = set(c for s in all_symbols for c in adjacent_cells(s))
+    valid_cells = set(c for s in all_symbols for c in grid.neighbours8(s))
     for c in valid_cells:
-        part = grid.get(c, None)
+        part = part_at[c]
         if part is not None:
             part.valid = True
-    
+    return (all_parts, grid, part_at, all_gears)
+
+def part1(all_parts, grid, part_at, all_gears):
     print(f"Part 1: The sum of valid part numbers is:")
-    print(sum(p.value for p in all_parts if p.valid))
-    print("--------")
+    total = sum(p.value for p in all_parts if p.valid)
+    print(total)
+    return total
 
+def part2(all_parts, grid, part_at, all_gears):
     # Part 2: A gear is valid only if next to 2 valid parts
     gear_total = 0
     for g in all_gears:
         # Get unique (based on obj id) parts adjacent to the gear
         parts = set()
-        for pos in adjacent_cells(g):
-            part = grid.get(pos, None)
+        for pos in grid.neighbours8(g):
+            part = part_at[pos]
             if part is not None and part.valid:
                 parts.add(part)
         
@@ -64,6 +74,7 @@ def main(lines):
             gear_total += gear_ratio
 
     print(f"Part 2: Sum of gear ratios = {gear_total}")
+    return gear_total
     
 
 class Number:
@@ -71,8 +82,10 @@ class Number:
         self.value = value
         self.valid = False
 
-def adjacent_cells(pos):
-    return [pos + x + y * 1j for y in [-1, 0, 1] for x in [-1, 0, 1]]
+
+
+def parse(data):
+    return find_parts(Grid.parse(data))
 
 
 # Command-line execution:
@@ -82,7 +95,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
+    (all_parts, grid, part_at, all_gears) = parse(data)
 
-    main(lines)
-    
\ No newline at end of file
+    part1(all_parts, grid, part_at, all_gears)
+    print("--------")
+    part2(all_parts, grid, part_at, all_gears)
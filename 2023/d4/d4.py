@@ -19,6 +19,7 @@ def part1(lines):
             total += pow(2, wins - 1)
 
     print(f"Part 1: Total points of winning cards = {total}")
+    return total
     
     
 def part2(lines):
@@ -46,6 +47,11 @@ def part2(lines):
             scratchcards[c] += copies
 
     print(f"Part 2: Total number of scratchcards = {sum(scratchcards.values())}")
+    return sum(scratchcards.values())
+
+
+def parse(data):
+    return (data.strip().split("\n"),)
 
 
 # Command-line execution:
@@ -55,9 +61,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read()
     
-    lines = data.strip().split("\n")
+    (lines,) = parse(data)
 
     part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 import math
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/6
 
@@ -22,6 +27,7 @@ def part1(lines):
         print(total_wins[-1])
         
     print(f"Part 1: {math.prod(total_wins)} ")
+    return math.prod(total_wins)
     
 
 def part2(lines):
@@ -32,6 +38,7 @@ def part2(lines):
     # What's the number of ways we can beat the record of this race?
     wins = race(t, r)
     print(f"Part 2: {wins} ")
+    return wins
 
 
 # def race(t, record, speed=0):
@@ -48,9 +55,15 @@ def race(t, record):
             # We won't win any more rounds
             break
         speed += 1
+    # speed went up once for every speed tried, except the one we broke on (if we did)
+    instrument.count("speeds tried", min(speed + 1, t))
     return wins
 
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
@@ -58,9 +71,8 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
-    lines = data.strip().split("\n")
+    (lines,) = parse(data)
 
     # part1(lines)
     print("--------")
     part2(lines)
-    
\ No newline at end of file
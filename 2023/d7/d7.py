@@ -5,6 +5,12 @@ from collections import Counter
 # https://adventofcode.com/2023/day/7
 
 
+def part1(data):
+    return play_hands(data, jokers=False)
+
+def part2(data):
+    return play_hands(data, jokers=True)
+
 def play_hands(data, jokers):
     pattern = r"(.{5}) (\d+)"
     hands = [Hand(cards, bet, jokers) for (cards, bet) in re.findall(pattern, data)]
@@ -12,6 +18,7 @@ def play_hands(data, jokers):
     
     total_winnings = sum(rank * h.bet for (rank, h) in enumerate(ranked, 1))
     print(f"{total_winnings=}")
+    return total_winnings
     
 
 card_strength = {c: i for (i, c) in enumerate("23456789TJQKA", 2)}
@@ -75,16 +82,21 @@ class Hand:
         return self.score
 
 
+def parse(data):
+    return (data.strip(),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
+    
+    (data,) = parse(data)
 
     print("Part 1:")
-    play_hands(data, jokers=False)
+    part1(data)
     print("--------")
     print("Part 2:")
-    play_hands(data, jokers=True)
-    
\ No newline at end of file
+    part2(data)
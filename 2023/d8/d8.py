@@ -2,7 +2,12 @@
 import math
 import re
 from itertools import cycle
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/8
 """
@@ -31,7 +36,9 @@ def part1(data):
                 pos = fork[1]
             case _:
                 raise Exception(f"{pos=} {fork=} {step=}")
+    instrument.count("steps", i)
     print(f"Part 1: Took {i} steps")
+    return i
     
 
 def part2(data):
@@ -60,6 +67,7 @@ def part2(data):
             if p[2] == "Z":
                 print(f"{start_p} reached {p} in {steps} on turn {i}!")
                 lowest_turns.append(steps)
+                instrument.count("steps", steps)
                 break
             fork = maps[p]
             match turn:
@@ -70,6 +78,11 @@ def part2(data):
                 case _:
                     raise Exception(f"{pos=} {[maps[n] for n in pos]} {turn=}")
     print(f"Part 2: Took {math.lcm(*lowest_turns)} steps")
+    return math.lcm(*lowest_turns)
+
+
+def parse(data):
+    return (data.strip(),)
 
 
 # Command-line execution:
@@ -79,7 +92,7 @@ if __name__ == "__main__":
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
     
+    (data,) = parse(data)
     part1(data)
     print("--------")
     part2(data)
-    
\ No newline at end of file
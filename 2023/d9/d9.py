@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
-from tqdm import tqdm
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))  # For the shared aoc package
+from aoc import instrument
+from aoc.progress import tqdm
 
 # https://adventofcode.com/2023/day/9
 
 
+def part1(lines):
+    return extrapolate(lines)
+
+def part2(lines):
+    return extrapolate(lines, backwards=True)
+
 def extrapolate(lines, backwards=False):
     total = 0
     for l in tqdm(lines):
@@ -20,24 +31,31 @@ def extrapolate(lines, backwards=False):
         # Infer the next final value by adding up the final value of each delta
         inferred_v = sum(d[-1] for d in diffs)
         total += inferred_v
+        instrument.count("sequences")
+        # How many rows of differences it took to get to all 0s
+        instrument.gauge("difference rows", len(diffs))
 
     print(f"{backwards=} extrapolated value = {total}")
+    return total
     
 def deltas(ls):
     return [b - a for (a, b) in zip(ls, ls[1:])]
 
 
+def parse(data):
+    return (data.strip().split("\n"),)
+
+
 # Command-line execution:
 if __name__ == "__main__":
     import sys
     filename = sys.argv[1]
     with open(filename, encoding="utf-8") as f:
         data = f.read().strip()
-
-    lines = data.split("\n")
+    
+    (lines,) = parse(data)
     print("Part 1:")
-    extrapolate(lines)
+    part1(lines)
     print("--------")
     print("Part 2:")
-    extrapolate(lines, backwards=True)
-    
\ No newline at end of file
+    part2(lines)
@@ -0,0 +1,16 @@
+"""
+Shared tooling for running, timing and checking the Advent of Code solutions.
+
+Run things from the repo root, e.g. `python -m aoc.runner 2022`.
+"""
+
+
+def __getattr__(name):
+    # REPO_ROOT is only made when it's first used. Importing pathlib takes ~10ms, which the solutions
+    # that just want aoc.grid or aoc.progress would otherwise pay on every start.
+    if name == "REPO_ROOT":
+        from pathlib import Path
+        global REPO_ROOT
+        REPO_ROOT = Path(__file__).resolve().parent.parent
+        return REPO_ROOT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Solve one day for lots of inputs at once, e.g. to check a rewrite against a corpus of inputs.
+
+Inputs can be files, folders (every file in them) or glob patterns. They're spread over a pool of worker
+processes, one input per task (or --chunksize inputs, to cut down on the back-and-forth for lots of tiny inputs).
+Each worker imports the day once and keeps it (see aoc.daemon.Solver), so module-level setup is only paid once
+per worker, not once per input.
+Results are printed as JSON lines as they finish (so not in input order), and a summary of throughput
+and per-input latency percentiles goes to stderr at the end.
+
+Run like:
+python -m aoc.batch 2022 16 corpus/2022_16/ --jobs 8
+python -m aoc.batch 2023 17 'big/*.txt' -o results.jsonl
+"""
+
+import argparse
+import glob
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import memo, runner
+from aoc.daemon import Solver
+
+# Set up in each worker by start_worker()
+solver = None
+
+
+def find_inputs(patterns):
+    # Files, every file in a folder, or glob matches, in order and without repeats
+    found = {}
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        elif os.path.exists(pattern):
+            paths = [pattern]
+        else:
+            paths = sorted(glob.glob(pattern))
+        for path in paths:
+            if os.path.isfile(path):
+                found[os.path.abspath(path)] = None
+    return list(found)
+
+def start_worker(year, day):
+    global solver
+    days = runner.discover([year], [day])
+    # Every input's different, so there's nothing to gain from keeping parsed inputs
+    solver = Solver(days, keep_parsed=0)
+
+def solve_chunk(year, day, paths):
+    results = []
+    for path in paths:
+        start = time.perf_counter()
+        # The next input's different, so drop anything memoised for this one straight away
+        with memo.scope():
+            result = solver.solve({"year": year, "day": day, "input": path})
+        result["latency"] = time.perf_counter() - start
+        result["input"] = path
+        # The printed output of thousands of runs is too much to keep
+        del result["output"]
+        results.append(result)
+    return results
+
+def percentile(sorted_values, p):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return None
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+def run_batch(year, day, paths, jobs=None, chunksize=1):
+    # Yields results as tasks finish. With a chunksize over 1, a chunk's results only come back once it's all done.
+    jobs = jobs or os.cpu_count()
+    chunks = [paths[i:i + chunksize] for i in range(0, len(paths), chunksize)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=start_worker, initargs=(year, day)) as pool:
+        futures = [pool.submit(solve_chunk, year, day, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+def summarise(results, wall):
+    latencies = sorted(r["latency"] for r in results)
+    summary = {
+        "inputs": len(results),
+        "errors": sum(r["status"] != "ok" for r in results),
+        "wall": wall,
+        "inputs_per_second": len(results) / wall if wall > 0 else None,
+    }
+    for p in (50, 90, 99, 100):
+        summary[f"p{p}"] = percentile(latencies, p)
+    return summary
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve one day for many inputs in parallel, printing results as JSON lines")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    parser.add_argument("inputs", nargs="+", help="Input files, folders of inputs or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("-c", "--chunksize", type=int, default=1, help="Inputs per task sent to a worker (default: 1, so every result is printed as soon as it's ready)")
+    parser.add_argument("-o", "--output", help="Write the JSON lines here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if not runner.discover([args.year], [args.day]):
+        parser.error(f"No solution for {args.year} day {args.day}")
+    paths = find_inputs(args.inputs)
+    if not paths:
+        parser.error("No inputs found")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in run_batch(args.year, args.day, paths, args.jobs, args.chunksize):
+            results.append(result)
+            out.write(json.dumps(result, default=repr) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    summary = summarise(results, time.perf_counter() - start)
+
+    print(f"{summary['inputs']} inputs ({summary['errors']} errors) in {summary['wall']:.2f}s, {summary['inputs_per_second']:.1f} inputs/s", file=sys.stderr)
+    print("Latency: " + ", ".join(f"p{p} {summary[f'p{p}'] * 1000:.1f}ms" for p in (50, 90, 99)) + f", max {summary['p100'] * 1000:.1f}ms", file=sys.stderr)
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark one day against generated inputs of increasing size, to find where it stops scaling.
+
+For every (size, magnitude) combination we generate an input (see aoc.generators), then solve it in a
+fresh process and report the parse/part times and peak memory. Runs are one at a time so they don't
+fight over the CPU, and each one is killed if it goes over --timeout seconds or --max-memory MiB,
+which is usually where the interesting cliffs are.
+
+Run like:
+python -m aoc.bench 2022 4 --sizes 1000 10000 --magnitudes 100 1000000
+python -m aoc.bench 2023 17 --scales 1 10 100
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import queue
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from aoc import REPO_ROOT, notebooks, runner
+from aoc.generators import GENERATORS, generate, scaled_size
+
+COLUMNS = ["size", "magnitude", "status", "parse", "part1", "part2", "total", "peak_rss_kb"]
+
+
+def solution_path(year, day):
+    path = REPO_ROOT / str(year) / f"d{day}" / f"d{day}.py"
+    return path if path.exists() else path.with_suffix(".ipynb")
+
+def _solve(results, year, day, path, input_path, max_memory):
+    # Runs in a fresh process
+    if max_memory is not None:
+        limit = max_memory * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if path.suffix == ".ipynb":
+        results.put(notebooks.run_notebook(year, day, path, input_path))
+    else:
+        results.put(runner.run_day(year, day, path, input_path))
+
+def solve(year, day, input_path, timeout=None, max_memory=None):
+    # Solve one input in a fresh process, giving up after timeout seconds
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_solve, args=(results, year, day, solution_path(year, day), input_path, max_memory))
+    process.start()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        try:
+            result = results.get(timeout=0.1)
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                # Killed before it could report back (e.g. by the OOM killer)
+                result = {"status": "crashed", "error": f"exit code {process.exitcode}"}
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                process.kill()
+                result = {"status": "timeout"}
+                break
+    process.join()
+    if result["status"] == "error" and result.get("error", "").startswith("MemoryError"):
+        result["status"] = "out of memory"
+    if "total" not in result and result["status"] == "ok":
+        # Notebooks already have a total
+        result["total"] = sum(result.get(k) or 0 for k in ("parse", "part1", "part2"))
+    return result
+
+def sweep(year, day, sizes, magnitudes=(None,), seed=0, timeout=None, max_memory=None):
+    # Yields one result per (size, magnitude), smallest first
+    with tempfile.TemporaryDirectory() as tmp:
+        for (size, magnitude) in itertools.product(sizes, magnitudes):
+            input_path = Path(tmp) / f"{size}_{magnitude}.txt"
+            input_path.write_text(generate(year, day, size, seed, magnitude=magnitude), encoding="utf-8")
+            result = solve(year, day, input_path, timeout, max_memory)
+            result.update(size=size, magnitude=magnitude)
+            yield result
+
+def format_row(result):
+    row = []
+    for c in COLUMNS:
+        v = result.get(c)
+        row.append("" if v is None else f"{v:.4f}" if isinstance(v, float) else str(v))
+    return row
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time one day against generated inputs of increasing size")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    sizes = parser.add_mutually_exclusive_group()
+    sizes.add_argument("-n", "--sizes", nargs="+", type=int, help="Side lengths (grids) or counts (ranges)")
+    sizes.add_argument("--scales", nargs="+", type=float, default=[1, 10, 100], help="Sizes relative to the real input")
+    parser.add_argument("-m", "--magnitudes", nargs="+", type=int, default=[None], help="Largest numbers in the input (range days only)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds before giving up on one input")
+    parser.add_argument("--max-memory", type=int, help="MiB of memory before giving up on one input")
+    parser.add_argument("-f", "--format", choices=["table", "json", "csv"], default="table")
+    args = parser.parse_args(argv)
+
+    if (args.year, args.day) not in GENERATORS:
+        parser.error(f"No generator for {args.year} day {args.day}")
+    sizes = args.sizes or [scaled_size(args.year, args.day, s) for s in args.scales]
+
+    results = []
+    for result in sweep(args.year, args.day, sizes, args.magnitudes, args.seed, args.timeout, args.max_memory):
+        results.append(result)
+        if args.format == "table":
+            # Print as we go, the big sizes can take a while
+            if len(results) == 1:
+                print("  ".join(c.rjust(12) for c in COLUMNS))
+            print("  ".join(c.rjust(12) for c in format_row(result)), flush=True)
+    if args.format == "json":
+        json.dump(results, sys.stdout, indent=2, default=repr)
+        print()
+    elif args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""
+Opt-in cache of parsed inputs, so repeat runs don't pay for parsing again.
+
+Entries are keyed by the SHA-256 of the input, plus the "parser version": the hash of the solution module's
+source (or its PARSE_VERSION, if it sets one). Editing a solution file throws away its old entries.
+The parsed args are stored as a pickle, so a day only gets cached if its parsed input can be pickled
+(e.g. 2022 day 11's monkeys hold lambdas, so they're parsed every time).
+Days whose parse has side effects (setting globals) opt out with PARSE_CACHEABLE = False.
+
+Run like:
+python -m aoc.cache --info
+python -m aoc.cache --clear
+"""
+
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from aoc import REPO_ROOT
+from aoc.loader import Input
+
+CACHE_DIR = REPO_ROOT / ".aoc_cache"
+
+
+def parser_version(module):
+    version = getattr(module, "PARSE_VERSION", None)
+    if version is not None:
+        return str(version)
+    with open(module.__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def cache_key(module, data, version=None):
+    # version is parser_version(module), for callers that have already worked it out (it reads the whole source file)
+    h = hashlib.sha256()
+    # Pickled classes are looked up by module name, so entries from `python dN.py` (__main__) and the runner can't be shared
+    for part in (module.__name__, version or parser_version(module)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    if isinstance(data, Input):
+        # Hashing the mapping reads the file a page at a time, without copying it
+        h.update(data.view)
+    else:
+        h.update(data.encode("utf-8") if isinstance(data, str) else data)
+    return h.hexdigest()
+
+def cached_parse(module, data, cache_dir=CACHE_DIR):
+    # Same as module.parse(data), but loads the result from the cache if we've parsed this input before
+    if not getattr(module, "PARSE_CACHEABLE", True):
+        return module.parse(data)
+
+    path = cache_dir / f"{cache_key(module, data)}.pickle"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # A broken or stale entry, parse from scratch and overwrite it
+        pass
+
+    parsed = module.parse(data)
+    try:
+        blob = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+        # Can't be pickled, so don't cache it
+        return parsed
+
+    # Write then rename, so parallel runs never see half an entry
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (fd, tmp_path) = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(blob)
+    os.replace(tmp_path, path)
+    return parsed
+
+def clear(cache_dir=CACHE_DIR):
+    removed = 0
+    for path in cache_dir.glob("*.pickle"):
+        path.unlink()
+        removed += 1
+    return removed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or clear the parsed input cache")
+    parser.add_argument("--clear", action="store_true", help="Delete every cache entry")
+    parser.add_argument("--info", action="store_true", help="Show the number and total size of entries")
+    args = parser.parse_args(argv)
+
+    if args.clear:
+        print(f"Removed {clear()} entries from {CACHE_DIR}")
+    if args.info or not args.clear:
+        entries = list(CACHE_DIR.glob("*.pickle"))
+        print(f"{len(entries)} entries, {sum(p.stat().st_size for p in entries)} bytes in {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
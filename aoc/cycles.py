@@ -0,0 +1,94 @@
+"""
+Skipping ahead in simulations that eventually repeat, for puzzles that ask about step 1_000_000_000.
+
+A simulation is a starting state and a step function (state -> next state, which can be the same object
+changed in place). A fingerprint function boils a state down to something hashable that's equal exactly when two
+states will carry on the same way. find_cycle() steps until a fingerprint comes round again, keeping only the
+fingerprints (each with the step it was seen at), never the states. For a big state like a whole grid,
+fingerprint with digest() so each one is 16 bytes rather than a copy of the grid.
+
+Then either:
+- advance() for the state itself after n steps: once the cycle's found, only (n - steps so far) % length more
+  steps are left to run
+- extrapolate() for a number that goes up by the same amount every time round the cycle (like the height of a
+  tower), recorded at every step so the answer can be read off the first time round
+
+Some puzzles repeat in how they grow rather than in their state (the area reachable in a repeating map grows like
+a polynomial). For those, sample the value at the period and extend() the sequence: it keeps differencing until
+the differences are constant, then jumps straight to the nth term.
+
+Use like:
+grid = cycles.advance(grid, spin, 1_000_000_000, lambda g: cycles.digest(g.cells))
+height = cycles.extrapolate(tower, Tower.drop, 10 ** 12, Tower.fingerprint, lambda t: t.height)
+"""
+
+import collections
+import hashlib
+import math
+
+Cycle = collections.namedtuple("Cycle", ["start", "length"])
+
+
+def digest(data) -> bytes:
+    # A 16-byte fingerprint of anything bytes-like. It's a proper hash, so two different states won't collide
+    # (the odds are about the same as for a 128-bit UUID), unlike Python's hash().
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+def find_cycle(state, step, fingerprint, limit=None, value=None):
+    # Step until a state's fingerprint matches an earlier one's, or until limit steps if that's sooner.
+    # Returns (cycle, state, values):
+    # - cycle is Cycle(start, length): the state after start + length steps carries on like the one after start
+    #   steps. It's None if limit steps went by without a repeat.
+    # - state is the latest state (after start + length steps, or limit steps)
+    # - values is value(state) after each of those steps, from step 0 (or None without a value function)
+    seen = {fingerprint(state): 0}
+    values = [value(state)] if value is not None else None
+    i = 0
+    while limit is None or i < limit:
+        state = step(state)
+        i += 1
+        if values is not None:
+            values.append(value(state))
+        key = fingerprint(state)
+        start = seen.get(key)
+        if start is not None:
+            return (Cycle(start, i - start), state, values)
+        seen[key] = i
+    return (None, state, values)
+
+def advance(state, step, n, fingerprint):
+    # The state after n steps
+    (cycle, state, _) = find_cycle(state, step, fingerprint, limit=n)
+    if cycle is not None:
+        for _ in range((n - cycle.start - cycle.length) % cycle.length):
+            state = step(state)
+    return state
+
+def extrapolate(state, step, n, fingerprint, value):
+    # value(state after n steps), where the value changes by the same amount every time round the cycle
+    (cycle, _, values) = find_cycle(state, step, fingerprint, limit=n, value=value)
+    if n < len(values):
+        return values[n]
+    (laps, offset) = divmod(n - cycle.start, cycle.length)
+    per_lap = values[cycle.start + cycle.length] - values[cycle.start]
+    return values[cycle.start + offset] + laps * per_lap
+
+def extend(values, n, confirm=2):
+    # The nth term (counting from 0) of a sequence whose differences (or differences of differences, and so on)
+    # end up constant, i.e. a polynomial in n, given its first few terms.
+    # The constant differences have to hold for `confirm` terms in a row, or it's a ValueError (sample some more).
+    if n < len(values):
+        return values[n]
+    # Each row of differences, keeping just its last term
+    lasts = []
+    row = list(values)
+    while True:
+        if len(row) < confirm:
+            raise ValueError(f"{len(values)} terms aren't enough to see the differences settle down")
+        lasts.append(row[-1])
+        if all(x == row[-1] for x in row[-confirm:]):
+            break
+        row = [b - a for (a, b) in zip(row, row[1:])]
+    # Newton's formula, counting forwards from the last term we have
+    t = n - (len(values) - 1)
+    return sum(math.comb(t + j - 1, j) * last for (j, last) in enumerate(lasts))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+
+"""
+A long-running solver that keeps every day's module imported, so a request only pays for the solving.
+
+`serve` imports all the .py days up front, then answers requests on a UNIX domain socket, one at a time
+(the days keep state in module globals, so two solves at once would trample each other).
+Requests and responses are JSON, one per line, and a connection can send as many requests as it likes:
+  {"year": 2022, "day": 16, "input": "/path/to/input.txt"}   (or "data": "<the input text>" instead of "input")
+  {"year": 2022, "day": 16, "part": 2, "data": "..."}          (just the one part)
+  {"command": "stats"} or {"command": "shutdown"}
+Each response is like one of the runner's results: status, answers, parse/part times and their output.
+
+Parsed inputs are kept in memory (the most recent --keep-parsed of them) and reused when the same input comes
+back. Days with PARSE_CACHEABLE = False set globals while parsing (like 2022 day 16's distances), so for those
+only the latest input is remembered, and its globals stay warm until a different input comes in.
+When a day gets a different input from last time, its functools (and aoc.memo) caches are cleared, since they're
+often only valid for one input. The same input again keeps them warm, and "stats" shows how big they've got.
+
+Run like:
+python -m aoc.daemon serve 2022 2023 &
+python -m aoc.daemon solve 2022 16 2022/d16/input.txt
+python -m aoc.daemon stop
+"""
+
+import argparse
+import collections
+import copy
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+
+from aoc import REPO_ROOT, instrument, memo, runner
+from aoc.cache import cache_key, parser_version
+from aoc.loader import Input
+
+SOCKET_PATH = REPO_ROOT / ".aoc_daemon.sock"
+
+
+class Solver:
+    def __init__(self, days, keep_parsed=64):
+        # days are (year, day, path), as from runner.discover()
+        self.modules = {}
+        # Each module's parser version (the hash of its source), worked out once here rather than re-reading
+        # and re-hashing the source file for every request
+        self.versions = {}
+        self.import_errors = {}
+        for (year, day, path) in days:
+            try:
+                self.modules[(year, day)] = runner.load_module(path)
+                self.versions[(year, day)] = parser_version(self.modules[(year, day)])
+            except Exception as e:
+                self.import_errors[(year, day)] = f"{type(e).__name__}: {e}"
+        self.keep_parsed = keep_parsed
+        self.parsed = collections.OrderedDict()  # cache key: parsed args, least recently used first
+        self.last_input = {}  # (year, day): cache key of the input it last solved
+        self.requests = 0
+        self.reused = 0
+
+    def parse(self, year, day, module, data):
+        # Returns (args, seconds, output), reusing an earlier parse of the same input if we can
+        if self.keep_parsed == 0:
+            # Nothing's kept, so there's no need to hash the input to find it again. Every input counts as a new one.
+            for f in instrument.cached_functions(module).values():
+                f.cache_clear()
+            self.last_input.pop((year, day), None)
+            return runner.timed(module.parse, data)
+        key = cache_key(module, data, self.versions[(year, day)])
+        if self.last_input.get((year, day)) != key:
+            # The caches (and any globals) are from a different input
+            for f in instrument.cached_functions(module).values():
+                f.cache_clear()
+        reusable = getattr(module, "PARSE_CACHEABLE", True) or self.last_input.get((year, day)) == key
+        self.last_input[(year, day)] = key
+        if reusable and key in self.parsed:
+            self.parsed.move_to_end(key)
+            self.reused += 1
+            return (self.parsed[key], 0.0, "")
+
+        (args, elapsed, output) = runner.timed(module.parse, data)
+        self.parsed[key] = args
+        while len(self.parsed) > self.keep_parsed:
+            self.parsed.popitem(last=False)
+        return (args, elapsed, output)
+
+    def solve(self, request):
+        # Like runner.run_day, but with the module already loaded. Never raises.
+        (year, day) = (request.get("year"), request.get("day"))
+        result = {"year": year, "day": day, "status": "ok", "output": {}}
+        self.requests += 1
+        try:
+            if (year, day) in self.import_errors:
+                raise ImportError(self.import_errors[(year, day)])
+            module = self.modules.get((year, day))
+            if module is None:
+                raise KeyError(f"No solution for {year} day {day}")
+            if "data" not in request:
+                data = runner.read_input(module, request["input"])
+            elif getattr(module, "PARSE_MAPPED", False):
+                data = Input.from_text(request["data"])
+            else:
+                data = request["data"]
+            (args, result["parse"], result["output"]["parse"]) = self.parse(year, day, module, data)
+            parts = runner.get_parts(module)
+            if request.get("part") is not None:
+                parts = {request["part"]: parts[request["part"]]}
+            for (n, part) in parts.items():
+                # The kept args have to survive for the next request too
+                (answer, result[f"part{n}"], result["output"][f"part{n}"]) = runner.timed(part, *copy.deepcopy(args))
+                if answer is not None:
+                    result.setdefault("answers", {})[f"part{n}"] = answer
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    def stats(self):
+        return {"modules": len(self.modules), "requests": self.requests, "parses_reused": self.reused, "parsed_kept": len(self.parsed), "caches": memo.stats()}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = {"status": "error", "error": f"Bad request: {e}"}
+            else:
+                match request.get("command"):
+                    case "stats":
+                        response = self.server.solver.stats()
+                    case "shutdown":
+                        response = {"status": "stopping"}
+                        self.server.stopping = True
+                    case _:
+                        start = time.perf_counter()
+                        response = self.server.solver.solve(request)
+                        response["wall"] = time.perf_counter() - start
+            self.wfile.write(json.dumps(response, default=repr).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.UnixStreamServer):
+    def __init__(self, path, solver):
+        self.solver = solver
+        self.stopping = False
+        super().__init__(str(path), Handler)
+
+
+def serve(path=SOCKET_PATH, years=runner.DEFAULT_YEARS, keep_parsed=64):
+    solver = Solver(runner.discover(years), keep_parsed)
+    for ((year, day), error) in sorted(solver.import_errors.items()):
+        print(f"{year} day {day} failed to import: {error}", file=sys.stderr)
+    if os.path.exists(path):
+        # Left over from a daemon that didn't stop cleanly (if one's still running, this steals its socket)
+        os.unlink(path)
+    with Server(path, solver) as server:
+        print(f"Serving {len(solver.modules)} days on {path}", file=sys.stderr, flush=True)
+        try:
+            # One connection at a time, until a handler sees a shutdown request
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            os.unlink(path)
+
+def connect(path=SOCKET_PATH):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(str(path))
+    return sock
+
+def request(sock, message):
+    # Send one request on a connected socket and wait for its response
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+    buffer = b""
+    while not buffer.endswith(b"\n"):
+        chunk = sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("The daemon closed the connection")
+        buffer += chunk
+    return json.loads(buffer)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Keep the solutions loaded in a background process and solve inputs on request")
+    parser.add_argument("-s", "--socket", default=SOCKET_PATH, help="Path of the UNIX socket")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Start the daemon (in the foreground)")
+    serve_parser.add_argument("years", nargs="*", type=int, default=runner.DEFAULT_YEARS)
+    serve_parser.add_argument("--keep-parsed", type=int, default=64, help="How many parsed inputs to keep in memory")
+    solve_parser = commands.add_parser("solve", help="Solve an input with a running daemon")
+    solve_parser.add_argument("year", type=int)
+    solve_parser.add_argument("day", type=int)
+    solve_parser.add_argument("input", help="Input file, or - for stdin")
+    solve_parser.add_argument("-p", "--part", type=int, help="Only run this part")
+    commands.add_parser("stats", help="Show what a running daemon has done")
+    commands.add_parser("stop", help="Stop a running daemon")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.years, args.keep_parsed)
+        return 0
+    if args.command == "solve":
+        message = {"year": args.year, "day": args.day, "part": args.part}
+        if args.input == "-":
+            message["data"] = sys.stdin.read()
+        else:
+            message["input"] = os.path.abspath(args.input)
+    else:
+        message = {"command": "shutdown" if args.command == "stop" else "stats"}
+    with connect(args.socket) as sock:
+        response = request(sock, message)
+    json.dump(response, sys.stdout, indent=2)
+    print()
+    return 1 if response.get("status") == "error" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
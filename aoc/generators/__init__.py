@@ -0,0 +1,35 @@
+"""
+Seeded generators for synthetic inputs of any size, to see how the solutions scale.
+
+The grid generators take a side length, the range generators take a count (of lines/ranges/sensors)
+and optionally the magnitude of the numbers in them.
+
+Run like:
+python -m aoc.generators 2022 8 --scale 100 --seed 1 -o big.txt
+python -m aoc.generators 2025 5 --size 1000 --magnitude 1000000000000
+"""
+
+import math
+import random
+
+from aoc.generators import grids, ranges
+
+# (year, day): (generator, size of the real input)
+GENERATORS = {**grids.GENERATORS, **ranges.GENERATORS}
+
+
+def scaled_size(year, day, scale):
+    # Scale the real input's size by number of cells/items (so grids scale by the square root)
+    (generator, official) = GENERATORS[(year, day)]
+    if generator.__module__ == grids.__name__:
+        scale = math.sqrt(scale)
+    return max(1, round(official * scale))
+
+def generate(year, day, size=None, seed=0, scale=None, magnitude=None):
+    # Either give a size directly, or a scale relative to the real input
+    (generator, official) = GENERATORS[(year, day)]
+    if size is None:
+        size = official if scale is None else scaled_size(year, day, scale)
+    if magnitude is not None:
+        return generator(random.Random(seed), size, magnitude)
+    return generator(random.Random(seed), size)
@@ -0,0 +1,31 @@
+import argparse
+import sys
+
+from aoc.generators import GENERATORS, generate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m aoc.generators", description="Generate a synthetic input")
+    parser.add_argument("year", type=int)
+    parser.add_argument("day", type=int)
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("-n", "--size", type=int, help="Side length of the grid, or number of ranges")
+    size.add_argument("--scale", type=float, help="Size relative to the real input (e.g. 100 for 100x as many cells)")
+    parser.add_argument("-m", "--magnitude", type=int, help="Largest number in the input (range days only)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="File to write to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if (args.year, args.day) not in GENERATORS:
+        known = ", ".join(f"{y} {d}" for (y, d) in sorted(GENERATORS))
+        parser.error(f"No generator for {args.year} day {args.day}. Known: {known}")
+    text = generate(args.year, args.day, args.size, args.seed, args.scale, args.magnitude)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Generators for the grid-shaped days.
+
+Every generator takes a seeded random.Random and a side length n, and returns the input text.
+They produce puzzles that follow the same rules as the real inputs (e.g. there's always a path
+from S to E), but they're not trying to look like the real inputs beyond that.
+"""
+
+from collections import deque
+
+OFFSETS = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # NESW
+
+
+def join(grid):
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+def multi_source_bfs(rng, n, sources):
+    # Distance to (and index of) the nearest source for every cell, with random tie-breaking
+    dist = [[None] * n for _ in range(n)]
+    owner = [[None] * n for _ in range(n)]
+    frontier = deque()
+    for (i, (x, y)) in enumerate(sources):
+        dist[y][x], owner[y][x] = 0, i
+        frontier.append((x, y))
+    while frontier:
+        (x, y) = frontier.popleft()
+        offsets = OFFSETS[:]
+        rng.shuffle(offsets)
+        for (dx, dy) in offsets:
+            (x1, y1) = (x + dx, y + dy)
+            if 0 <= x1 < n and 0 <= y1 < n and dist[y1][x1] is None:
+                dist[y1][x1] = dist[y][x] + 1
+                owner[y1][x1] = owner[y][x]
+                frontier.append((x1, y1))
+    return (dist, owner)
+
+def maze(rng, n):
+    # A perfect maze (randomised DFS), with passages on the odd coordinates and walls around the outside
+    n = n if n % 2 else n + 1
+    grid = [["#"] * n for _ in range(n)]
+    start = (1, n - 2)
+    grid[start[1]][start[0]] = "."
+    stack = [start]
+    while stack:
+        (x, y) = stack[-1]
+        options = [(x + 2 * dx, y + 2 * dy, dx, dy) for (dx, dy) in OFFSETS
+                   if 0 < x + 2 * dx < n - 1 and 0 < y + 2 * dy < n - 1 and grid[y + 2 * dy][x + 2 * dx] == "#"]
+        if not options:
+            stack.pop()
+            continue
+        (x1, y1, dx, dy) = rng.choice(options)
+        grid[y + dy][x + dx] = "."
+        grid[y1][x1] = "."
+        stack.append((x1, y1))
+    return grid
+
+
+# 2022 day 8: digit heights
+def trees(rng, n):
+    return join([[str(rng.randrange(10)) for _ in range(n)] for _ in range(n)])
+
+# 2022 day 12: lowercase heights, with a climbable path from S to E
+def heightmap(rng, n):
+    if n < 26:
+        raise ValueError("The heightmap needs to be at least 26 wide to climb from a to z")
+    grid = [[chr(ord("a") + rng.randrange(26)) for _ in range(n)] for _ in range(n)]
+    # Carve a wandering (non-crossing) path from the left edge to the right edge, then climb from a to z along it
+    (x, y) = (0, rng.randrange(n))
+    path = [(x, y)]
+    visited = {(x, y)}
+    while x < n - 1:
+        (dx, dy) = rng.choice([(1, 0), (1, 0), (0, 1), (0, -1)])
+        if 0 <= y + dy < n and (x + dx, y + dy) not in visited:
+            (x, y) = (x + dx, y + dy)
+            path.append((x, y))
+            visited.add((x, y))
+    for (i, (x, y)) in enumerate(path):
+        grid[y][x] = chr(ord("a") + i * 25 // (len(path) - 1))
+    (sx, sy), (ex, ey) = path[0], path[-1]
+    grid[sy][sx] = "S"
+    grid[ey][ex] = "E"
+    return join(grid)
+
+# 2022 day 14: horizontal/vertical rock paths below the sand source at 500,0
+def rock_paths(rng, n):
+    lines = []
+    max_len = max(3, n // 10)
+    for _ in range(n):
+        (x, y) = (500 + rng.randint(-n // 2, n // 2), rng.randint(2, n))
+        points = [(x, y)]
+        for i in range(rng.randint(1, 5)):
+            step = rng.randint(1, max_len) * rng.choice((-1, 1))
+            if i % 2:
+                y = min(n, max(2, y + step))
+            else:
+                x += step
+            points.append((x, y))
+        lines.append(" -> ".join(f"{x},{y}" for (x, y) in points))
+    return "\n".join(lines) + "\n"
+
+# 2022 day 23: a blob of elves
+def elves(rng, n):
+    return join([["#" if rng.random() < 0.5 else "." for _ in range(n)] for _ in range(n)])
+
+# 2023 day 10: one big loop of pipes with S on it, surrounded by junk pipes
+def pipe_loop(rng, n):
+    # Grow a random region of cells, only adding cells that keep its outline a single simple loop:
+    # the new cell's occupied neighbours (8 around it, in order) have to form exactly one run.
+    cells = n - 1
+    ring = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
+    region = set()
+    start = (cells // 2, cells // 2)
+    region.add(start)
+    frontier = [(start[0] + dx, start[1] + dy) for (dx, dy) in OFFSETS]
+    target = cells * cells * 2 // 5
+    while frontier and len(region) < target:
+        # Pop a random cell (swapping it to the end first, so the pop is cheap)
+        i = rng.randrange(len(frontier))
+        (frontier[i], frontier[-1]) = (frontier[-1], frontier[i])
+        (x, y) = frontier.pop()
+        if (x, y) in region or not (0 <= x < cells and 0 <= y < cells):
+            continue
+        occupied = [(x + dx, y + dy) in region for (dx, dy) in ring]
+        runs = sum(1 for i in range(8) if occupied[i] and not occupied[i - 1])
+        if runs != 1:
+            continue
+        region.add((x, y))
+        frontier.extend((x + dx, y + dy) for (dx, dy) in OFFSETS)
+
+    # The loop runs along the corners of the region's cells. Corner (x, y) is the top-left of cell (x, y).
+    def inside(x, y):
+        return (x, y) in region
+
+    def edges(x, y):
+        # Directions out of corner (x, y) that run along the outline (one side in the region, the other not)
+        out = []
+        if inside(x - 1, y - 1) != inside(x, y - 1):
+            out.append((0, -1))
+        if inside(x, y - 1) != inside(x, y):
+            out.append((1, 0))
+        if inside(x - 1, y) != inside(x, y):
+            out.append((0, 1))
+        if inside(x - 1, y - 1) != inside(x - 1, y):
+            out.append((-1, 0))
+        return out
+
+    shapes = {
+        frozenset([(0, -1), (0, 1)]): "|",
+        frozenset([(-1, 0), (1, 0)]): "-",
+        frozenset([(0, -1), (1, 0)]): "L",
+        frozenset([(0, -1), (-1, 0)]): "J",
+        frozenset([(0, 1), (-1, 0)]): "7",
+        frozenset([(0, 1), (1, 0)]): "F",
+    }
+    junk = ".|-LJ7F"
+    grid = [[rng.choice(junk) for _ in range(n)] for _ in range(n)]
+    loop = set()
+    for y in range(n):
+        for x in range(n):
+            e = edges(x, y)
+            if e:
+                grid[y][x] = shapes[frozenset(e)]
+                loop.add((x, y))
+    (sx, sy) = rng.choice(sorted(loop))
+    grid[sy][sx] = "S"
+    # Don't let any junk pipes point at S, so there's no doubt which way the loop goes
+    for (dx, dy) in OFFSETS:
+        (x, y) = (sx + dx, sy + dy)
+        if 0 <= x < n and 0 <= y < n and (x, y) not in loop:
+            grid[y][x] = "."
+    return join(grid)
+
+# 2023 day 11: a few galaxies in empty space, with some rows and columns left completely empty
+def galaxies(rng, n):
+    (empty_rows, empty_cols) = (set(rng.sample(range(n), n // 20)), set(rng.sample(range(n), n // 20)))
+    return join([["#" if rng.random() < 0.025 and y not in empty_rows and x not in empty_cols else "." for x in range(n)] for y in range(n)])
+
+# 2023 day 14: round rocks and cube rocks
+def rocks(rng, n):
+    return join([[rng.choices("O#.", weights=(2, 1, 4))[0] for _ in range(n)] for _ in range(n)])
+
+# 2023 day 16: mostly empty space, with some mirrors and splitters
+def mirrors(rng, n):
+    return join([[rng.choices(".|-/\\", weights=(16, 1, 1, 1, 1))[0] for _ in range(n)] for _ in range(n)])
+
+# 2023 day 17: heat loss digits
+def city(rng, n):
+    return join([[str(rng.randint(1, 9)) for _ in range(n)] for _ in range(n)])
+
+# 2023 day 21: garden plots with S in the middle. Like the real input, the middle row/column and edges are clear.
+def garden(rng, n):
+    n = n if n % 2 else n + 1
+    mid = n // 2
+    grid = [["#" if rng.random() < 0.1 else "." for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        grid[mid][i] = grid[i][mid] = "."
+        grid[0][i] = grid[n - 1][i] = grid[i][0] = grid[i][n - 1] = "."
+    grid[mid][mid] = "S"
+    return join(grid)
+
+# 2024 day 6: obstacles and a guard (^) who eventually walks off the map
+def guard_lab(rng, n):
+    while True:
+        grid = [["#" if rng.random() < 0.03 else "." for _ in range(n)] for _ in range(n)]
+        (gx, gy) = (rng.randrange(n), rng.randrange(n))
+        grid[gy][gx] = "^"
+        # Part 1 assumes the guard leaves, so walk the route and try again if she gets stuck in a loop
+        (x, y, d) = (gx, gy, 0)
+        seen = set()
+        while (x, y, d) not in seen:
+            seen.add((x, y, d))
+            (dx, dy) = OFFSETS[d]
+            if not (0 <= x + dx < n and 0 <= y + dy < n):
+                return join(grid)
+            if grid[y + dy][x + dx] == "#":
+                d = (d + 1) % 4
+            else:
+                (x, y) = (x + dx, y + dy)
+
+# 2024 day 10: hills of digits, each dropping by 1 per step away from its peak (9)
+def trail_map(rng, n):
+    peaks = [(rng.randrange(n), rng.randrange(n)) for _ in range(max(1, n * n // 150))]
+    (dist, _) = multi_source_bfs(rng, n, peaks)
+    return join([[str(max(0, 9 - d)) for d in row] for row in dist])
+
+# 2024 day 12: blobby regions of garden plots
+def garden_plots(rng, n):
+    seeds = [(rng.randrange(n), rng.randrange(n)) for _ in range(max(1, n * n // 100))]
+    plants = [chr(ord("A") + rng.randrange(26)) for _ in seeds]
+    (_, owner) = multi_source_bfs(rng, n, seeds)
+    return join([[plants[i] for i in row] for row in owner])
+
+# 2024 day 16: a maze from S (bottom-left) to E (top-right), with some walls knocked out so there are several best paths
+def reindeer_maze(rng, n):
+    grid = maze(rng, n)
+    n = len(grid)
+    for _ in range(n * n // 50):
+        (x, y) = (rng.randrange(1, n - 1), rng.randrange(1, n - 1))
+        if (x + y) % 2:
+            grid[y][x] = "."
+    grid[n - 2][1] = "S"
+    grid[1][n - 2] = "E"
+    return join(grid)
+
+# 2024 day 18: bytes falling on an n x n grid, one x,y per line, in the order they fall.
+# Like the real input, about two thirds of the cells get one (never the corners), so the exit gets cut off eventually.
+def falling_bytes(rng, n):
+    cells = [(x, y) for y in range(n) for x in range(n) if (x, y) not in ((0, 0), (n - 1, n - 1))]
+    rng.shuffle(cells)
+    return "\n".join(f"{x},{y}" for (x, y) in cells[:len(cells) * 2 // 3]) + "\n"
+
+# 2024 day 20: a single winding track from S to E, with walls everywhere else
+def race_track(rng, n):
+    grid = maze(rng, n)
+    n = len(grid)
+    (start, end) = ((1, n - 2), (n - 2, 1))
+    # Only keep the maze's (unique) path from S to E
+    parent = {start: None}
+    frontier = deque([start])
+    while frontier:
+        (x, y) = frontier.popleft()
+        for (dx, dy) in OFFSETS:
+            nxt = (x + dx, y + dy)
+            if grid[nxt[1]][nxt[0]] != "#" and nxt not in parent:
+                parent[nxt] = (x, y)
+                frontier.append(nxt)
+    track = [["#"] * n for _ in range(n)]
+    pos = end
+    while pos is not None:
+        track[pos[1]][pos[0]] = "."
+        pos = parent[pos]
+    track[start[1]][start[0]] = "S"
+    track[end[1]][end[0]] = "E"
+    return join(track)
+
+
+# (year, day): (generator, roughly the side length of the real input)
+GENERATORS = {
+    (2022, 8): (trees, 99),
+    (2022, 12): (heightmap, 84),
+    (2022, 14): (rock_paths, 170),
+    (2022, 23): (elves, 72),
+    (2023, 10): (pipe_loop, 140),
+    (2023, 11): (galaxies, 140),
+    (2023, 14): (rocks, 100),
+    (2023, 16): (mirrors, 110),
+    (2023, 17): (city, 141),
+    (2023, 21): (garden, 131),
+    (2024, 6): (guard_lab, 130),
+    (2024, 10): (trail_map, 45),
+    (2024, 12): (garden_plots, 140),
+    (2024, 16): (reindeer_maze, 141),
+    (2024, 18): (falling_bytes, 71),
+    (2024, 20): (race_track, 141),
+}
@@ -0,0 +1,176 @@
+"""
+Generators for the range and interval days.
+
+Every generator takes a seeded random.Random, a count n (of lines, ranges, sensors...) and the magnitude
+of the numbers involved, and returns the input text. Real inputs keep their numbers small enough for the
+brute-force solutions, so cranking up the magnitude is how you find where they fall over.
+"""
+
+from string import ascii_lowercase
+
+D5_MAPS = ["seed-to-soil", "soil-to-fertilizer", "fertilizer-to-water", "water-to-light",
+           "light-to-temperature", "temperature-to-humidity", "humidity-to-location"]
+
+
+def random_range(rng, magnitude, max_width):
+    lo = rng.randint(1, max(1, magnitude - max_width))
+    return (lo, lo + rng.randint(0, max_width))
+
+
+# 2021 day 3: n binary numbers, `magnitude` bits wide
+def diagnostic_report(rng, n, magnitude=12):
+    return "".join(f"{rng.getrandbits(magnitude):0{magnitude}b}\n" for _ in range(n))
+
+# 2021 day 4: the numbers 0..magnitude-1 called in a random order, then n 5x5 boards of distinct numbers from them
+def bingo(rng, n, magnitude=100):
+    calls = list(range(magnitude))
+    rng.shuffle(calls)
+    boards = []
+    for _ in range(n):
+        board = rng.sample(range(magnitude), 25)
+        boards.append("\n".join(" ".join(f"{x:2}" for x in board[row:row + 5]) for row in range(0, 25, 5)))
+    return ",".join(map(str, calls)) + "\n\n" + "\n\n".join(boards) + "\n"
+
+# 2022 day 4: pairs of section ranges
+def section_pairs(rng, n, magnitude=99):
+    lines = []
+    for _ in range(n):
+        (a, b), (c, d) = random_range(rng, magnitude, magnitude // 2), random_range(rng, magnitude, magnitude // 2)
+        lines.append(f"{a}-{b},{c}-{d}")
+    return "\n".join(lines) + "\n"
+
+# 2022 day 15: sensors and their closest beacons.
+# Every sensor's beacon is closer than a hidden distress beacon, so there's always at least one gap for part 2
+# (but not necessarily only one, like in the real input).
+def sensors(rng, n, magnitude=4_000_000):
+    (px, py) = (rng.randint(0, magnitude), rng.randint(0, magnitude))
+    lines = []
+    for _ in range(n):
+        while True:
+            (sx, sy) = (rng.randint(0, magnitude), rng.randint(0, magnitude))
+            d = abs(sx - px) + abs(sy - py)
+            if d > 1:
+                break
+        # Put the beacon somewhere on the biggest diamond that doesn't cover the distress beacon
+        r = d - 1
+        dx = rng.randint(-r, r)
+        dy = (r - abs(dx)) * rng.choice((-1, 1))
+        lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={sx + dx}, y={sy + dy}")
+    return "\n".join(lines) + "\n"
+
+# 2023 day 5: seed ranges, then 7 maps. Each map shuffles the blocks of a random partition of 0..magnitude.
+def seed_maps(rng, n, magnitude=4_000_000_000):
+    seeds = []
+    for _ in range(max(1, n // 5)):
+        (lo, hi) = random_range(rng, magnitude, magnitude // max(1, n))
+        seeds.extend([lo, hi - lo + 1])
+    sections = ["seeds: " + " ".join(map(str, seeds))]
+    for name in D5_MAPS:
+        cuts = sorted(rng.sample(range(1, magnitude), min(n, magnitude - 1)))
+        blocks = [(lo, hi - lo) for (lo, hi) in zip([0] + cuts, cuts + [magnitude])]
+        # Lay the blocks end to end in a random order to get each block's destination
+        rng.shuffle(blocks)
+        rows = []
+        dest = 0
+        for (source, length) in blocks:
+            rows.append(f"{dest} {source} {length}")
+            dest += length
+        rng.shuffle(rows)
+        sections.append(f"{name} map:\n" + "\n".join(rows))
+    return "\n\n".join(sections) + "\n"
+
+# 2023 day 19: a tree of n workflows starting from "in", then n parts to sort
+def workflows(rng, n, magnitude=4000):
+    names = ["in"]
+    used = {"in"}
+    while len(names) < n:
+        name = "".join(rng.choices(ascii_lowercase, k=rng.randint(2, 3)))
+        if name not in used and name not in ("in", "a", "r"):
+            used.add(name)
+            names.append(name)
+    # Each workflow only sends parts to workflows after it, so there are no loops
+    children = {name: [] for name in names}
+    for (i, name) in enumerate(names[1:], 1):
+        children[names[rng.randrange(i)]].append(name)
+    lines = []
+    for name in names:
+        targets = children[name] + rng.choices("AR", k=rng.randint(1, 3))
+        rng.shuffle(targets)
+        *ruled, default = targets
+        rules = [f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, magnitude)}:{t}" for t in ruled]
+        lines.append(f"{name}{{{','.join(rules + [default])}}}")
+    parts = [f"{{x={rng.randint(1, magnitude)},m={rng.randint(1, magnitude)},a={rng.randint(1, magnitude)},s={rng.randint(1, magnitude)}}}"
+             for _ in range(n)]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts) + "\n"
+
+# 2023 day 18: a dig plan of about n lines. Part 1's steps and part 2's (in the colour) each trace a different
+# histogram-shaped loop (along the top with random ups and downs, then back along a flat bottom), so neither crosses itself.
+# Part 2's steps can only have 5 hex digits, so the magnitude stops at 0xfffff.
+def dig_plan(rng, n, magnitude=0xfffff):
+    columns = max(2, (n - 2) // 2)
+
+    def loop(most):
+        width = max(1, most // columns)
+        heights = [rng.randint(1, most)]
+        while len(heights) < columns:
+            h = rng.randint(1, most)
+            if h != heights[-1] or most == 1:
+                heights.append(h)
+        steps = []
+        for (i, h) in enumerate(heights):
+            if i > 0 and h != heights[i - 1]:
+                steps.append(("U", h - heights[i - 1]) if h > heights[i - 1] else ("D", heights[i - 1] - h))
+            steps.append(("R", rng.randint(1, width)))
+        total = sum(s for (d, s) in steps if d == "R")
+        return steps + [("D", heights[-1]), ("L", total), ("U", heights[0])]
+
+    part1 = loop(10)
+    part2 = loop(min(magnitude, 0xfffff))
+    # The loops can come out a few lines different, so pad the shorter one with extra steps along its bottom
+    while len(part1) != len(part2):
+        shorter = min(part1, part2, key=len)
+        (_, total) = shorter[-2]
+        if total < 2:
+            return dig_plan(rng, n, magnitude)
+        shorter[-2:-1] = [("L", total // 2), ("L", total - total // 2)]
+    codes = {"R": 0, "D": 1, "L": 2, "U": 3}
+    return "\n".join(f"{d1} {s1} (#{s2:05x}{codes[d2]})" for ((d1, s1), (d2, s2)) in zip(part1, part2)) + "\n"
+
+# 2024 day 14: n robots with positions in the 101x103 room and velocities up to the magnitude
+def robots(rng, n, magnitude=100):
+    lines = []
+    for _ in range(n):
+        (vx, vy) = (rng.randint(-magnitude, magnitude), rng.randint(-magnitude, magnitude))
+        lines.append(f"p={rng.randrange(101)},{rng.randrange(103)} v={vx},{vy}")
+    return "\n".join(lines) + "\n"
+
+# 2025 day 2: comma-separated ID ranges on one line
+def id_ranges(rng, n, magnitude=10_000_000_000):
+    ranges = [random_range(rng, magnitude, max(1, magnitude // (100 * n))) for _ in range(n)]
+    return ",".join(f"{lo}-{hi}" for (lo, hi) in ranges) + "\n"
+
+# 2025 day 5: (overlapping) fresh ID ranges, a blank line, then IDs to check
+def fresh_ranges(rng, n, magnitude=500_000_000_000_000):
+    ranges = [random_range(rng, magnitude, max(1, magnitude // n)) for _ in range(n)]
+    ids = [rng.randint(1, magnitude) for _ in range(n * 5)]
+    return "\n".join(f"{lo}-{hi}" for (lo, hi) in ranges) + "\n\n" + "\n".join(map(str, ids)) + "\n"
+
+# 2025 day 8: n junction boxes at random 3D positions
+def junction_boxes(rng, n, magnitude=100_000):
+    return "\n".join(f"{rng.randrange(magnitude)},{rng.randrange(magnitude)},{rng.randrange(magnitude)}" for _ in range(n)) + "\n"
+
+
+# (year, day): (generator, roughly the count in the real input)
+GENERATORS = {
+    (2021, 3): (diagnostic_report, 1000),
+    (2021, 4): (bingo, 100),
+    (2022, 4): (section_pairs, 1000),
+    (2022, 15): (sensors, 30),
+    (2023, 5): (seed_maps, 40),
+    (2023, 18): (dig_plan, 700),
+    (2023, 19): (workflows, 550),
+    (2024, 14): (robots, 500),
+    (2025, 2): (id_ranges, 35),
+    (2025, 5): (fresh_ranges, 190),
+    (2025, 8): (junction_boxes, 1000),
+}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+"""
+Golden answers and timing baselines, so rewrites can be checked against known-good results.
+
+`--record` runs everything that has an input and saves its answers, the input's hash and the timings.
+Without it, everything is run again and checked: a day fails if an answer changed, and is reported as slow
+if a part (or notebook cell) got more than --tolerance percent slower than its baseline.
+Parts faster than --min-time are never counted as slow, they're mostly timing noise.
+For the notebooks, the "answers" are the results of every cell that ends on a value (or its output, if it prints instead).
+
+Run like:
+python -m aoc.golden --record
+python -m aoc.golden --tolerance 20
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from aoc import REPO_ROOT, notebooks, runner
+
+GOLDEN_PATH = REPO_ROOT / "golden.json"
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def normalise(answer):
+    # Compare answers the way they're stored, so e.g. tuples and lists are the same
+    return json.loads(json.dumps(answer, default=repr))
+
+def summarise(result, input_path):
+    # Turn a runner or notebook result into a golden entry
+    if "cells" in result:
+        # Some cells print their answer rather than ending on it
+        answers = {f"cell{c['cell']}": c["result"] if c["result"] is not None else c["output"] for c in result["cells"] if c["result"] is not None or c["output"]}
+        timings = {f"cell{c['cell']}": c["time"] for c in result["cells"]}
+    else:
+        answers = result.get("answers", {})
+        timings = {k: result[k] for k in ("parse", "part1", "part2") if k in result}
+    return {
+        "input": input_path.name,
+        "sha256": file_hash(input_path),
+        "answers": normalise(answers),
+        "timings": timings,
+    }
+
+def run_everything(years, input_name, jobs):
+    # Yields (key, result, input path) for every solution and notebook that has an input
+    days = [d for d in runner.discover(years) if d[2].with_name(input_name).exists()]
+    nbs = [n for n in notebooks.discover(years) if n[2].with_name(input_name).exists()]
+    paths = {(y, d): p.with_name(input_name) for (y, d, p) in days + nbs}
+    for result in runner.run_all(days, input_name, jobs):
+        yield (f"{result['year']}/{result['day']}", result, paths[(result["year"], result["day"])])
+    for result in notebooks.run_all(nbs, input_name, jobs):
+        yield (f"{result['year']}/{result['day']}", result, paths[(result["year"], result["day"])])
+
+def check(golden, key, result, input_path, tolerance, min_time):
+    # Returns a list of (severity, message) problems for one day
+    if result["status"] != "ok":
+        return [("FAIL", result.get("error", result["status"]))]
+    expected = golden.get(key)
+    if expected is None:
+        return [("NEW", "no golden answers recorded")]
+    actual = summarise(result, input_path)
+    if actual["sha256"] != expected["sha256"]:
+        return [("FAIL", f"{input_path.name} has changed since the answers were recorded")]
+
+    problems = []
+    for (part, answer) in expected["answers"].items():
+        got = actual["answers"].get(part)
+        if got != answer:
+            problems.append(("FAIL", f"{part} answer changed: expected {answer!r}, got {got!r}"))
+    for (part, baseline) in expected["timings"].items():
+        t = actual["timings"].get(part)
+        if t is None or t < min_time:
+            continue
+        change = (t - baseline) / baseline * 100 if baseline > 0 else float("inf")
+        if change > tolerance:
+            problems.append(("SLOW", f"{part} took {t:.4f}s vs {baseline:.4f}s baseline (+{change:.0f}%)"))
+    return problems
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check answers and timings against the recorded golden results")
+    parser.add_argument("years", nargs="*", type=int, default=runner.DEFAULT_YEARS + notebooks.DEFAULT_YEARS)
+    parser.add_argument("--record", action="store_true", help="Record answers and timings instead of checking them")
+    parser.add_argument("--golden", default=GOLDEN_PATH, help="Where the golden answers are stored")
+    parser.add_argument("-i", "--input-name", default="input.txt", help="Input filename in each day's folder")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("-t", "--tolerance", type=float, default=25, help="Allowed slowdown, in percent")
+    parser.add_argument("--min-time", type=float, default=0.01, help="Ignore timings below this many seconds")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.golden, encoding="utf-8") as f:
+            golden = json.load(f)
+    except FileNotFoundError:
+        golden = {}
+
+    results = sorted(run_everything(args.years, args.input_name, args.jobs), key=lambda r: (r[1]["year"], r[1]["day"]))
+
+    if args.record:
+        for (key, result, input_path) in results:
+            if result["status"] == "ok":
+                golden[key] = summarise(result, input_path)
+                print(f"{key}: recorded {golden[key]['answers']}")
+            else:
+                print(f"{key}: not recorded, {result.get('error', result['status'])}")
+        with open(args.golden, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(golden.items(), key=lambda kv: tuple(map(int, kv[0].split("/"))))), f, indent=2)
+            f.write("\n")
+        return 0
+
+    failed = False
+    for (key, result, input_path) in results:
+        problems = check(golden, key, result, input_path, args.tolerance, args.min_time)
+        if not problems:
+            print(f"{key}: ok")
+        for (severity, message) in problems:
+            print(f"{key}: {severity} {message}")
+            failed |= severity in ("FAIL", "SLOW")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+"""
+A rectangular grid of characters, stored flat in a bytearray.
+
+Cells are addressed by one integer index, i = y * width + x, so a position is a plain int (cheap to hash,
+and small enough to index other flat arrays like distances or seen-flags) rather than a complex number or
+tuple in a dict. Moving is adding an offset: grid.offsets are the steps for N, E, S, W, and grid.offsets8
+goes clockwise from N including the diagonals.
+
+The catch with flat indices is that stepping off the left/right edge wraps onto the next row. Either use
+step()/neighbours(), which know about the edges, or parse with a border (e.g. Grid.parse(data, border="#"))
+so anything that walks off the real grid lands on the border first. Note the border shifts every (x, y) by 1.
+
+For whole-grid work, array() is the same cells as a numpy array (numpy's only imported when it's first used),
+and positions() finds every cell of some characters with np.nonzero (or a slower bytes.find loop without numpy).
+"""
+
+NORTH, EAST, SOUTH, WEST = range(4)
+
+
+class Grid:
+    def __init__(self, cells: bytearray, width: int, height: int) -> None:
+        if len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cells can't make a {width}x{height} grid")
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.offsets = (-width, 1, width, -1)
+        self.offsets8 = (-width, 1 - width, 1, width + 1, width, width - 1, -1, -width - 1)
+
+    @classmethod
+    def parse(cls, data: str | list[str], border: str | None = None, pad: str | None = None) -> "Grid":
+        # From the puzzle text (or its lines). Every line has to be the same length, unless there's a pad
+        # character to fill out the short ones with.
+        lines = data.strip("\n").split("\n") if isinstance(data, str) else data
+        width = max(len(line) for line in lines)
+        if pad is not None:
+            lines = [line.ljust(width, pad) for line in lines]
+        elif any(len(line) != width for line in lines):
+            raise ValueError("Grid lines aren't all the same length")
+        if border is not None:
+            lines = [border * (width + 2)] + [border + line + border for line in lines] + [border * (width + 2)]
+            width += 2
+        return cls(bytearray("".join(lines), "ascii"), width, len(lines))
+
+    @classmethod
+    def filled(cls, width: int, height: int, fill: str = ".") -> "Grid":
+        return cls(bytearray(fill, "ascii") * (width * height), width, height)
+
+    def copy(self) -> "Grid":
+        return Grid(bytearray(self.cells), self.width, self.height)
+
+    def tiled(self, n: int) -> "Grid":
+        # n copies of the grid in each direction (for puzzles on an infinitely repeating map)
+        rows = [self.row(y) * n for y in range(self.height)] * n
+        return Grid(bytearray("".join(rows), "ascii"), self.width * n, self.height * n)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, i: int) -> str:
+        return chr(self.cells[i])
+
+    def __setitem__(self, i: int, c: str) -> None:
+        self.cells[i] = ord(c)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Grid) and (self.width, self.cells) == (other.width, other.cells)
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(y) for y in range(self.height))
+
+    def __repr__(self) -> str:
+        return f"Grid({self.width}x{self.height})"
+
+    def row(self, y: int) -> str:
+        return self.cells[y * self.width:(y + 1) * self.width].decode("ascii")
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def xy(self, i: int) -> tuple[int, int]:
+        (y, x) = divmod(i, self.width)
+        return (x, y)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int, default: str | None = None) -> str | None:
+        if not self.in_bounds(x, y):
+            return default
+        return chr(self.cells[y * self.width + x])
+
+    def find(self, c: str) -> int:
+        # Index of the first c, e.g. the start
+        i = self.cells.find(ord(c))
+        if i == -1:
+            raise ValueError(f"{c!r} isn't in the grid")
+        return i
+
+    def find_all(self, c: str) -> list[int]:
+        out = []
+        i = self.cells.find(ord(c))
+        while i != -1:
+            out.append(i)
+            i = self.cells.find(ord(c), i + 1)
+        return out
+
+    def array(self):
+        # A height x width numpy array of uint8, sharing memory with the grid (so writes to either show in both)
+        import numpy as np
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.height, self.width)
+
+    def positions(self, chars: str) -> list[tuple[int, int]]:
+        # (x, y) of every cell that's one of chars, in reading order
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.xy(i) for i in sorted(i for c in chars for i in self.find_all(c))]
+        cells = self.array()
+        # A few == are much quicker than np.isin for a handful of characters
+        found = cells == ord(chars[0])
+        for c in chars[1:]:
+            found |= cells == ord(c)
+        (ys, xs) = np.nonzero(found)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def step(self, i: int, direction: int) -> int | None:
+        # Index one step from i in direction (NESW = 0-3), or None if that's off the grid
+        match direction:
+            case 0:
+                return i - self.width if i >= self.width else None
+            case 1:
+                return i + 1 if (i + 1) % self.width else None
+            case 2:
+                return i + self.width if i + self.width < len(self.cells) else None
+            case 3:
+                return i - 1 if i % self.width else None
+        raise ValueError(f"Unknown direction {direction}")
+
+    def neighbours(self, i: int) -> list[int]:
+        # Indices of the (up to 4) cells next to i
+        (y, x) = divmod(i, self.width)
+        out = []
+        if y > 0:
+            out.append(i - self.width)
+        if x < self.width - 1:
+            out.append(i + 1)
+        if y < self.height - 1:
+            out.append(i + self.width)
+        if x > 0:
+            out.append(i - 1)
+        return out
+
+    def neighbours8(self, i: int) -> list[int]:
+        # Indices of the (up to 8) cells around i, including diagonals
+        (y, x) = divmod(i, self.width)
+        out = []
+        for dy in (-1, 0, 1):
+            if 0 <= y + dy < self.height:
+                for dx in (-1, 0, 1):
+                    if (dx or dy) and 0 <= x + dx < self.width:
+                        out.append(i + dy * self.width + dx)
+        return out
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+"""
+Cold-start times: how long each solution takes to get going in a fresh interpreter, before it reads any input.
+
+For a .py day that's loading the module (its imports plus anything it does at the top level). For a notebook
+it's the import lines (and sys.path setup) from the cells before the one that reads the input.
+Each one runs in a new `python -X importtime` process, several times (the fastest run counts, since cold starts
+are noisy), and we report the total plus the biggest imports so you can see what to make lazy.
+Python's own startup isn't counted.
+
+With --budget, exits with 1 if anything takes longer than that many milliseconds, so it can be run before
+committing (or in CI, or anywhere else).
+
+Run like:
+python -m aoc.importtime 2023 --top 3
+python -m aoc.importtime --budget 50
+"""
+
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+
+from aoc import notebooks, runner
+
+MARKER = "--- startup begins"
+# import time: self [us] | cumulative | imported package (indented 2 spaces per level)
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$")
+MEASURE = """\
+import importlib.util, sys, time
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+{startup}
+print(time.perf_counter() - start)
+"""
+LOAD_MODULE = """\
+spec = importlib.util.spec_from_file_location("startup_check", {path!r})
+spec.loader.exec_module(importlib.util.module_from_spec(spec))"""
+
+
+def notebook_startup(path):
+    # The imports (and sys.path lines) from the cells before the input's read in
+    lines = []
+    for source in notebooks.code_cells(path):
+        if notebooks.FILENAME_PATTERN.search(source):
+            break
+        try:
+            tree = ast.parse(source)
+        except SyntaxError:
+            continue
+        for node in tree.body:
+            if isinstance(node, (ast.Import, ast.ImportFrom)) or (isinstance(node, ast.Expr) and "sys.path" in ast.unparse(node)):
+                lines.append(ast.unparse(node))
+    return "\n".join(lines)
+
+def startup_code(path):
+    if path.suffix == ".ipynb":
+        return notebook_startup(path)
+    return LOAD_MODULE.format(path=str(path))
+
+def measure(path):
+    # One fresh interpreter: (seconds, {top-level import: cumulative seconds})
+    code = MEASURE.format(marker=MARKER, startup=startup_code(path))
+    # Notebooks expect to run from their own folder
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=path.parent, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    imports = {}
+    started = False
+    for line in proc.stderr.splitlines():
+        if line == MARKER:
+            started = True
+            continue
+        m = IMPORT_LINE.match(line)
+        if started and m and not m.group(3):
+            imports[m.group(4)] = int(m.group(2)) / 1e6
+    return (float(proc.stdout.strip().splitlines()[-1]), imports)
+
+def startup_time(path, repeat=3):
+    # The fastest of repeat runs
+    return min((measure(path) for _ in range(repeat)), key=lambda r: r[0])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how long each solution takes to start in a fresh interpreter")
+    parser.add_argument("years", nargs="*", type=int, default=runner.DEFAULT_YEARS + notebooks.DEFAULT_YEARS)
+    parser.add_argument("-d", "--days", nargs="+", type=int, help="Only check these days")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per solution (the fastest counts)")
+    parser.add_argument("-n", "--top", type=int, default=3, help="How many of the biggest imports to show")
+    parser.add_argument("-b", "--budget", type=float, help="Fail if any solution takes more than this many milliseconds")
+    parser.add_argument("-f", "--format", choices=["table", "json"], default="table")
+    args = parser.parse_args(argv)
+
+    solutions = runner.discover(args.years, args.days) + notebooks.discover(args.years, args.days)
+    results = []
+    for (year, day, path) in sorted(solutions):
+        try:
+            (seconds, imports) = startup_time(path, args.repeat)
+        except RuntimeError as e:
+            result = {"year": year, "day": day, "status": "error", "error": str(e)}
+        else:
+            biggest = sorted(imports.items(), key=lambda kv: kv[1], reverse=True)[:args.top]
+            result = {"year": year, "day": day, "status": "ok", "ms": seconds * 1000, "imports": {name: t * 1000 for (name, t) in biggest}}
+            if args.budget is not None and result["ms"] > args.budget:
+                result["status"] = "over budget"
+        results.append(result)
+        if args.format == "table":
+            if result["status"] == "error":
+                print(f"{year} {day:>2}  error: {result['error']}", flush=True)
+            else:
+                biggest = ", ".join(f"{name} {ms:.1f}" for (name, ms) in result["imports"].items())
+                flag = "  OVER BUDGET" if result["status"] == "over budget" else ""
+                print(f"{year} {day:>2}  {result['ms']:7.1f}ms  ({biggest}){flag}", flush=True)
+    if args.format == "json":
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    failed = [r for r in results if r["status"] != "ok"]
+    if args.budget is not None:
+        print(f"{len(failed)} of {len(results)} over the {args.budget:g}ms budget (or failed to start)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Counters, timers and gauges for solvers to report how much work they did, instead of printing it.
+
+Solutions call these in their hot loops:
+from aoc import instrument
+instrument.count("nodes")             # add 1 (or n) to a counter
+instrument.gauge("queue", len(heap))  # keep the highest value seen (a high-water mark)
+with instrument.timer("flood"):       # add up the seconds spent in the block
+    ...
+
+Everything is off unless something calls enable() (the runner does, with --instrument). While it's off, the
+functions are no-ops and timer() hands back one shared do-nothing context manager, so the cost is one
+function call. In the very hottest loops, check instrument.ENABLED first (or count in a local and report
+it once at the end) to skip even that.
+
+The runner takes a snapshot() after the parse and each part, and reset()s in between, so every part gets
+its own numbers. snapshot() also includes hits/misses for the module's functools.cache (or aoc.memo) functions,
+and evictions for the ones with a maxsize.
+"""
+
+import contextlib
+import time
+
+ENABLED = False
+counters = {}
+timers = {}
+gauges = {}
+
+
+def _count(name, n=1):
+    counters[name] = counters.get(name, 0) + n
+
+def _gauge(name, value):
+    if name not in gauges or value > gauges[name]:
+        gauges[name] = value
+
+@contextlib.contextmanager
+def _timer(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timers[name] = timers.get(name, 0) + time.perf_counter() - start
+
+def _noop(*args, **kwargs):
+    pass
+
+_NULL_TIMER = contextlib.nullcontext()
+
+def _null_timer(name):
+    return _NULL_TIMER
+
+count = _noop
+gauge = _noop
+timer = _null_timer
+
+def enable(on=True):
+    # Swap the real functions in (or out). Callers have to look them up as instrument.count etc.,
+    # a `from aoc.instrument import count` would keep whichever version was there at import time.
+    global ENABLED, count, gauge, timer
+    ENABLED = on
+    (count, gauge, timer) = (_count, _gauge, _timer) if on else (_noop, _noop, _null_timer)
+
+def reset():
+    counters.clear()
+    timers.clear()
+    gauges.clear()
+
+def cached_functions(module):
+    # The module-level functools.cache/lru_cache (or aoc.memo.cache) functions, by name
+    return {name: f for (name, f) in vars(module).items() if callable(getattr(f, "cache_info", None))}
+
+def cache_stats(functions):
+    out = {}
+    for (name, f) in functions.items():
+        info = f.cache_info()
+        out[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+        if getattr(info, "evictions", None) is not None:
+            out[name]["evictions"] = info.evictions
+    return out
+
+def snapshot(caches_before=None, caches_after=None):
+    # Everything recorded since the last reset(). Cache stats are the difference between before and after,
+    # since the caches (unlike the counters) carry on between parts.
+    out = {"counters": dict(counters), "timers": dict(timers), "gauges": dict(gauges)}
+    if caches_after:
+        caches_before = caches_before or {}
+        out["caches"] = {}
+        for (name, after) in caches_after.items():
+            before = caches_before.get(name, {"hits": 0, "misses": 0})
+            out["caches"][name] = {"hits": after["hits"] - before["hits"], "misses": after["misses"] - before["misses"], "size": after["size"]}
+            if "evictions" in after:
+                out["caches"][name]["evictions"] = after["evictions"] - before.get("evictions", 0)
+    return out
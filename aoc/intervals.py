@@ -0,0 +1,208 @@
+"""
+Sets of integers kept as sorted, merged ranges, for puzzles where the ranges are far too wide to list.
+
+An IntervalSet only stores endpoints: two parallel sorted lists, los and his, where each (lo, hi) is an
+inclusive range and no two touch (so [1, 3] and [4, 6] are stored as [1, 6]). Membership is a bisect on the
+starts, and union/intersection/difference are one merge pass over both sets' ranges, so everything costs
+in terms of how many ranges there are, never how many numbers they hold.
+
+It mirrors the set API where it can (in, |, &, -, issuperset(), isdisjoint()), so a day that built
+set(range(lo, hi + 1)) can usually switch over without touching the logic. The differences:
+- Ranges are inclusive, like the puzzle text, not half-open like range()
+- total() is the number of integers covered. There's no len(), since that could be more than fits in a C long.
+- Iterating gives the (lo, hi) ranges, not the numbers in them
+
+Use like:
+fresh = IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])   # [(3, 5), (10, 20)]
+(17 in fresh, fresh.total(), list(fresh - IntervalSet([(4, 11)])))   # (True, 14, [(3, 3), (12, 20)])
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    def __init__(self, ranges=()) -> None:
+        # From any (lo, hi) pairs, in any order, overlapping or not. Empty ranges (hi < lo) are skipped.
+        los = []
+        his = []
+        for (lo, hi) in sorted(ranges):
+            if hi < lo:
+                continue
+            if his and lo <= his[-1] + 1:
+                # Overlaps or touches the last one
+                if hi > his[-1]:
+                    his[-1] = hi
+            else:
+                los.append(lo)
+                his.append(hi)
+        self.los = los
+        self.his = his
+
+    @classmethod
+    def _from_sorted(cls, los: list[int], his: list[int]) -> "IntervalSet":
+        # Already sorted and merged (e.g. from a merge pass), so skip the sort
+        s = cls.__new__(cls)
+        s.los = los
+        s.his = his
+        return s
+
+    def copy(self) -> "IntervalSet":
+        return IntervalSet._from_sorted(self.los[:], self.his[:])
+
+    def __iter__(self):
+        return zip(self.los, self.his)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __bool__(self) -> bool:
+        return bool(self.los)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.los == other.los and self.his == other.his
+
+    def total(self) -> int:
+        # How many integers are in the set
+        return sum(self.his) - sum(self.los) + len(self.los)
+
+    def min(self) -> int:
+        return self.los[0]
+
+    def max(self) -> int:
+        return self.his[-1]
+
+    # Queries. All a bisect or two.
+
+    def __contains__(self, x: int) -> bool:
+        # The last range starting at or before x is the only one that could hold it
+        i = bisect_right(self.los, x) - 1
+        return i >= 0 and x <= self.his[i]
+
+    def covers(self, lo: int, hi: int) -> bool:
+        # Is every integer in [lo, hi] in the set? Ranges never touch, so it has to be one range.
+        # An empty range (hi < lo) has no integers to miss, so any set covers it (like set() <= s).
+        if hi < lo:
+            return True
+        i = bisect_right(self.los, lo) - 1
+        return i >= 0 and hi <= self.his[i]
+
+    def overlaps(self, lo: int, hi: int) -> bool:
+        # Is any integer in [lo, hi] in the set? The first range ending at or after lo is the only candidate.
+        i = bisect_left(self.his, lo)
+        return i < len(self.los) and self.los[i] <= hi
+
+    def issuperset(self, other: "IntervalSet") -> bool:
+        return all(self.covers(lo, hi) for (lo, hi) in other)
+
+    def issubset(self, other: "IntervalSet") -> bool:
+        return other.issuperset(self)
+
+    def isdisjoint(self, other: "IntervalSet") -> bool:
+        return not any(self.overlaps(lo, hi) for (lo, hi) in other)
+
+    # Building new sets
+
+    def clip(self, lo: int, hi: int) -> "IntervalSet":
+        # The part of the set inside [lo, hi]: the same as self & IntervalSet([(lo, hi)]), but only
+        # looks at the ranges in the way, so it's cheap to do many times on a big set
+        (los, his) = (self.los, self.his)
+        start = bisect_left(his, lo)
+        stop = bisect_right(los, hi)
+        if start >= stop:
+            return IntervalSet()
+        (los, his) = (los[start:stop], his[start:stop])
+        los[0] = max(los[0], lo)
+        his[-1] = min(his[-1], hi)
+        return IntervalSet._from_sorted(los, his)
+
+    def gaps(self, lo: int, hi: int) -> "IntervalSet":
+        # Everything in [lo, hi] that isn't in the set
+        return IntervalSet([(lo, hi)]) - self
+
+    def shifted(self, offset: int) -> "IntervalSet":
+        return IntervalSet._from_sorted([lo + offset for lo in self.los], [hi + offset for hi in self.his])
+
+    def add(self, lo: int, hi: int) -> None:
+        # Add [lo, hi] in place, swallowing any ranges it overlaps or touches
+        if hi < lo:
+            return
+        (los, his) = (self.los, self.his)
+        start = bisect_left(his, lo - 1)
+        stop = bisect_right(los, hi + 1)
+        if start < stop:
+            lo = min(lo, los[start])
+            hi = max(hi, his[stop - 1])
+        los[start:stop] = [lo]
+        his[start:stop] = [hi]
+
+    def __or__(self, other: "IntervalSet") -> "IntervalSet":
+        # Merge the two (already sorted) lists of ranges, joining as we go
+        if not other:
+            return self.copy()
+        if not self:
+            return other.copy()
+        (a_los, a_his, b_los, b_his) = (self.los, self.his, other.los, other.his)
+        (na, nb) = (len(a_los), len(b_los))
+        los = []
+        his = []
+        (i, j) = (0, 0)
+        while i < na or j < nb:
+            if j >= nb or (i < na and a_los[i] <= b_los[j]):
+                (lo, hi) = (a_los[i], a_his[i])
+                i += 1
+            else:
+                (lo, hi) = (b_los[j], b_his[j])
+                j += 1
+            if his and lo <= his[-1] + 1:
+                if hi > his[-1]:
+                    his[-1] = hi
+            else:
+                los.append(lo)
+                his.append(hi)
+        return IntervalSet._from_sorted(los, his)
+
+    def __and__(self, other: "IntervalSet") -> "IntervalSet":
+        # Walk both lists together. Whichever range ends first can't overlap anything after the other's current one.
+        (a_los, a_his, b_los, b_his) = (self.los, self.his, other.los, other.his)
+        (na, nb) = (len(a_los), len(b_los))
+        los = []
+        his = []
+        (i, j) = (0, 0)
+        while i < na and j < nb:
+            lo = max(a_los[i], b_los[j])
+            hi = min(a_his[i], b_his[j])
+            if lo <= hi:
+                los.append(lo)
+                his.append(hi)
+            if a_his[i] < b_his[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(los, his)
+
+    def __sub__(self, other: "IntervalSet") -> "IntervalSet":
+        # Cut each of our ranges by whatever of the other's ranges overlap it
+        (b_los, b_his) = (other.los, other.his)
+        nb = len(b_los)
+        los = []
+        his = []
+        j = 0
+        for (lo, hi) in zip(self.los, self.his):
+            # Skip the other's ranges that end before this one starts (they can't affect later ranges either)
+            while j < nb and b_his[j] < lo:
+                j += 1
+            k = j
+            while k < nb and b_los[k] <= hi:
+                if b_los[k] > lo:
+                    los.append(lo)
+                    his.append(b_los[k] - 1)
+                lo = b_his[k] + 1
+                if lo > hi:
+                    break
+                k += 1
+            if lo <= hi:
+                los.append(lo)
+                his.append(hi)
+        return IntervalSet._from_sorted(los, his)
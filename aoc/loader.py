@@ -0,0 +1,147 @@
+"""
+Reading big inputs without copying them all into memory.
+
+Input.open(path) maps the file with mmap instead of reading it, so the OS pages it in as it's used and
+memory stays flat however big the file is. Nothing's decoded up front: lines() and blocks() hand out
+memoryview slices of the mapping, which int(), re and bytes comparisons all take as they are, and only
+text_lines() (or text(), for the whole thing) turns them into strings.
+When even a line at a time is too slow, chunks() hands out line-aligned blocks of about a megabyte to split in one go.
+
+Days opt in with PARSE_MAPPED = True, and then the runner passes parse() an Input rather than a str.
+An Input is read-only, so deepcopy() (which the runner does for each part) hands back the same one rather
+than copying the file. It can't be pickled though, so a parse that returns one isn't cached (see aoc.cache).
+The views are only valid while the Input is open, so parse() should turn them into ints/strs before returning.
+
+Use like:
+with Input.open("input.txt") as data:
+    depths = [int(line) for line in data.lines()]
+"""
+
+import mmap
+
+
+class Input:
+    def __init__(self, buffer, start=0, end=None, owner=None):
+        # buffer is anything bytes-like with a find() (bytes or an mmap), and the input is buffer[start:end].
+        # owner is what to close at the end.
+        self.buffer = buffer
+        self.start = start
+        self.end = len(buffer) if end is None else end
+        self.view = memoryview(buffer)[self.start:self.end]
+        self.owner = owner
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                return cls(b"")
+        return cls(mapped, owner=mapped)
+
+    @classmethod
+    def from_text(cls, text):
+        # For when the input's already in memory (e.g. sent to aoc.daemon)
+        return cls(text.encode("utf-8"))
+
+    def close(self):
+        self.view.release()
+        if self.owner is not None:
+            try:
+                self.owner.close()
+            except BufferError:
+                # Someone's still holding a view of it. It'll be unmapped once they're gone.
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __getitem__(self, i):
+        return self.view[i]
+
+    def __iter__(self):
+        # The bytes, as ints
+        return iter(self.view)
+
+    def stripped(self):
+        # The same input without leading/trailing whitespace, still without copying it
+        (start, end) = (self.start, self.end)
+        while start < end and self.buffer[start] in b" \t\r\n":
+            start += 1
+        while end > start and self.buffer[end - 1] in b" \t\r\n":
+            end -= 1
+        return Input(self.buffer, start, end, self.owner)
+
+    def text(self):
+        return str(self.view, "utf-8")
+
+    def lines(self):
+        # Each line as a memoryview, without its line ending. No empty line for a trailing newline.
+        (buffer, view, offset) = (self.buffer, self.view, self.start)
+        (start, end) = (self.start, self.end)
+        while start < end:
+            stop = buffer.find(b"\n", start, end)
+            if stop == -1:
+                stop = end
+            line_end = stop - 1 if stop > start and buffer[stop - 1] == 13 else stop  # 13 is \r
+            yield view[start - offset:line_end - offset]
+            start = stop + 1
+
+    def chunks(self, size=1 << 20):
+        # The input in memoryviews of about `size` bytes, each ending at the end of a line (so no line is split
+        # between two). For when a line at a time is too slow: each chunk can go to bytes.split(), re, etc. in one go.
+        (buffer, view, offset) = (self.buffer, self.view, self.start)
+        (start, end) = (self.start, self.end)
+        while start < end:
+            stop = min(start + size, end)
+            if stop < end:
+                newline = buffer.rfind(b"\n", start, stop)
+                if newline == -1:
+                    # A line longer than size, so the chunk has to be bigger
+                    newline = buffer.find(b"\n", stop, end)
+                stop = end if newline == -1 else newline + 1
+            yield view[start - offset:stop - offset]
+            start = stop
+
+    def ranges(self, n):
+        # Split the input into (up to) n pieces of about the same size, each ending at the end of a line, as
+        # (start, end) offsets into the file. For handing out to other processes, which can map the file themselves.
+        bounds = [self.start]
+        for i in range(1, n):
+            cut = max(self.start + len(self) * i // n, bounds[-1])
+            newline = self.buffer.find(b"\n", cut, self.end)
+            bounds.append(self.end if newline == -1 else newline + 1)
+        bounds.append(self.end)
+        return [(start, end) for (start, end) in zip(bounds, bounds[1:]) if start < end]
+
+    def piece(self, start, end):
+        # The input between two offsets into the file (like from ranges()), still without copying it
+        return Input(self.buffer, start, end, self.owner)
+
+    def text_lines(self):
+        for line in self.lines():
+            yield str(line, "utf-8")
+
+    def blocks(self):
+        # Lists of lines separated by blank lines (like data.split("\n\n")), skipping empty blocks
+        block = []
+        for line in self.lines():
+            if len(line) == 0:
+                if block:
+                    yield block
+                block = []
+            else:
+                block.append(line)
+        if block:
+            yield block
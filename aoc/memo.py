@@ -0,0 +1,118 @@
+"""
+Memoisation with a size limit, for the recursive searches that would otherwise keep every state they ever saw.
+
+Use like functools.cache:
+@memo.cache(maxsize=100_000)                 # evicts the least recently used entry once it's full
+@memo.cache(maxsize=100_000, policy="fifo")  # evicts the oldest entry, whether or not it's been used since
+@memo.cache                                  # no limit, like functools.cache (but still scoped and counted)
+def place_springs(line, springs): ...
+
+From the outside they look like functools caches (cache_info(), cache_clear(), __wrapped__), so the runner's
+cache stats (aoc.instrument) and the daemon's clearing between inputs work on them the same way.
+cache_info() has an extra evictions count, to see whether maxsize is too small for the input.
+
+Every memoised function is registered (weakly, so a notebook's go away with its namespace), and
+`with memo.scope():` clears them all when the block ends. The runner, batch mode and notebook runner
+solve each input in a scope, so nothing one input cached is still holding memory while the next one runs.
+stats() gives every live cache's numbers at once.
+"""
+
+import collections
+import contextlib
+import functools
+import weakref
+
+POLICIES = ("lru", "fifo")
+# Like functools' own CacheInfo (a namedtuple rather than a typing.NamedTuple, which would add ~10ms to every start)
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "evictions"])
+
+_registry = weakref.WeakSet()
+_MISSING = object()
+_KWARGS_MARK = object()  # Separates args from kwargs in a key, like functools does
+
+
+def cache(maxsize=None, policy="lru"):
+    if callable(maxsize):
+        # Used bare, as @memo.cache
+        return cache()(maxsize)
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {POLICIES}")
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize can't be negative")
+
+    def decorator(f):
+        if policy == "lru":
+            return _register(_lru(f, maxsize), maxsize, policy)
+        return _register(_fifo(f, maxsize), maxsize, policy)
+
+    return decorator
+
+def _lru(f, maxsize):
+    # functools' own LRU cache does the work: it's in C, so much quicker per call than anything written here.
+    # Each miss adds one entry, so whatever's missing from the cache was evicted.
+    wrapper = functools.lru_cache(maxsize=maxsize)(f)
+    functools_info = wrapper.cache_info
+
+    def cache_info():
+        info = functools_info()
+        return CacheInfo(info.hits, info.misses, maxsize, info.currsize, info.misses - info.currsize)
+
+    wrapper.cache_info = cache_info
+    return wrapper
+
+def _fifo(f, maxsize):
+    # Wrapped by hand, since functools hasn't got one. The counts are closure variables rather than attributes
+    # on an object, since this is called in the hottest loops and every lookup counts.
+    entries = {}
+    hits = misses = evictions = 0
+
+    def wrapper(*args, **kwargs):
+        nonlocal hits, misses, evictions
+        key = args + (_KWARGS_MARK,) + tuple(kwargs.items()) if kwargs else args
+        result = entries.get(key, _MISSING)
+        if result is not _MISSING:
+            hits += 1
+            return result
+        misses += 1
+        result = f(*args, **kwargs)
+        # A recursive call might have already filled the key in, so this can be a replace
+        entries[key] = result
+        if maxsize is not None and len(entries) > maxsize:
+            # dicts keep insertion order, so the first key is the oldest
+            del entries[next(iter(entries))]
+            evictions += 1
+        return result
+
+    def cache_info():
+        return CacheInfo(hits, misses, maxsize, len(entries), evictions)
+
+    def cache_clear():
+        nonlocal hits, misses, evictions
+        entries.clear()
+        hits = misses = evictions = 0
+
+    functools.update_wrapper(wrapper, f)
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
+def _register(wrapper, maxsize, policy):
+    wrapper.cache_parameters = lambda: {"maxsize": maxsize, "policy": policy}
+    _registry.add(wrapper)
+    return wrapper
+
+def clear_all():
+    for f in list(_registry):
+        f.cache_clear()
+
+@contextlib.contextmanager
+def scope():
+    # Everything memoised during the block is dropped when it ends (even if it raised)
+    try:
+        yield
+    finally:
+        clear_all()
+
+def stats():
+    # {module.function: cache_info() as a dict} for every memoised function still alive
+    return {f"{f.__module__}.{f.__qualname__}": f.cache_info()._asdict() for f in list(_registry)}
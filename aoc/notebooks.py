@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+"""
+Run the 2024+ notebooks headlessly, with timings for every cell.
+
+Each YYYY/dN/dN.ipynb has a cell like `filename = "sample.txt"`, which we swap for the input we want.
+Cells run in order in one namespace (like a fresh kernel), and the result of a cell is the value of its
+last expression, same as Jupyter's Out[n]. Notebooks run in parallel, one fresh process each.
+
+Run like:
+python -m aoc.notebooks 2024 --input-name input.txt
+"""
+
+import argparse
+import ast
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import REPO_ROOT, memo
+from aoc.runner import timed
+
+DEFAULT_YEARS = (2024, 2025)
+FILENAME_PATTERN = re.compile(r"^filename = .*$", re.MULTILINE)
+# IPython-only lines (magics and shell escapes) can't run as plain Python
+MAGIC_PATTERN = re.compile(r"^\s*[%!].*$", re.MULTILINE)
+
+
+def discover(years=DEFAULT_YEARS, days=None):
+    # Find YYYY/dN/dN.ipynb, sorted by (year, day)
+    found = []
+    for year in years:
+        for path in (REPO_ROOT / str(year)).glob("d*/d*.ipynb"):
+            m = re.fullmatch(r"d(\d+)", path.stem)
+            if m is None or path.parent.name != path.stem:
+                continue
+            day = int(m.group(1))
+            if days is None or day in days:
+                found.append((int(year), day, path))
+    return sorted(found)
+
+def code_cells(path, input_path=None):
+    # The source of each code cell, with the input filename swapped in if given
+    with open(path, encoding="utf-8") as f:
+        notebook = json.load(f)
+    cells = []
+    for cell in notebook["cells"]:
+        if cell["cell_type"] != "code":
+            continue
+        source = "".join(cell["source"])
+        source = MAGIC_PATTERN.sub("", source)
+        if input_path is not None:
+            source = FILENAME_PATTERN.sub(lambda _: f"filename = {str(input_path)!r}", source)
+        cells.append(source)
+    return cells
+
+def compile_cell(source, name):
+    # Split off a trailing expression, so we can get its value like Jupyter does
+    tree = ast.parse(source, name)
+    last = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        last = ast.Expression(tree.body.pop().value)
+    body = compile(tree, name, "exec")
+    return (body, compile(last, name, "eval") if last is not None else None)
+
+def run_cell(body, last, namespace):
+    exec(body, namespace)
+    if last is not None:
+        return eval(last, namespace)
+    return None
+
+def run_notebook(year, day, path, input_path):
+    # Runs in a worker process. Never raises, errors end up in the result instead.
+    result = {"year": year, "day": day, "status": "ok", "cells": []}
+    # Notebooks open their input (and sometimes other files) relative to their own folder
+    os.chdir(path.parent)
+    namespace = {"__name__": "__main__"}
+    try:
+        for (i, source) in enumerate(code_cells(path, input_path)):
+            (body, last) = compile_cell(source, f"{path.name}[{i}]")
+            (value, elapsed, output) = timed(run_cell, body, last, namespace)
+            result["cells"].append({"cell": i, "time": elapsed, "result": None if value is None else repr(value), "output": output})
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"cell {len(result['cells'])}: {type(e).__name__}: {e}"
+    # Hits, misses and sizes of the notebook's aoc.memo caches, before they go with the namespace
+    result["caches"] = memo.stats()
+    result["total"] = sum(c["time"] for c in result["cells"])
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+def run_all(notebooks, input_name="input.txt", jobs=None):
+    # Yields results as notebooks finish (so not in order)
+    todo = []
+    for (year, day, path) in notebooks:
+        input_path = path.with_name(input_name)
+        if input_path.exists():
+            todo.append((year, day, path, input_path))
+        else:
+            yield {"year": year, "day": day, "status": "no input", "cells": []}
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = [pool.submit(run_notebook, *t) for t in todo]
+        for future in as_completed(futures):
+            yield future.result()
+
+def print_table(results, fmt="table", file=sys.stdout):
+    results = sorted(results, key=lambda r: (r["year"], r["day"]))
+    if fmt == "json":
+        json.dump(results, file, indent=2)
+        print(file=file)
+        return
+    columns = ["year", "day", "status", "cells", "total", "slowest_cell", "slowest", "peak_rss_kb"]
+    rows = []
+    for r in results:
+        slowest = max(r["cells"], key=lambda c: c["time"], default=None)
+        rows.append([
+            str(r["year"]), str(r["day"]), r["status"], str(len(r["cells"])),
+            f"{r['total']:.4f}" if "total" in r else "",
+            str(slowest["cell"]) if slowest else "",
+            f"{slowest['time']:.4f}" if slowest else "",
+            str(r.get("peak_rss_kb", "")),
+        ])
+    widths = [max(len(c), *(len(row[i]) for row in rows)) if rows else len(c) for (i, c) in enumerate(columns)]
+    print("  ".join(c.rjust(w) for (c, w) in zip(columns, widths)), file=file)
+    for row in rows:
+        print("  ".join(c.rjust(w) for (c, w) in zip(row, widths)), file=file)
+    for r in results:
+        if r["status"] == "error":
+            print(f"{r['year']} day {r['day']}: {r['error']}", file=file)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run and time every cell of the notebooks")
+    parser.add_argument("years", nargs="*", type=int, default=DEFAULT_YEARS)
+    parser.add_argument("-d", "--days", nargs="+", type=int, help="Only run these days")
+    parser.add_argument("-i", "--input-name", default="input.txt", help="Input filename in each day's folder")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("-f", "--format", choices=["table", "json"], default="table")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = list(run_all(discover(args.years, args.days), args.input_name, args.jobs))
+    print_table(results, args.format)
+    print(f"Wall time: {time.perf_counter() - start:.4f}s", file=sys.stderr)
+    return 1 if any(r["status"] == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Points on an unbounded plane, packed into one int.
+
+aoc.grid's flat indices (y * width + x) need to know the width up front and can't go negative. For maps
+that grow as you go (a trench being dug, robots that wander off) a point is instead (y << 32) + x: a plain
+int like the grid's, so hashing and set lookups are as cheap, but x and y can be anything up to +-2^31.
+Packing is linear, so moving is still adding (pos += EAST * steps) with no carries to worry about, and
+unlike complex numbers nothing goes through floats, so there's no rounding once things get past 2^53.
+
+In CPython the win over complex isn't hashing (floats hash quickly too) but doing the arithmetic on plain ints,
+so hot loops should do it inline rather than calling unpack() every time: when x is never negative (most maps),
+(y, x) = divmod(p, STRIDE) unpacks and y * STRIDE + x packs. Otherwise unpack once, outside the loop.
+
+Directions are indexed like aoc.grid (NORTH, EAST, SOUTH, WEST = 0-3, with y going down the page), so
+turning is (direction + 1) % 4 and the same index works for a Grid's offsets and DIRECTIONS here.
+
+Use like:
+pos = pack(0, 0)
+pos += DIRECTIONS[EAST] * 10
+(x, y) = unpack(pos)
+"""
+
+from aoc.grid import EAST, NORTH, SOUTH, WEST  # So the direction names can come from here too
+
+SHIFT = 32
+STRIDE = 1 << SHIFT
+HALF = 1 << (SHIFT - 1)
+
+
+def pack(x: int, y: int) -> int:
+    return (y << SHIFT) + x
+
+def unpack(p: int) -> tuple[int, int]:
+    # A negative x borrows one from y, so round y to the nearest rather than flooring it
+    y = (p + HALF) >> SHIFT
+    return (p - (y << SHIFT), y)
+
+def x_of(p: int) -> int:
+    return p - (((p + HALF) >> SHIFT) << SHIFT)
+
+def y_of(p: int) -> int:
+    return (p + HALF) >> SHIFT
+
+
+# Steps indexed by direction (N, E, S, W), and clockwise from N including the diagonals
+DIRECTIONS = (pack(0, -1), pack(1, 0), pack(0, 1), pack(-1, 0))
+DIRECTIONS8 = (pack(0, -1), pack(1, -1), pack(1, 0), pack(1, 1), pack(0, 1), pack(-1, 1), pack(-1, 0), pack(-1, -1))
+
+
+def neighbours(p: int) -> list[int]:
+    return [p + d for d in DIRECTIONS]
+
+def neighbours8(p: int) -> list[int]:
+    return [p + d for d in DIRECTIONS8]
+
+def turn_right(direction: int, turns: int = 1) -> int:
+    return (direction + turns) % 4
+
+def turn_left(direction: int, turns: int = 1) -> int:
+    return (direction - turns) % 4
+
+def rotate(p: int, turns: int = 1) -> int:
+    # Quarter turns clockwise about the origin (clockwise on the page, since y goes down)
+    (x, y) = unpack(p)
+    for _ in range(turns % 4):
+        (x, y) = (-y, x)
+    return pack(x, y)
+
+def manhattan(p: int, q: int) -> int:
+    (dx, dy) = unpack(p - q)
+    return abs(dx) + abs(dy)
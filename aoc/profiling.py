@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+"""
+cProfile and tracemalloc for one step (parse, part1, part2) of a day, and diffs between two profiles.
+
+The runner's --profile DIR wraps every step with profiled(). For each one, that writes two files:
+  YYYY_dN_part1.pstats, the cProfile stats (open with pstats, snakeviz etc.)
+  YYYY_dN_part1_alloc.txt, the peak traced memory and the top allocation sites still live at the end
+(so e.g. whatever parse returns, or a @cache that filled up).
+Both profilers slow things down a lot (tracemalloc especially), so don't trust the times from a profiled run.
+
+To see what a change did, profile before and after, then diff:
+python -m aoc.runner 2023 -d 17 --profile before
+(make the change)
+python -m aoc.runner 2023 -d 17 --profile after
+python -m aoc.profiling before/2023_d17_part1.pstats after/2023_d17_part1.pstats
+"""
+
+import argparse
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import tracemalloc
+
+
+def profiled(f, stem, top=10, report=None):
+    # f, but profiled into stem.pstats and stem_alloc.txt each call. The summary also goes in report (if given).
+    @functools.wraps(f)
+    def wrapper(*args):
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        try:
+            result = profiler.runcall(f, *args)
+            snapshot = tracemalloc.take_snapshot()
+            (_, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        profiler.dump_stats(f"{stem}.pstats")
+
+        # Leave out the profilers' own bookkeeping
+        snapshot = snapshot.filter_traces([tracemalloc.Filter(False, f) for f in (tracemalloc.__file__, cProfile.__file__, __file__)])
+        sites = [{"line": f"{s.traceback[0].filename}:{s.traceback[0].lineno}", "kb": s.size / 1024, "blocks": s.count}
+                 for s in snapshot.statistics("lineno")[:top]]
+        with open(f"{stem}_alloc.txt", "w", encoding="utf-8") as out:
+            print(f"Peak traced memory: {peak / 1024:.1f} KiB", file=out)
+            print(f"Top {len(sites)} allocation sites still live at the end:", file=out)
+            for site in sites:
+                print(f"{site['kb']:10.1f} KiB  {site['blocks']:8} blocks  {site['line']}", file=out)
+        if report is not None:
+            report.update(pstats=f"{stem}.pstats", peak_kb=peak / 1024, allocations=sites)
+        return result
+    return wrapper
+
+def function_times(path):
+    # {(file, function): (calls, own time, cumulative time)} from a .pstats file.
+    # Keyed without the line number, so functions still match up after the lines above them change.
+    out = {}
+    for ((filename, _, name), (_, calls, tottime, cumtime, _)) in pstats.Stats(path).stats.items():
+        key = (os.path.basename(filename), name)
+        (c, t, cum) = out.get(key, (0, 0, 0))
+        out[key] = (c + calls, t + tottime, cum + cumtime)
+    return out
+
+def diff(before_path, after_path, top=20, sort="tottime"):
+    # The functions whose time changed the most, biggest change first.
+    # Each row is (file, function, calls before, calls after, seconds before, seconds after).
+    column = 1 if sort == "tottime" else 2
+    (before, after) = (function_times(before_path), function_times(after_path))
+    rows = []
+    for key in before.keys() | after.keys():
+        (b, a) = (before.get(key, (0, 0, 0)), after.get(key, (0, 0, 0)))
+        rows.append((*key, b[0], a[0], b[column], a[column]))
+    rows.sort(key=lambda r: abs(r[5] - r[4]), reverse=True)
+    return rows[:top]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two .pstats profiles, by function")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("-n", "--top", type=int, default=20, help="How many functions to show")
+    parser.add_argument("-s", "--sort", choices=["tottime", "cumtime"], default="tottime", help="Compare own time, or time including callees")
+    args = parser.parse_args(argv)
+
+    rows = diff(args.before, args.after, args.top, args.sort)
+    (before, after) = (pstats.Stats(args.before).total_tt, pstats.Stats(args.after).total_tt)
+    print(f"Total time: {before:.4f}s -> {after:.4f}s")
+    print(f"{'before':>10}  {'after':>10}  {'change':>10}  {'calls':>17}  function")
+    for (filename, name, calls_before, calls_after, t_before, t_after) in rows:
+        print(f"{t_before:10.4f}  {t_after:10.4f}  {t_after - t_before:+10.4f}  {calls_before:>8}>{calls_after:<8}  {filename}:{name}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
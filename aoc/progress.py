@@ -0,0 +1,42 @@
+"""
+A stand-in for tqdm that only imports tqdm when there's someone to watch the progress bar.
+
+Importing tqdm takes ~60ms, which is more than some whole days take to run. So `from aoc.progress import tqdm`
+gives the real tqdm (imported on first use) when stderr is a terminal or we're in Jupyter, and otherwise
+(e.g. under the runner, or with output piped to a file) hands back the iterable as it is. It also falls back to
+no bar if tqdm isn't installed.
+"""
+
+import sys
+
+
+class NoBar:
+    # Enough of tqdm's interface for `with tqdm(total=n) as bar: bar.update()`
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def update(self, n=1):
+        pass
+
+    def set_description(self, desc=None, refresh=True):
+        pass
+
+    def close(self):
+        pass
+
+
+def watched():
+    return "ipykernel" in sys.modules or sys.stderr.isatty()
+
+def tqdm(iterable=None, *args, **kwargs):
+    if watched():
+        try:
+            from tqdm import tqdm
+        except ImportError:
+            pass
+        else:
+            return tqdm(iterable, *args, **kwargs)
+    return iterable if iterable is not None else NoBar()
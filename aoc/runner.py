@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+"""
+Run every day of one or more years, with timings.
+
+Each YYYY/dN/dN.py exposes `parse(data)`, which returns a tuple of args for the parts,
+plus `part1`/`part2` (or a `PARTS` dict of {part number: function} when the parts need extra args).
+data is the input's text, or an aoc.loader.Input (the file mapped into memory) if the day sets PARSE_MAPPED = True.
+Days run in parallel (one fresh process per day, so peak RSS is per day), and we print a table
+of parse/part1/part2 times in whichever format was asked for.
+With --instrument, the counters/timers/gauges the days report (see aoc.instrument) are saved as JSON too,
+and --profile DIR saves cProfile stats and allocation reports for every part (see aoc.profiling).
+
+Run like:
+python -m aoc.runner 2022 2023 --format json
+python -m aoc.runner 2022 -d 16 --instrument profile.json
+python -m aoc.runner 2023 -d 17 --profile profiles
+"""
+
+import argparse
+import contextlib
+import copy
+import csv
+import importlib.util
+import io
+import json
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import REPO_ROOT, instrument, memo, profiling
+from aoc.cache import cached_parse
+from aoc.loader import Input
+
+DEFAULT_YEARS = (2021, 2022, 2023)
+COLUMNS = ["year", "day", "status", "parse", "part1", "part2", "peak_rss_kb"]
+
+
+def discover(years=DEFAULT_YEARS, days=None):
+    # Find YYYY/dN/dN.py, sorted by (year, day)
+    found = []
+    for year in years:
+        for path in (REPO_ROOT / str(year)).glob("d*/d*.py"):
+            m = re.fullmatch(r"d(\d+)", path.stem)
+            if m is None or path.parent.name != path.stem:
+                continue
+            day = int(m.group(1))
+            if days is None or day in days:
+                found.append((int(year), day, path))
+    return sorted(found)
+
+def load_module(path):
+    # The day folders aren't packages (or even valid identifiers), so load by path
+    name = f"aoc_{path.parent.parent.name}_{path.stem}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so pickle can find the module's classes again
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def get_parts(module):
+    parts = getattr(module, "PARTS", None)
+    if parts is None:
+        parts = {n: getattr(module, f"part{n}") for n in (1, 2) if hasattr(module, f"part{n}")}
+    return parts
+
+def read_input(module, input_path):
+    # What the day's parse() takes
+    if getattr(module, "PARSE_MAPPED", False):
+        return Input.open(input_path)
+    with open(input_path, encoding="utf-8") as f:
+        return f.read()
+
+def timed(f, *args):
+    # Returns (result, seconds, captured stdout). tqdm bars go to stderr, so swallow that too.
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(io.StringIO()):
+        start = time.perf_counter()
+        result = f(*args)
+        elapsed = time.perf_counter() - start
+    return (result, elapsed, out.getvalue())
+
+def instrumented(profile, name, caches, f, *args):
+    # timed(), saving whatever f reported to aoc.instrument under profile[name]
+    instrument.reset()
+    before = instrument.cache_stats(caches)
+    out = timed(f, *args)
+    profile[name] = instrument.snapshot(before, instrument.cache_stats(caches))
+    return out
+
+def run_day(year, day, path, input_path, use_cache=False, instrumenting=False, profile_dir=None, profile_top=10):
+    # Runs in a worker process. Never raises, errors end up in the result instead.
+    result = {"year": year, "day": day, "status": "ok", "output": {}}
+    if instrumenting:
+        # Before loading, in case the module checks instrument.ENABLED at import
+        instrument.enable()
+        result["instrument"] = {}
+    if profile_dir is not None:
+        result["profile"] = {}
+    try:
+        module = load_module(path)
+        data = read_input(module, input_path)
+        caches = instrument.cached_functions(module) if instrumenting else None
+
+        def run(name, f, *args):
+            if profile_dir is not None:
+                report = result["profile"][name] = {}
+                f = profiling.profiled(f, os.path.join(profile_dir, f"{year}_d{day}_{name}"), profile_top, report)
+            if instrumenting:
+                return instrumented(result["instrument"], name, caches, f, *args)
+            return timed(f, *args)
+
+        # Memoised results are shared between the parts, but not kept after them (see aoc.memo)
+        with memo.scope():
+            if use_cache:
+                (args, result["parse"], result["output"]["parse"]) = run("parse", cached_parse, module, data)
+            else:
+                (args, result["parse"], result["output"]["parse"]) = run("parse", module.parse, data)
+            for (n, part) in get_parts(module).items():
+                # Some parts mutate their input, so each gets its own copy
+                part_args = copy.deepcopy(args)
+                (answer, result[f"part{n}"], result["output"][f"part{n}"]) = run(f"part{n}", part, *part_args)
+                if answer is not None:
+                    result.setdefault("answers", {})[f"part{n}"] = answer
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+    # ru_maxrss is in KiB on Linux
+    result["peak_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+def run_all(days, input_name="input.txt", jobs=None, use_cache=False, instrumenting=False, profile_dir=None, profile_top=10):
+    # Yields results as days finish (so not in order)
+    todo = []
+    for (year, day, path) in days:
+        input_path = path.with_name(input_name)
+        if input_path.exists():
+            todo.append((year, day, path, input_path))
+        else:
+            yield {"year": year, "day": day, "status": "no input"}
+
+    # A fresh process per day keeps the peak RSS per day, and stops module globals leaking between days
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, max_tasks_per_child=1) as pool:
+        futures = [pool.submit(run_day, *t, use_cache, instrumenting, profile_dir, profile_top) for t in todo]
+        for future in as_completed(futures):
+            yield future.result()
+
+def format_seconds(s):
+    return "" if s is None else f"{s:.4f}"
+
+def print_table(results, fmt="table", file=sys.stdout):
+    results = sorted(results, key=lambda r: (r["year"], r["day"]))
+    if fmt == "json":
+        json.dump(results, file, indent=2, default=repr)
+        print(file=file)
+    elif fmt == "csv":
+        writer = csv.DictWriter(file, COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        rows = [[str(r["year"]), str(r["day"]), r["status"], *(format_seconds(r.get(c)) for c in ("parse", "part1", "part2")), str(r.get("peak_rss_kb", ""))] for r in results]
+        widths = [max(len(c), *(len(row[i]) for row in rows)) if rows else len(c) for (i, c) in enumerate(COLUMNS)]
+        print("  ".join(c.rjust(w) for (c, w) in zip(COLUMNS, widths)), file=file)
+        for row in rows:
+            print("  ".join(c.rjust(w) for (c, w) in zip(row, widths)), file=file)
+        total = sum(r.get(c) or 0 for r in results for c in ("parse", "part1", "part2"))
+        print(f"Total solve time across days: {total:.4f}s", file=file)
+        for r in results:
+            if r["status"] == "error":
+                print(f"{r['year']} day {r['day']}: {r['error']}", file=file)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run and time every day's solution")
+    parser.add_argument("years", nargs="*", type=int, default=DEFAULT_YEARS)
+    parser.add_argument("-d", "--days", nargs="+", type=int, help="Only run these days")
+    parser.add_argument("-i", "--input-name", default="input.txt", help="Input filename in each day's folder")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("-f", "--format", choices=["table", "json", "csv"], default="table")
+    parser.add_argument("--cache", action="store_true", help="Load parsed inputs from the cache (see aoc.cache)")
+    parser.add_argument("--instrument", metavar="PATH", help="Save each part's counters, timers, gauges and cache stats here as JSON")
+    parser.add_argument("--profile", metavar="DIR", help="Save cProfile stats and allocation reports for each part in this folder (slow)")
+    parser.add_argument("--profile-top", type=int, default=10, help="How many allocation sites to report per part")
+    args = parser.parse_args(argv)
+
+    if args.profile is not None:
+        os.makedirs(args.profile, exist_ok=True)
+    start = time.perf_counter()
+    results = list(run_all(discover(args.years, args.days), args.input_name, args.jobs, args.cache, args.instrument is not None, args.profile, args.profile_top))
+    print_table(results, args.format)
+    if args.instrument is not None:
+        profiles = {f"{r['year']}/{r['day']}": r["instrument"] for r in sorted(results, key=lambda r: (r["year"], r["day"])) if "instrument" in r}
+        with open(args.instrument, "w", encoding="utf-8") as f:
+            json.dump(profiles, f, indent=2)
+            f.write("\n")
+    if args.profile is not None:
+        print(f"Profiles saved in {args.profile}, compare two with python -m aoc.profiling BEFORE AFTER", file=sys.stderr)
+    print(f"Wall time: {time.perf_counter() - start:.4f}s", file=sys.stderr)
+    return 1 if any(r["status"] == "error" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Shortest paths with a heapq: Dijkstra, or A* if you give it a heuristic.
+
+States are ints (e.g. a grid index, or index * 4 + direction, or t * area + index), so they're cheap to hash,
+and heap entries are plain (priority, cost, state) tuples that compare without any dataclass machinery.
+Unlike queue.PriorityQueue there's no lock on every put/get.
+
+Stale heap entries (a state that was pushed again with a lower cost before being popped) are skipped when
+popped, rather than removed from the heap. The heuristic has to be consistent (never drop by more than the
+cost of a step) for A* to give the right answer this way.
+
+With aoc.instrument enabled, each run() also reports its pushes/pops/stale entries and the heap's
+high-water mark.
+
+Use like:
+finder = ShortestPath(neighbours, heuristic, paths=True)
+goal = finder.run([start], lambda state: state == end)
+finder.dist[goal], finder.path(goal)
+"""
+
+import heapq
+
+from aoc import instrument
+
+
+class ShortestPath:
+    def __init__(self, neighbours, heuristic=None, paths=False, all_paths=False):
+        # neighbours(state) gives (cost, next state) pairs, heuristic(state) estimates the cost left.
+        # paths keeps a parent pointer per state (for path()), all_paths keeps every equally-good parent
+        # (for on_best_paths()).
+        self.neighbours = neighbours
+        self.heuristic = heuristic
+        self.paths = paths or all_paths
+        self.all_paths = all_paths
+        self.dist = {}  # Best cost found so far for each state
+        self.parent = {}
+        # Counters, to see how much work a search did
+        self.pushes = 0
+        self.pops = 0
+        self.stale = 0
+
+    def run(self, starts, goal=None):
+        # Search from all the starts (at cost 0) until goal(state) is true for a popped state, and return it.
+        # Without a goal, search everything reachable and return None.
+        (dist, parent, neighbours, heuristic) = (self.dist, self.parent, self.neighbours, self.heuristic)
+        heap = []
+        for s in starts:
+            dist[s] = 0
+            if self.paths:
+                parent[s] = [] if self.all_paths else None
+            heap.append((heuristic(s) if heuristic else 0, 0, s))
+        counts = (self.pushes, self.pops, self.stale)
+        heapq.heapify(heap)
+        self.pushes += len(heap)
+        # Only look at the heap size when someone's going to see it
+        tracking = instrument.ENABLED
+        peak = 0
+
+        while heap:
+            if tracking and len(heap) > peak:
+                peak = len(heap)
+            (_, d, s) = heapq.heappop(heap)
+            self.pops += 1
+            if d > dist[s]:
+                # Already found a better way here
+                self.stale += 1
+                continue
+            if goal is not None and goal(s):
+                self._report(counts, peak)
+                return s
+            for (cost, n) in neighbours(s):
+                nd = d + cost
+                best = dist.get(n)
+                if best is not None and nd >= best:
+                    if self.all_paths and nd == best:
+                        parent[n].append(s)
+                    continue
+                dist[n] = nd
+                if self.all_paths:
+                    parent[n] = [s]
+                elif self.paths:
+                    parent[n] = s
+                heapq.heappush(heap, (nd + heuristic(n) if heuristic else nd, nd, n))
+                self.pushes += 1
+        self._report(counts, peak)
+        return None
+
+    def _report(self, counts, peak):
+        # The work done by one run(), for aoc.instrument
+        if instrument.ENABLED:
+            (pushes, pops, stale) = counts
+            instrument.count("search.pushes", self.pushes - pushes)
+            instrument.count("search.pops", self.pops - pops)
+            instrument.count("search.stale", self.stale - stale)
+            instrument.gauge("search.heap_peak", peak)
+
+    def path(self, state):
+        # The states from a start to state (following the first parent, if there are several)
+        out = [state]
+        while True:
+            p = self.parent[out[-1]]
+            if self.all_paths:
+                p = p[0] if p else None
+            if p is None:
+                return out[::-1]
+            out.append(p)
+
+    def on_best_paths(self, states):
+        # Every state on any shortest path to any of states (needs all_paths)
+        seen = set(states)
+        todo = list(seen)
+        while todo:
+            for p in self.parent[todo.pop()]:
+                if p not in seen:
+                    seen.add(p)
+                    todo.append(p)
+        return seen
+
+    def stats(self):
+        return {"pushes": self.pushes, "pops": self.pops, "stale": self.stale, "states": len(self.dist)}
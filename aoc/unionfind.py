@@ -0,0 +1,73 @@
+"""
+Union-find (a disjoint set forest) over the integers 0..n-1, for "which things are connected" puzzles.
+
+Elements are ints (a Grid index, or the position of a point in a list), so everything's kept in plain lists
+indexed by element: each one's parent, and each root's component size. find() halves the path as it goes
+(every other node skips to its grandparent) and union() hangs the smaller tree under the bigger one, so a run of
+n operations is as good as linear. components counts how many separate groups there are, so "is everything
+connected yet?" is components == 1 instead of a search.
+
+Use like:
+uf = UnionFind(len(points))
+for (_, i, j) in sorted(edges):
+    uf.union(i, j)
+    if uf.components == 1:
+        break
+"""
+
+
+class UnionFind:
+    def __init__(self, n: int) -> None:
+        self.parent = list(range(n))
+        # Only right for roots. A merged-away root's size is left as it was.
+        self.component_size = [1] * n
+        self.components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def add(self) -> int:
+        # A new element on its own, returning its number
+        self.parent.append(len(self.parent))
+        self.component_size.append(1)
+        self.components += 1
+        return len(self.parent) - 1
+
+    def find(self, x: int) -> int:
+        # The root of x's component, halving the path to it on the way
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        # Join a's and b's components. False if they were already the same one.
+        (a, b) = (self.find(a), self.find(b))
+        if a == b:
+            return False
+        sizes = self.component_size
+        if sizes[a] < sizes[b]:
+            (a, b) = (b, a)
+        self.parent[b] = a
+        sizes[a] += sizes[b]
+        self.components -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def size(self, x: int) -> int:
+        # How many elements are in x's component
+        return self.component_size[self.find(x)]
+
+    def sizes(self) -> list[int]:
+        # The size of every component (singletons included)
+        return [self.component_size[x] for (x, p) in enumerate(self.parent) if x == p]
+
+    def groups(self) -> dict[int, list[int]]:
+        # {root: every element in its component, in order}
+        found = {}
+        for x in range(len(self.parent)):
+            found.setdefault(self.find(x), []).append(x)
+        return found
@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))  # For the shared aoc package
+from aoc.intervals import IntervalSet
+
+
+def test_covers():
+    fresh = IntervalSet([(3, 5), (10, 14), (16, 20), (12, 18)])
+    assert fresh.covers(3, 5)
+    assert fresh.covers(11, 20)
+    assert not fresh.covers(4, 10)
+    assert not fresh.covers(0, 3)
+
+def test_covers_empty_range():
+    # An empty range (hi < lo) is covered by any set, even an empty one, wherever it is
+    fresh = IntervalSet([(3, 5), (10, 20)])
+    assert fresh.covers(8, 7)
+    assert fresh.covers(100, 0)
+    assert IntervalSet().covers(1, 0)